@@ -0,0 +1,52 @@
+"""
+텍스트 정규화 비교 벤치마크 (컴파일된 clean_text vs 기존 구현)
+
+    python -m benchmarks.clean_text_benchmark --html-dir benchmarks/corpus --scale 20
+
+HTML 코퍼스에서 추출한 태그 텍스트(정규화 전)를 `--scale`만큼 반복해 측정하며, 두 구현의 결과가 같은지도 확인합니다.
+"""
+import os
+import glob
+import argparse
+
+from benchmarks.harness import measure, find_mismatches, report_comparison
+from benchmarks.legacy import clean_text_legacy
+from lib.scrapper.text_extractor import parse_html, extract_text_blocks
+from utils.cleaner import clean_text
+
+# 이스케이프 문자가 포함된 텍스트 (JSON 문자열에서 가져온 설명 등)
+ESCAPED_TEXTS = [
+    '소형견 전용 호텔입니다.\\n주말 요금은 \\"별도\\" 문의 바랍니다.',
+    '경로 C:\\\\temp\\\\file 와 \\t 탭 문자',
+    '\xa0\xa0오픈\xa0 시간\t09:00 ~ 21:00\n\n',
+]
+
+
+def load_tag_texts(html_dir: str) -> list:
+    texts = []
+    for path in sorted(glob.glob(os.path.join(html_dir, "**", "*.html"), recursive=True)):
+        with open(path, 'rb') as f:
+            texts += extract_text_blocks(parse_html(f.read()))
+    return texts + ESCAPED_TEXTS
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 정규화 비교 벤치마크")
+    parser.add_argument('--html-dir', default=os.getenv("SCRAPER_CORPUS_DIR", "benchmarks/corpus"))
+    parser.add_argument('--scale', type=int, default=10, help='코퍼스 반복 횟수')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    texts = load_tag_texts(args.html_dir) * args.scale
+    mismatches = find_mismatches(clean_text, clean_text_legacy, texts, label=lambda text: text[:50])
+
+    results = [
+        measure('clean_text', clean_text, texts, args.repeat),
+        measure('clean_text.nfkc_zero_width', lambda text: clean_text(text, nfkc=True, zero_width=True), texts, args.repeat),
+        measure('clean_text.legacy', clean_text_legacy, texts, args.repeat),
+    ]
+    report_comparison(results, mismatches, f"텍스트 {len(texts)}개", args.output)
+
+
+if __name__ == "__main__":
+    main()
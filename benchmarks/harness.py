@@ -0,0 +1,95 @@
+import json
+import time
+import tracemalloc
+
+from typing import Callable, Iterable, List
+
+
+def measure(name: str, fn: Callable, items: Iterable, repeat: int = 3, units: int = None) -> dict:
+    """
+    `fn`을 각 item에 대해 실행하고 초당 처리량과 최대 메모리 사용량을 측정합니다.
+
+    Args:
+        name: 컴포넌트 이름
+        fn: 측정할 함수 (item 하나를 인자로 받음)
+        items: 입력 리스트
+        repeat: 반복 횟수 (가장 빠른 결과 사용)
+        units: 처리량 계산 단위 수 (기본값: items 개수)
+
+    Returns:
+        `name`, `ops_per_sec`, `best_seconds`, `peak_memory_kb`
+    """
+    items = list(items)
+    units = units if units is not None else len(items)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+
+    # 메모리 측정은 tracemalloc 오버헤드가 있으므로 별도로 1회 실행
+    tracemalloc.start()
+    for item in items:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": name,
+        "units": units,
+        "ops_per_sec": units / best if best > 0 else None,
+        "best_seconds": best,
+        "peak_memory_kb": peak / 1024,
+    }
+
+def compare(results: List[dict], baseline_path: str, tolerance: float) -> List[str]:
+    """기준 결과 대비 처리량이 tolerance 비율 이상 떨어진 컴포넌트 목록 반환"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {result['name']: result for result in json.load(f)}
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result['name'])
+        if not base or not base.get('ops_per_sec') or not result.get('ops_per_sec'):
+            continue
+
+        ratio = result['ops_per_sec'] / base['ops_per_sec']
+        if ratio < 1 - tolerance:
+            regressions.append(f"{result['name']}: {base['ops_per_sec']:.1f} -> {result['ops_per_sec']:.1f} ops/sec ({ratio:.0%})")
+
+    return regressions
+
+def print_results(results: List[dict]):
+    print(f"{'component':<32} {'ops/sec':>12} {'seconds':>10} {'peak KB':>12}")
+    for result in results:
+        ops = f"{result['ops_per_sec']:.1f}" if result['ops_per_sec'] else '-'
+        print(f"{result['name']:<32} {ops:>12} {result['best_seconds']:>10.4f} {result['peak_memory_kb']:>12.1f}")
+
+def save_results(results: List[dict], path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=4)
+
+def find_mismatches(fn: Callable, reference: Callable, items: Iterable, label: Callable = None) -> list:
+    """`fn`과 기준 구현 `reference`의 결과가 다른 item 목록 반환 (label: 출력용 변환 함수)"""
+    label = label or (lambda item: item)
+    return [label(item) for item in items if fn(item) != reference(item)]
+
+def report_comparison(results: List[dict], mismatches: list, summary: str, output: str = None):
+    """
+    새 구현과 기존 구현의 측정 결과를 출력/저장하고, 결과가 다르면 종료 코드 1로 종료합니다.
+
+    results의 첫 항목을 새 구현, 마지막 항목을 기존 구현으로 보고 속도 향상 배수를 계산합니다.
+    """
+    print_results(results)
+    print(f"{summary}, 속도 향상: {results[-1]['best_seconds'] / results[0]['best_seconds']:.1f}배")
+
+    if mismatches:
+        print(f"결과 불일치 {len(mismatches)}개: {mismatches[:5]}")
+
+    if output:
+        save_results(results, output)
+
+    if mismatches:
+        raise SystemExit(1)
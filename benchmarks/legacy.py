@@ -0,0 +1,161 @@
+"""
+벤치마크 비교용 기존 구현
+
+운영 코드에서 교체된 이전 구현을 보관하며, 벤치마크에서 속도와 결과 일치 여부를 비교하는 데만 사용합니다.
+"""
+import re
+import bs4
+
+from urllib.parse import urlparse
+
+from lib.scrapper.text_extractor import to_sentences
+from utils.cleaner import clean_html
+
+
+# BeautifulSoup 기반 텍스트 추출 (lib.scrapper.scrape_page_content._parse_text_content 이전 구현)
+def parse_text_content_bs4(page_source) -> list[str]:
+    """웹 페이지의 텍스트 콘텐츠 추출 후, 문장 리스트로 반환"""
+    # HTML 파싱
+    soup = bs4.BeautifulSoup(page_source.content, 'lxml')
+
+    # 불필요한 태그 제거
+    cleaned_soup = clean_html(soup)
+
+    # 유효한 텍스트를 가지고 있는 태그들만 추출
+    text_tags = extract_text_from_soup(cleaned_soup)
+    
+    return to_sentences([tag.get_text(strip=True) for tag in text_tags])
+
+def extract_text_from_soup(soup: bs4.BeautifulSoup) -> list[bs4.Tag]:
+    """BeautifulSoup에서 유효한 텍스트를 가진 태그들을 반환합니다."""
+    valid_tags = []
+
+    primary_tags = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']
+    semantic_tags = ['article', 'section', 'aside']
+    secondary_tags = ['a', 'span', 'strong', 'em', 'b', 'i', 'td', 'th']
+    
+    # 주요 태그 파싱
+    for tag_name in primary_tags:
+        for tag in soup.find_all(tag_name, recursive=True):
+            valid_tags.append(tag)
+    
+    # 의미 태그 파싱 (직접적인 텍스트가 있는 경우만)
+    for tag_name in semantic_tags:
+        for tag in soup.find_all(tag_name, recursive=True):
+            if not tag.find_all(primary_tags, recursive=False):
+                if has_direct_text(tag):
+                    valid_tags.append(tag)
+    
+    # div 태그 파싱 (직접적인 텍스트가 있는 경우만)
+    for div_tag in soup.find_all('div', recursive=True):
+        if not div_tag.find_all(primary_tags + secondary_tags, recursive=False):
+            if has_direct_text(div_tag):
+                valid_tags.append(div_tag)
+
+    # a, span 등 부가 태그 처리
+    for tag_name in secondary_tags:
+        for tag in soup.find_all(tag_name, recursive=True):
+            parent_chain = []
+            current = tag.parent
+            
+            # 부모 태그 체인을 구성
+            while current and len(parent_chain) < 5:
+                parent_chain.append(current.name)
+                current = current.parent
+            
+            # primary_tags 중 하나가 부모 체인에 있는지 확인
+            has_primary_parent = any(p_tag in parent_chain for p_tag in primary_tags)
+            
+            if not has_primary_parent and tag.get_text(strip=True):
+                valid_tags.append(tag)
+
+    return valid_tags
+
+def has_direct_text(tag: bs4.Tag) -> bool:
+    """태그가 직접적인 텍스트 노드를 가지고 있는지 확인합니다."""
+    for child in tag.children:
+        if isinstance(child, bs4.NavigableString) and child.strip():
+            return True
+    return False
+
+# 하드코딩 패턴 기반 URL 필터 (utils.url_filter.UrlFilter.is_valid_url 이전 구현)
+def is_valid_url_legacy(url: str, base_domain: str):
+    excluded_url_patterns = ["blog", "profile", "board", "shop", "product", "kakao", "naver", "store", "login", "logout", "signin",
+                             "facebook", "instagram", "facebook", "youtube", "linktr", "policy", "privacy"]
+    parsed_url = urlparse(url)
+
+    # 링크가 목표 도메인과 다른 경우 스킵
+    if not parsed_url.netloc or parsed_url.netloc != base_domain:
+        return False
+
+    # 링크가 자바스크립트, 메일, 앵커 링크인 경우 스킵
+    if url.startswith(('javascript:', 'mailto:', '#')):
+        return False
+
+    # path에 숫자만 있거나 한글이 포함된 경우 제외
+    path_list = parsed_url.path.split("/")
+    if any(re.search(r'^[0-9]+$|[가-힣]', segment) for segment in path_list if segment):
+        return False
+
+    # 링크에 제외 패턴이 포함되어 있으면 스킵
+    if any(pattern in url.lower() for pattern in excluded_url_patterns):
+        return False
+
+    return True
+
+# 구두점마다 정규식 검사를 반복하는 문장 분리 (utils.text.text_to_sentence 이전 구현)
+def text_to_sentence_legacy(text: str) -> list[str]:
+    """
+    텍스트의 구두점을 기준하여 문장으로 분리합니다. 공백+단어+구두점 패턴이 있는 경우만 분리합니다.
+
+    Example:
+        `text` - "안녕하세요. 장성남입니다."\n
+        `result` - ["안녕하세요.", "장성남입니다."]
+    """
+
+    # 공백이 없으면 문장이 아니므로 그대로 반환
+    if ' ' not in text: return [text]
+    
+    # 문장 패턴(단어+공백+단어+구두점)이 있는지 확인
+    has_sentence_pattern = bool(re.search(r'\S+\s+\S+[.!?]', text))
+    if not has_sentence_pattern: return [text]
+    
+    # 문장 분리
+    sentences = []
+    current_position = 0
+    
+    pattern = r'([.!?])(?:\s+|\Z)'
+    
+    for match in re.finditer(pattern, text):
+        end_pos = match.end(1)  # 구두점 위치
+        
+        # 구두점 전까지의 텍스트 + 구두점
+        sentence = text[current_position:end_pos].strip()
+        
+        # '가.나.다.라'와 같은 패턴 확인 (공백 없이 구두점으로만 연결된 단어인 경우)
+        if ' ' in sentence:  # 공백이 있으면 일반 문장으로 간주
+            sentences.append(sentence)
+            current_position = end_pos
+    
+    # 남은 부분 처리
+    if current_position < len(text):
+        remaining = text[current_position:].strip()
+        if remaining:
+            sentences.append(remaining)
+    
+    return sentences
+
+# 매 호출마다 정규식을 적용하는 텍스트 정규화 (utils.cleaner.clean_text 이전 구현)
+def clean_text_legacy(text: str) -> str:
+    """텍스트의 공백 및 특수 문자를 정규화합니다."""
+    if not text: return ""
+
+    text = text.replace('\\n', ' ')  # 줄바꿈 문자를 공백으로
+    text = text.replace('\\"', '"')   # 이스케이프된 따옴표
+    text = text.replace('\xa0', ' ')  # Non-breaking space를 일반 공백으로
+
+    text = re.sub(r'\\([^n"])', r'\1', text)  # 기타 이스케이프 문자 제거
+    text = re.sub(r'\s+', ' ', text)    # 여러 개의 공백을 하나의 공백으로 줄임
+
+    text = text.strip()
+    return text
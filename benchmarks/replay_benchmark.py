@@ -0,0 +1,107 @@
+"""
+녹화된 네이버/홈페이지 응답 코퍼스로 네트워크 없이 주요 컴포넌트의 성능을 측정합니다.
+
+코퍼스 녹화:
+    SCRAPER_TRANSPORT=record SCRAPER_CORPUS_DIR=benchmarks/corpus python main.py
+
+벤치마크 실행:
+    python -m benchmarks.replay_benchmark --corpus benchmarks/corpus --output bench.json
+    python -m benchmarks.replay_benchmark --baseline bench.json --tolerance 0.2   # 처리량 20% 이상 하락 시 실패
+"""
+import io
+import os
+import re
+import sys
+import json
+import tempfile
+import argparse
+
+from benchmarks.harness import measure, compare, print_results, save_results
+
+PLACE_URL_PATTERN = re.compile(r'https://m\.place\.naver\.com/place/(\d+)/home')
+
+
+def run(corpus_dir: str, repeat: int) -> list:
+    # 코퍼스 재생 모드는 lib 모듈 import 전에 설정해야 함
+    os.environ['SCRAPER_TRANSPORT'] = 'replay'
+    os.environ['SCRAPER_CORPUS_DIR'] = corpus_dir
+
+    from PIL import Image
+
+    from lib.replay import ResponseCorpus
+    from lib.scrapper.naver_place_parser import NaverPlaceParser
+    from lib.scrapper.page_source import PageSource, detect_encoding
+    from lib.scrapper.scrape_naver_places import scrape_naver_places, APOLLO_PATTERN
+    from lib.scrapper.scrape_page_content import scrape_page_content, _parse_text_content
+    from utils.image_optimizer import ImageOptimizer
+    from utils.text import remove_duplicate_texts
+
+    place_ids, apollo_states, pages, images = [], [], [], []
+    for meta, body in ResponseCorpus(corpus_dir).entries():
+        content_type = {k.lower(): v for k, v in meta['headers'].items()}.get('content-type', '')
+
+        if match := PLACE_URL_PATTERN.match(meta['url']):
+            place_ids.append(int(match.group(1)))
+            if apollo := APOLLO_PATTERN.search(body):
+                apollo_states.append(json.loads(apollo.group(1)))
+        elif content_type.startswith('image/'):
+            images.append(body)
+        elif 'html' in content_type:
+            pages.append(PageSource(url=meta['url'], content=body, encoding=detect_encoding(body, meta['headers']), headers=meta['headers']))
+
+    if not (place_ids or pages or images):
+        raise SystemExit(f"코퍼스가 비어 있습니다: {corpus_dir}")
+
+    parser = NaverPlaceParser()
+    parsed_places = [parser.parse(state) for state in apollo_states]
+    business_urls = [{place['id']: [link['url'] for link in place['links']]} for place in parsed_places]
+    sentence_lists = [_parse_text_content(page) for page in pages]
+
+    optimizer = ImageOptimizer()
+    output_dir = tempfile.mkdtemp()
+
+    def optimize_image(body: bytes):
+        with Image.open(io.BytesIO(body)) as img:
+            optimizer._save_image(optimizer._resize_image(img), os.path.join(output_dir, "bench.webp"))
+
+    results = []
+    if place_ids:
+        results.append(measure('scrape_naver_places', scrape_naver_places, [place_ids], repeat, units=len(place_ids)))
+    if apollo_states:
+        results.append(measure('NaverPlaceParser.parse', parser.parse, apollo_states, repeat))
+    if business_urls:
+        results.append(measure('scrape_page_content', scrape_page_content, [business_urls], repeat, units=len(business_urls)))
+    if pages:
+        results.append(measure('_parse_text_content', _parse_text_content, pages, repeat))
+    if sentence_lists:
+        results.append(measure('remove_duplicate_texts', remove_duplicate_texts, sentence_lists, repeat))
+    if images:
+        results.append(measure('ImageOptimizer', optimize_image, images, repeat))
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 코퍼스 기반 오프라인 벤치마크")
+    parser.add_argument('--corpus', default=os.getenv("SCRAPER_CORPUS_DIR", "benchmarks/corpus"))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 처리량 하락 비율')
+    args = parser.parse_args()
+
+    results = run(args.corpus, args.repeat)
+    print_results(results)
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"성능 저하: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
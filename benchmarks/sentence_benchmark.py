@@ -0,0 +1,73 @@
+"""
+문장 분리 비교 벤치마크 (단일 패턴 순회 text_to_sentence vs 기존 구현)
+
+    python -m benchmarks.sentence_benchmark --html-dir benchmarks/corpus --scale 20
+
+HTML 코퍼스의 텍스트 블록(정규화 후)을 `--scale`만큼 이어 붙여 대형 텍스트를 만들어 측정하며,
+두 구현의 결과가 같은지와 한국어 모드 결과가 기대와 같은지(KOREAN_CASES)도 확인합니다. 공백 없는 단어와 구두점이 반복되는 텍스트(`가.나.다. 가.나.다. ...`)도 함께 측정합니다.
+"""
+import os
+import glob
+import argparse
+
+from benchmarks.harness import measure, find_mismatches, report_comparison
+from benchmarks.legacy import text_to_sentence_legacy
+from lib.scrapper.text_extractor import parse_html, extract_text_blocks
+from utils.cleaner import clean_text
+from utils.text import text_to_sentence
+
+SAMPLE_TEXTS = [
+    "안녕하세요. 강아지 유치원입니다! 소형견, 중대형견 모두 이용 가능합니다.",
+    "호텔 1박 요금은 30,000원 입니다. 주말에는 5,000원이 추가됩니다.",
+    "오픈 시간: 09:00 ~ 21:00 (연중무휴)",
+    "그러니까 우리는 최고입니다",
+]
+# 한국어 모드 기대 결과 (연결 어미, 텍스트 처음의 구두점 등)
+KOREAN_CASES = {
+    "그러니까 우리는 최고입니다": ["그러니까 우리는 최고입니다"],
+    "안녕하세요. 장성남입니다.": ["안녕하세요.", "장성남입니다."],
+    "소형견 전용입니다 주말은 예약제예요 문의 주세요": ["소형견 전용입니다", "주말은 예약제예요", "문의 주세요"],
+    "! 우리는 최고입니다 좋아": ["! 우리는 최고입니다", "좋아"],
+}
+
+
+def load_texts(html_dir: str) -> list:
+    texts = []
+    for path in sorted(glob.glob(os.path.join(html_dir, "**", "*.html"), recursive=True)):
+        with open(path, 'rb') as f:
+            texts += [clean_text(text) for text in extract_text_blocks(parse_html(f.read()))]
+    return [text for text in texts if text] or SAMPLE_TEXTS
+
+def build_corpus(texts: list, scale: int) -> list:
+    """블록 단위 텍스트 + 여러 블록을 이어 붙인 대형 텍스트 + 구두점으로 연결된 단어 반복 텍스트"""
+    joined = " ".join(texts)
+    # 공백 없는 단어 + 구두점이 반복되면 기존 구현은 같은 구간을 반복해서 검사
+    dotted = "시작 " + "가.나.다. " * 2000 + "끝입니다."
+    return texts + [" ".join([joined] * scale)] + [dotted] * scale
+
+def main():
+    parser = argparse.ArgumentParser(description="문장 분리 비교 벤치마크")
+    parser.add_argument('--html-dir', default=os.getenv("SCRAPER_CORPUS_DIR", "benchmarks/corpus"))
+    parser.add_argument('--scale', type=int, default=10, help='전체 텍스트 반복 횟수 (대형 페이지 시뮬레이션)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    corpus = build_corpus(load_texts(args.html_dir), args.scale)
+    mismatches = find_mismatches(text_to_sentence, text_to_sentence_legacy, corpus, label=lambda text: text[:50])
+    mismatches += [text for text, expected in KOREAN_CASES.items() if text_to_sentence(text, korean=True) != expected]
+
+    total_mb = sum(len(text.encode('utf-8')) for text in corpus) / 1024 / 1024
+    results = [
+        measure('text_to_sentence', text_to_sentence, corpus, args.repeat),
+        measure('text_to_sentence.korean', lambda text: text_to_sentence(text, korean=True), corpus, args.repeat),
+        measure('text_to_sentence.legacy', text_to_sentence_legacy, corpus, args.repeat),
+    ]
+    for result in results:
+        result['mb_per_sec'] = round(total_mb / result['best_seconds'], 2)
+
+    report_comparison(results, mismatches, f"텍스트 {len(corpus)}개 ({total_mb:.1f}MB)", args.output)
+
+
+if __name__ == "__main__":
+    main()
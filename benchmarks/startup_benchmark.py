@@ -0,0 +1,94 @@
+"""
+시작 시간(import 시간) 예산 검사
+
+    python -m benchmarks.startup_benchmark --budget-ms 400
+
+각 진입점 모듈을 새 인터프리터에서 `-X importtime`으로 import해 누적 import 시간을 측정합니다.
+예산을 넘거나, 진입점이 무거운 모듈(pandas, openai 등 특정 단계에서만 쓰는 모듈)을 바로 import하면 실패(exit 1)합니다.
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+from benchmarks.harness import save_results
+
+# main 진입점의 import 시간 예산(ms)
+DEFAULT_BUDGET_MS = float(os.getenv("SCRAPER_STARTUP_BUDGET_MS", "400"))
+# 진입점 모듈 → import 시간 예산 배수 (DEFAULT_BUDGET_MS / --budget-ms 기준)
+ENTRY_POINTS = {
+    'main': 1.0,
+    'lib.ai': 0.5,
+    'lib.scrapper.scrape_naver_places': 1.0,
+}
+# 진입점 import 시점에 로드되면 안 되는 모듈 (해당 단계에서 import)
+DEFERRED_MODULES = ['pandas', 'pyarrow', 'openai', 'boto3', 'aiohttp', 'PIL', 'bs4', 'selenium']
+
+IMPORTTIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str) -> dict:
+    """새 인터프리터에서 module을 import해 {모듈: 누적 import 시간(us)} 반환"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': ROOT_DIR}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    times = {}
+    for match in IMPORTTIME_PATTERN.finditer(result.stderr):
+        times[match.group(4)] = int(match.group(2))
+    return times
+
+def best_import_time(module: str, repeat: int = 3) -> dict:
+    """repeat번 측정해 module의 누적 import 시간이 가장 짧은 결과 반환 (디스크 캐시 등 영향 제거)"""
+    runs = [import_time(module) for _ in range(repeat)]
+    return min(runs, key=lambda times: times.get(module, 0))
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 예산 검사")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='main 진입점의 import 시간 예산(ms)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=10, help='출력할 느린 모듈 수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    results = []
+    failures = []
+    for module, budget_ratio in ENTRY_POINTS.items():
+        times = best_import_time(module, args.repeat)
+
+        total_ms = times.get(module, 0) / 1000
+        budget_ms = args.budget_ms * budget_ratio
+        loaded = [name for name in DEFERRED_MODULES if name in times]
+
+        results.append({
+            "name": module,
+            "import_ms": round(total_ms, 1),
+            "budget_ms": budget_ms,
+            "deferred_loaded": loaded,
+        })
+
+        print(f"{module:<40} {total_ms:>8.1f}ms / {budget_ms:.0f}ms")
+        slowest = sorted(((us, name) for name, us in times.items() if name != module and '.' not in name), reverse=True)
+        for us, name in slowest[:args.top]:
+            print(f"    {name:<36} {us / 1000:>8.1f}ms")
+
+        if total_ms > budget_ms:
+            failures.append(f"{module}: import 시간 {total_ms:.1f}ms > 예산 {budget_ms:.0f}ms")
+        if loaded:
+            failures.append(f"{module}: 지연 import 대상 모듈 로드됨 {loaded}")
+
+    if args.output:
+        save_results(results, args.output)
+
+    if failures:
+        print("\n".join(["", "예산 초과:"] + failures))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+홈페이지 텍스트 추출 엔진 비교 벤치마크 (lxml 단일 순회 vs BeautifulSoup 다중 순회)
+
+    python -m benchmarks.text_extraction_benchmark --html-dir benchmarks/corpus --scale 20
+
+`--scale`만큼 각 페이지의 body를 반복해 대형 홈페이지를 만들어 측정하며, 두 엔진의 결과가 같은지도 확인합니다.
+"""
+import os
+import re
+import glob
+import argparse
+
+from benchmarks.harness import measure, find_mismatches, report_comparison
+from benchmarks.legacy import parse_text_content_bs4
+from lib.scrapper.page_source import PageSource
+from lib.scrapper.scrape_page_content import _parse_text_content
+
+BODY_PATTERN = re.compile(rb'(<body[^>]*>)(.*)(</body>)', re.DOTALL | re.IGNORECASE)
+
+
+def load_pages(html_dir: str, scale: int) -> list:
+    paths = glob.glob(os.path.join(html_dir, "**", "*.html"), recursive=True)
+    # 녹화 코퍼스(.body)도 HTML이면 포함
+    paths += [path for path in glob.glob(os.path.join(html_dir, "*.body")) if _is_html(path)]
+
+    pages = []
+    for path in sorted(paths):
+        with open(path, 'rb') as f:
+            content = f.read()
+        pages.append(PageSource(url=path, content=_enlarge(content, scale)))
+    return pages
+
+def _is_html(path: str) -> bool:
+    with open(path, 'rb') as f:
+        head = f.read(1024).lower()
+    return b'<html' in head or b'<!doctype html' in head
+
+def _enlarge(content: bytes, scale: int) -> bytes:
+    """body 내용을 scale번 반복"""
+    if scale <= 1 or not (match := BODY_PATTERN.search(content)):
+        return content
+    return content[:match.start()] + match.group(1) + match.group(2) * scale + match.group(3) + content[match.end():]
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 추출 엔진 비교 벤치마크")
+    parser.add_argument('--html-dir', default=os.getenv("SCRAPER_CORPUS_DIR", "benchmarks/corpus"))
+    parser.add_argument('--scale', type=int, default=10, help='body 반복 횟수 (대형 페이지 시뮬레이션)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    pages = load_pages(args.html_dir, args.scale)
+    if not pages:
+        raise SystemExit(f"HTML 파일이 없습니다: {args.html_dir}")
+
+    mismatches = find_mismatches(_parse_text_content, parse_text_content_bs4, pages, label=lambda page: page.url)
+
+    total_mb = sum(len(page.content) for page in pages) / 1024 / 1024
+    results = [
+        measure('text_extraction.lxml', _parse_text_content, pages, args.repeat),
+        measure('text_extraction.bs4', parse_text_content_bs4, pages, args.repeat),
+    ]
+    report_comparison(results, mismatches, f"페이지 {len(pages)}개 ({total_mb:.1f}MB)", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+URL 필터 비교 벤치마크 (컴파일된 UrlFilter vs 기존 is_valid_url_legacy)
+
+    python -m benchmarks.url_filter_benchmark --count 200000
+
+홈페이지 링크와 비슷한 형태의 URL 코퍼스를 생성해 측정하며, 두 필터의 결과가 같은지도 확인합니다.
+`--html-dir`를 지정하면 HTML 파일의 a 태그 href도 코퍼스에 포함합니다.
+"""
+import os
+import glob
+import random
+import argparse
+
+from urllib.parse import urljoin
+
+from benchmarks.harness import measure, find_mismatches, report_comparison
+from benchmarks.legacy import is_valid_url_legacy
+from lib.scrapper.text_extractor import parse_html
+from utils.url_filter import get_url_filter
+
+BASE_URL = 'https://petcare.example.com/'
+BASE_DOMAIN = 'petcare.example.com'
+
+DOMAINS = [BASE_DOMAIN, 'www.instagram.com', 'blog.naver.com', 'cdn.example.com']
+SEGMENTS = ['about', 'intro', 'price', 'hotel', 'kinder', 'gallery', 'board', 'shop', 'product', 'notice', 'login',
+            'privacy', 'img', 'view', '2024', '123', '소개', '가격', 'service', 'reservation', 'youtube', 'event']
+QUERIES = ['', '', '', '?page=2', '?utm_source=naver', '?id=15&mode=view']
+PREFIXES = ['', '', '', '', 'javascript:', 'mailto:', '#']
+
+
+def generate_urls(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    urls = []
+    for _ in range(count):
+        prefix = rng.choice(PREFIXES)
+        if prefix:
+            urls.append(prefix + rng.choice(SEGMENTS))
+            continue
+
+        path = '/'.join(rng.choice(SEGMENTS) for _ in range(rng.randint(0, 3)))
+        urls.append(f"https://{rng.choice(DOMAINS)}/{path}{rng.choice(QUERIES)}")
+    return urls
+
+def load_hrefs(html_dir: str) -> list:
+    urls = []
+    for path in sorted(glob.glob(os.path.join(html_dir, "**", "*.html"), recursive=True)):
+        with open(path, 'rb') as f:
+            root = parse_html(f.read())
+        if root is None: continue
+        urls += [urljoin(BASE_URL, href.strip()) for a_tag in root.iter('a') if (href := a_tag.get('href')) is not None]
+    return urls
+
+def main():
+    parser = argparse.ArgumentParser(description="URL 필터 비교 벤치마크")
+    parser.add_argument('--count', type=int, default=100000, help='생성할 URL 수')
+    parser.add_argument('--html-dir', help='href를 추가로 수집할 HTML 디렉터리')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    urls = generate_urls(args.count)
+    if args.html_dir:
+        urls += load_hrefs(args.html_dir)
+
+    url_filter = get_url_filter()
+    compiled = lambda url: url_filter.is_valid_url(url, BASE_DOMAIN)
+    legacy = lambda url: is_valid_url_legacy(url, BASE_DOMAIN)
+
+    mismatches = find_mismatches(compiled, legacy, urls)
+
+    results = [
+        measure('url_filter.compiled', compiled, urls, args.repeat),
+        measure('url_filter.legacy', legacy, urls, args.repeat),
+    ]
+    report_comparison(results, mismatches, f"URL {len(urls)}개 (유효 {sum(map(compiled, urls))}개)", args.output)
+
+
+if __name__ == "__main__":
+    main()
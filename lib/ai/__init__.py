@@ -1,4 +1,4 @@
 from .prompt import get_service_prompt
-from .gpt_batch_api import batch_api, get_batch_status, make_batch_option, get_batch_result, cancel_batch
+from .gpt_batch_api import batch_api, get_batch_status, make_batch_option, get_batch_result, cancel_batch, chat_completion
 
-__all__ = ['get_service_prompt', 'batch_api', 'get_batch_status', 'make_batch_option', 'get_batch_result', 'cancel_batch']
\ No newline at end of file
+__all__ = ['get_service_prompt', 'batch_api', 'get_batch_status', 'make_batch_option', 'get_batch_result', 'cancel_batch', 'chat_completion']
\ No newline at end of file
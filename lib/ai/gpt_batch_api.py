@@ -1,20 +1,24 @@
 import os
 import json
+from functools import lru_cache
 from typing import List
-from openai import OpenAI
 
 
-api_key = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=api_key)
+@lru_cache(maxsize=1)
+def get_client():
+    """OpenAI 클라이언트 (처음 요청할 때 생성)"""
+    from openai import OpenAI
+
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 def batch_api(jsonl_path: str):
-    batch_input_file = client.files.create(
+    batch_input_file = get_client().files.create(
         file=open(jsonl_path, "rb"),
         purpose="batch",
     )
 
     batch_input_file_id = batch_input_file.id
-    response = client.batches.create(
+    response = get_client().batches.create(
         input_file_id=batch_input_file_id,
         endpoint="/v1/chat/completions",
         completion_window="24h",
@@ -56,8 +60,8 @@ def make_batch_option(request_id: str, system_messages: List[str], user_messages
     }
 
 def get_batch_result(batch_id: str) -> List[dict]:
-    response = client.batches.retrieve(batch_id)
-    file_response = client.files.content(response.output_file_id)
+    response = get_client().batches.retrieve(batch_id)
+    file_response = get_client().files.content(response.output_file_id)
 
     content = file_response.content.decode('utf-8')
     lines = content.strip().split('\n')
@@ -67,19 +71,31 @@ def get_batch_result(batch_id: str) -> List[dict]:
         if line.strip():
             data = json.loads(line)
             content = data['response']['body']['choices'][0]['message']['content']
-            content = content.replace('```json\n', '').replace('```', '')
-            content = json.loads(content)
-            
+
             results.append({
                 "id": data['custom_id'],
-                "content": content
+                "content": _load_content(content)
             })
 
     return results
 
+def chat_completion(option: dict) -> dict:
+    """배치 요청 옵션(`make_batch_option`) 하나를 바로 요청해 결과 반환 (단건 갱신용)"""
+    response = get_client().chat.completions.create(**option['body'])
+    content = response.choices[0].message.content
+
+    return {
+        "id": option['custom_id'],
+        "content": _load_content(content)
+    }
+
 def get_batch_status(batch_id: str) -> str:
-    response = client.batches.retrieve(batch_id)
+    response = get_client().batches.retrieve(batch_id)
     return response.status
 
 def cancel_batch(batch_id: str):
-    client.batches.cancel(batch_id)
\ No newline at end of file
+    get_client().batches.cancel(batch_id)
+
+def _load_content(content: str) -> dict:
+    content = content.replace('```json\n', '').replace('```', '')
+    return json.loads(content)
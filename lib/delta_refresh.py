@@ -0,0 +1,73 @@
+import os
+import json
+import hashlib
+from typing import List, Tuple
+
+from lib.logger import get_logger
+from utils.dict_utils import pick_fields
+
+log = get_logger(__name__)
+
+# 변경 감지 후에도 최신 값으로 덮어쓸 필드 (검색/상세 스크래핑 단계에서 바로 얻을 수 있는 값)
+FRESH_FIELDS = ['name', 'tel', 'address', 'road_address', 'lat', 'lng', 'business_hours', 'business_hours_minutes',
+                'review_counts', 'links', 'change_signature', 'duplicate_of']
+# 보강 단계(LLM 요청) 결과 필드, 이전 결과에 없으면 보강이 실패한 것으로 보고 다시 처리
+ENRICHMENT_FIELDS = ['categories', 'services']
+
+
+def change_signature(place: dict) -> str:
+    """
+    변경 감지용 시그니처를 반환합니다. (리뷰 수, 가격표 이미지 URL, 홈페이지 링크)
+
+    시그니처가 같으면 홈페이지 크롤링, 이미지 업로드, LLM 요청 결과도 같다고 간주합니다.
+    """
+    signals = {
+        "review_counts": place.get('review_counts') or {},
+        "menu_image_urls": place.get('menu_image_urls') or [],
+        "links": sorted(link.get('url', '') for link in (place.get('links') or [])),
+    }
+    payload = json.dumps(signals, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def load_snapshot(path: str) -> dict:
+    """이전 실행 결과 파일을 읽어 ID를 키로 하는 딕셔너리로 반환"""
+    if not os.path.exists(path):
+        log.info(f"이전 스냅샷 없음 ({path}), 전체 갱신으로 진행")
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {place['id']: place for place in json.load(f) if 'id' in place}
+    except (OSError, ValueError) as e:
+        log.error(f"스냅샷 읽기 실패 ({path}): {e}")
+        return {}
+
+def split_changed_places(place_list: List[dict], snapshot: dict) -> Tuple[List[dict], List[dict]]:
+    """
+    장소 리스트를 변경된 장소와 변경되지 않은 장소로 분리합니다.
+
+    시그니처가 같아도 이전 결과에 보강 필드(ENRICHMENT_FIELDS)가 없으면(이전 실행의 LLM 요청, 크롤링 실패 등) 변경된 장소로 분류합니다.
+
+    Args:
+        place_list: 시그니처(`change_signature`)가 포함된 최신 장소 리스트
+        snapshot: `load_snapshot`으로 읽은 이전 결과
+
+    Returns:
+        (변경된 장소 리스트, 이전 결과에 최신 값을 덮어쓴 변경되지 않은 장소 리스트)
+    """
+    changed = []
+    unchanged = []
+
+    for place in place_list:
+        previous = snapshot.get(place['id'])
+
+        if previous and previous.get('change_signature') == place['change_signature'] and _is_enriched(previous):
+            unchanged.append(previous | pick_fields(place, FRESH_FIELDS))
+        else:
+            changed.append(place)
+
+    log.info(f"변경 감지 - 변경 {len(changed)}개, 유지 {len(unchanged)}개")
+    return changed, unchanged
+
+def _is_enriched(place: dict) -> bool:
+    return all(place.get(field) is not None for field in ENRICHMENT_FIELDS)
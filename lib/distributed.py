@@ -0,0 +1,123 @@
+import os
+import time
+import socket
+import asyncio
+import threading
+
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+from lib.logger import get_logger
+from lib.work_queue import WorkQueue, Lease, PENDING, LEASED, DONE, FAILED
+
+log = get_logger(__name__)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class LeaseKeeper:
+    """처리 중인 조각의 임대를 주기적으로 연장하는 백그라운드 스레드"""
+    def __init__(self, queue: WorkQueue, lease: Lease, lease_seconds: float):
+        self.queue = queue
+        self.lease = lease
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stopped.wait(self.lease_seconds / 3):
+            try:
+                if not self.queue.extend(self.lease, self.lease_seconds):
+                    self.lost = True
+                    log.warning(f"임대가 다른 워커에게 넘어갔습니다 [{self.lease.job_id}:{self.lease.chunk_id}]")
+                    return
+            except Exception as e:
+                log.error(f"임대 연장 실패 [{self.lease.job_id}:{self.lease.chunk_id}]: {e}")
+
+
+async def run_worker(
+        queue: WorkQueue,
+        process_fn: Callable[[dict, list], Awaitable[list]],
+        worker_id: str = None,
+        lease_seconds: float = 600,
+        poll_interval: float = 10,
+        idle_timeout: Optional[float] = 600
+    ) -> int:
+    """
+    큐에서 조각을 임대해 처리하고 결과를 제출합니다. 남은 작업 없이 idle_timeout이 지나면 종료합니다.
+
+    코디네이터가 검색을 마치고 작업을 등록하기 전에 시작한 워커는 작업이 등록될 때까지 대기합니다.
+    다른 워커가 처리 중인 조각이 남아 있으면 임대가 만료될 때(워커 장애)를 대비해 계속 대기합니다.
+
+    Args:
+        process_fn: (작업 payload, 조각 항목 리스트) -> 결과 리스트
+        lease_seconds: 임대 기간(초), 처리 중에는 1/3 주기로 연장
+        idle_timeout: 진행 중인 작업이 없을 때 대기할 시간(초), None이면 계속 대기, 0이면 바로 종료
+
+    Returns:
+        처리 완료한 조각 수
+    """
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+    idle_since = time.monotonic()
+
+    while True:
+        lease = queue.lease(worker_id, lease_seconds)
+        if lease is None:
+            if queue.has_active_jobs():
+                idle_since = time.monotonic()
+            elif idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            await asyncio.sleep(poll_interval)
+            continue
+
+        log.info(f"[{worker_id}] 조각 처리 시작 [{lease.job_id}:{lease.chunk_id}] ({len(lease.items)}개 항목)")
+        try:
+            with LeaseKeeper(queue, lease, lease_seconds):
+                results = await process_fn(lease.payload, lease.items)
+        except Exception as e:
+            log.error(f"[{worker_id}] 조각 처리 실패 [{lease.job_id}:{lease.chunk_id}]: {e}")
+            queue.release(lease, str(e))
+            continue
+
+        if queue.complete(lease, results):
+            completed += 1
+        else:
+            log.warning(f"[{worker_id}] 이미 완료된 조각 [{lease.job_id}:{lease.chunk_id}], 결과 무시")
+        idle_since = time.monotonic()
+
+    log.info(f"[{worker_id}] 남은 작업 없음, 워커 종료 (처리한 조각 {completed}개)")
+    return completed
+
+async def iter_job_results(queue: WorkQueue, job_id: str, poll_interval: float = 10) -> AsyncIterator[List[dict]]:
+    """완료된 조각의 결과를 완료되는 대로 반환 (모든 조각이 끝나면 종료)"""
+    seen = set()
+    while True:
+        # 진행 상황을 먼저 읽어야 종료 직전에 완료된 조각도 빠짐없이 반환됨
+        progress = queue.progress(job_id)
+        for chunk_id, results in queue.completed_chunks(job_id, seen):
+            seen.add(chunk_id)
+            yield results
+
+        if not progress[PENDING] and not progress[LEASED]:
+            break
+
+        log.info(f"작업 [{job_id}] 진행 중 - 완료 {progress[DONE]}, 처리 중 {progress[LEASED]}, 대기 {progress[PENDING]}, 실패 {progress[FAILED]}")
+        await asyncio.sleep(poll_interval)
+
+    if progress[FAILED]:
+        log.error(f"작업 [{job_id}] 실패한 조각 {progress[FAILED]}개는 결과에서 제외됩니다.")
+
+async def wait_for_job(queue: WorkQueue, job_id: str, poll_interval: float = 10) -> List[dict]:
+    """작업의 모든 조각이 끝날 때까지 기다린 뒤 결과를 병합해 반환"""
+    return [result async for results in iter_job_results(queue, job_id, poll_interval) for result in results]
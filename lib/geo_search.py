@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from lib.logger import get_logger
+from lib.metrics import get_metrics
+
+log = get_logger(__name__)
+metrics = get_metrics()
+
+# 검색 API가 한 번에 반환하는 최대 결과 수 (이만큼 반환되면 영역을 나눠 다시 검색)
+RESULT_CAP = 100
+# 영역을 나누는 최대 깊이 (깊이마다 4등분)
+MAX_DEPTH = 4
+# 시작 격자 크기 (grid x grid)
+DEFAULT_GRID = 2
+# 검색 결과 좌표로 영역을 정할 때 바깥 여백 (도)
+BBOX_MARGIN = 0.005
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """위경도 사각 영역"""
+    min_lng: float
+    min_lat: float
+    max_lng: float
+    max_lat: float
+
+    @classmethod
+    def from_points(cls, points: Iterable[Tuple[float, float]], margin: float = BBOX_MARGIN) -> Optional["BoundingBox"]:
+        """(lng, lat) 좌표들을 감싸는 영역 (좌표가 없으면 None)"""
+        points = list(points)
+        if not points:
+            return None
+
+        lngs = [lng for lng, _ in points]
+        lats = [lat for _, lat in points]
+        return cls(min(lngs) - margin, min(lats) - margin, max(lngs) + margin, max(lats) + margin)
+
+    @classmethod
+    def parse(cls, value: str) -> "BoundingBox":
+        """`min_lng,min_lat,max_lng,max_lat` 문자열"""
+        min_lng, min_lat, max_lng, max_lat = (float(v) for v in value.split(','))
+        return cls(min_lng, min_lat, max_lng, max_lat)
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.min_lng + self.max_lng) / 2, (self.min_lat + self.max_lat) / 2
+
+    def split(self, n: int = 2) -> List["BoundingBox"]:
+        """n x n 격자로 분할"""
+        lng_step = (self.max_lng - self.min_lng) / n
+        lat_step = (self.max_lat - self.min_lat) / n
+        return [
+            BoundingBox(
+                self.min_lng + lng_step * i,
+                self.min_lat + lat_step * j,
+                self.min_lng + lng_step * (i + 1),
+                self.min_lat + lat_step * (j + 1)
+            )
+            for i in range(n) for j in range(n)
+        ]
+
+    def __str__(self):
+        return f"{self.min_lng:.5f};{self.min_lat:.5f};{self.max_lng:.5f};{self.max_lat:.5f}"
+
+
+def search_tiles(
+        search_fn: Callable[[str, BoundingBox], Optional[list]],
+        queries: List[str],
+        bbox: BoundingBox,
+        grid: int = DEFAULT_GRID,
+        result_cap: int = RESULT_CAP,
+        max_depth: int = MAX_DEPTH,
+        max_workers: int = 8
+    ) -> List[dict]:
+    """
+    영역을 격자로 나눠 검색어별로 동시에 검색하고, 결과를 ID로 중복 제거해 반환합니다.
+
+    결과가 result_cap만큼 반환된(잘린) 영역만 4등분해 다시 검색하므로, 장소가 적은 영역은 요청 한 번으로 끝납니다.
+    깊이(level) 단위로 모든 검색어의 영역을 한 번에 요청합니다.
+
+    Args:
+        search_fn: (검색어, 영역) -> 결과 리스트 (실패 시 None)
+        grid: 시작 격자 크기
+        max_depth: 최대 분할 깊이 (넘으면 잘린 결과를 그대로 사용)
+    """
+    results = {}
+    tiles = [(query, tile, 0) for query in queries for tile in bbox.split(grid)]
+    requests = saturated = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while tiles:
+            futures = {executor.submit(search_fn, query, tile): (query, tile, depth) for query, tile, depth in tiles}
+            tiles = []
+
+            for future in as_completed(futures):
+                query, tile, depth = futures[future]
+                items = future.result()
+                requests += 1
+                if items is None:
+                    continue
+
+                for item in items:
+                    results.setdefault(item['id'], item)
+
+                if len(items) < result_cap:
+                    continue
+                if depth < max_depth:
+                    tiles += [(query, sub_tile, depth + 1) for sub_tile in tile.split(2)]
+                else:
+                    saturated += 1
+                    log.warning(f"최대 분할 깊이에서도 결과가 잘림 ({query}, {tile})")
+
+    metrics.inc('geo_search_requests', requests)
+    log.info(f"영역 분할 검색 - 요청 {requests}회, 장소 {len(results)}개 (잘린 영역 {saturated}개)")
+    return list(results.values())
@@ -1,20 +1,157 @@
+import os
+import json
+import queue
+import atexit
 import logging
+import threading
 import colorlog
+
 from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+
+# 로그 출력 형식 (console: 색상 콘솔 | json: 한 줄에 JSON 레코드 하나)
+LOG_FORMAT = os.getenv("SCRAPER_LOG_FORMAT", "console")
+# 1이면 로그 출력(포맷/쓰기)을 별도 스레드에서 수행
+LOG_ASYNC = os.getenv("SCRAPER_LOG_ASYNC", "0") == "1"
+# 같은 경고 메시지(템플릿 기준)는 처음 SAMPLE_BURST개 이후 SAMPLE_EVERY개마다 1개만 출력 (0이면 샘플링 안 함)
+SAMPLE_BURST = int(os.getenv("SCRAPER_LOG_SAMPLE_BURST", "20"))
+SAMPLE_EVERY = int(os.getenv("SCRAPER_LOG_SAMPLE_EVERY", "0"))
+
+# JSON 레코드에 포함할 구조화 필드 (`log.info(..., extra={'stage': ..., 'host': ...})`)
+STRUCTURED_FIELDS = ('stage', 'host', 'url', 'place_id', 'status', 'latency', 'attempt', 'size')
 
 _initialized = False
+_handler = None
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 변환 (extra로 넘긴 구조화 필드 포함)"""
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "source": f"{record.filename}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            if (value := getattr(record, field, None)) is not None:
+                payload[field] = value
+        if getattr(record, 'sampled', None):
+            payload['sampled'] = record.sampled
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SampleFilter(logging.Filter):
+    """
+    반복되는 경고 샘플링
+
+    메시지 템플릿(`record.msg`, 인자 적용 전)과 위치가 같은 WARNING 레코드를 처음 burst개는 모두 통과시키고,
+    이후에는 every개마다 1개만 통과시킵니다. 통과한 레코드의 `sampled`에 그동안 생략된 개수를 기록합니다.
+    ERROR 이상은 샘플링하지 않습니다.
+    """
+    def __init__(self, burst: int = SAMPLE_BURST, every: int = SAMPLE_EVERY):
+        super().__init__()
+        self.burst = burst
+        self.every = every
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.every <= 0 or record.levelno != logging.WARNING:
+            return True
+
+        key = (record.pathname, record.lineno, str(record.msg))
+        with self.lock:
+            count = self.counts[key] = self.counts.get(key, 0) + 1
 
-def setup_logging(level=logging.INFO):
-    global _initialized
-    if _initialized:
+        if count <= self.burst:
+            return True
+        if (count - self.burst) % self.every:
+            return False
+
+        record.sampled = self.every - 1
+        return True
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    레코드를 큐에 넣기만 하는 핸들러 (포맷과 출력은 QueueListener 스레드에서 수행)
+
+    기본 QueueHandler는 호출 스레드에서 전체 포맷(색상, JSON)까지 수행하므로, 메시지 인자만 적용하고 나머지는 넘깁니다.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(level=logging.INFO, log_format: str = None, async_mode: bool = None, force: bool = False):
+    """
+    루트 로거 설정
+
+    Args:
+        log_format: 'console' | 'json' (기본: SCRAPER_LOG_FORMAT)
+        async_mode: 큐 핸들러로 출력을 별도 스레드에서 수행 (기본: SCRAPER_LOG_ASYNC)
+        force: 이미 설정되어 있어도 이 모듈이 추가한 핸들러를 교체 (CLI 옵션 적용)
+    """
+    global _initialized, _handler, _listener
+    if _initialized and not force:
         return
-        
-    # 이미 핸들러가 있는지 확인하고 중복 방지
+
+    # 이미 핸들러가 있는지 확인하고 중복 방지 (다른 곳에서 설정한 경우)
     root = logging.getLogger()
-    if root.handlers:
+    if root.handlers and _handler is None:
         _initialized = True
         return
-        
+
+    _remove_handler()
+
+    # spawn으로 시작하는 자식 프로세스(파싱 프로세스 풀)도 같은 설정을 쓰도록 환경 변수로 전달
+    if log_format is not None:
+        os.environ["SCRAPER_LOG_FORMAT"] = log_format
+    if async_mode is not None:
+        os.environ["SCRAPER_LOG_ASYNC"] = "1" if async_mode else "0"
+
+    handler = _create_handler(log_format or LOG_FORMAT)
+    if async_mode if async_mode is not None else LOG_ASYNC:
+        _listener = QueueListener(queue.SimpleQueue(), handler, respect_handler_level=True)
+        _listener.start()
+        handler = DeferredQueueHandler(_listener.queue)
+
+        # 자식 프로세스는 atexit 없이 종료되므로 multiprocessing 종료 처리에서 남은 로그 출력
+        from multiprocessing.util import Finalize
+        Finalize(None, shutdown_logging, exitpriority=0)
+
+    handler.addFilter(SampleFilter())
+    root.setLevel(level)
+    root.addHandler(handler)
+    _handler = handler
+
+    # 외부 라이브러리 로그 레벨 조정
+    logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.ERROR)
+    logging.getLogger('selenium').setLevel(logging.WARNING)
+
+    _initialized = True
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def _create_handler(log_format: str) -> logging.Handler:
+    if log_format == 'json':
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        return handler
+
     handler = colorlog.StreamHandler()
     handler.setFormatter(colorlog.ColoredFormatter(
         '[%(asctime)s - %(log_color)s%(levelname)s%(reset)s] \033[90m(%(filename)s:%(lineno)d)\033[0m %(message)s',
@@ -27,18 +164,19 @@ def setup_logging(level=logging.INFO):
         },
         style='%'
     ))
-    
-    root.setLevel(level)
-    root.addHandler(handler)
+    return handler
 
-    # 외부 라이브러리 로그 레벨 조정
-    logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.ERROR)
-    logging.getLogger('selenium').setLevel(logging.WARNING)
+def _remove_handler():
+    global _handler
+    shutdown_logging()
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
 
-    _initialized = True
+atexit.register(shutdown_logging)
 
 @lru_cache(maxsize=32)
 def get_logger(name=None):
     """로거 인스턴스를 반환하는 함수 (캐싱 적용)"""
     setup_logging()
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
@@ -0,0 +1,226 @@
+import json
+import time
+import bisect
+import threading
+
+from contextlib import contextmanager
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+# 소요 시간 (초) 버킷
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# 바이트 크기 버킷 (1KB ~ 32MB)
+SIZE_BUCKETS = tuple(1024 * 4 ** i for i in range(9))
+
+
+class Histogram:
+    """누적 버킷 기반 히스토그램"""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float):
+        """버킷 내 선형 보간으로 분위수 추정"""
+        if not self.count: return None
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[i - 1] if i > 0 else (self.min or 0)
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(value, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """
+    단계별 히스토그램과 카운터를 모아 JSON 리포트, Prometheus 텍스트로 내보냅니다.
+
+    라벨은 키워드 인자로 전달합니다. (예: `metrics.observe('fetch_seconds', 0.3, stage='naver_place', host='m.place.naver.com')`)
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.histograms = {}
+        self.counters = {}
+        self.server = None
+
+    def observe(self, name: str, value: float, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram(buckets)
+            self.histograms[key].observe(value)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """with 블록의 소요 시간을 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def record_response(self, stage: str, url: str, status: int, elapsed: float, size: int):
+        """HTTP 응답 한 건의 지연 시간, 크기, 상태 코드를 호스트별로 기록"""
+        host = urlparse(url).netloc
+        self.observe('fetch_seconds', elapsed, stage=stage, host=host)
+        self.observe('response_bytes', size, buckets=SIZE_BUCKETS, stage=stage, host=host)
+        self.inc('bytes_downloaded_total', size, stage=stage, host=host)
+        self.inc('requests_total', stage=stage, host=host, status=str(status))
+
+    def record_error(self, stage: str, url: str, retry: bool = False):
+        """요청 실패(재시도 포함) 횟수를 호스트별로 기록"""
+        host = urlparse(url).netloc
+        self.inc('retries_total' if retry else 'errors_total', stage=stage, host=host)
+
+    def reset(self):
+        with self.lock:
+            self.started_at = time.time()
+            self.histograms.clear()
+            self.counters.clear()
+
+    # --- Export ---
+
+    def report(self) -> dict:
+        """실행 리포트 (히스토그램 요약, 카운터, 호스트별 집계)"""
+        with self.lock:
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.summary()}
+                for (name, labels), histogram in sorted(self.histograms.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+
+        hosts = {}
+        for counter in counters:
+            if host := counter['labels'].get('host'):
+                hosts.setdefault(host, {})
+                hosts[host][counter['name']] = hosts[host].get(counter['name'], 0) + counter['value']
+        for histogram in histograms:
+            if (host := histogram['labels'].get('host')) and histogram['name'] == 'fetch_seconds':
+                hosts.setdefault(host, {})
+                hosts[host].setdefault('fetch_seconds', []).append({
+                    "stage": histogram['labels'].get('stage'),
+                    "mean": histogram['mean'],
+                    "p95": histogram['p95'],
+                })
+
+        return {
+            "elapsed_seconds": time.time() - self.started_at,
+            "histograms": histograms,
+            "counters": counters,
+            "hosts": hosts,
+        }
+
+    def dump_report(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=4)
+        log.info(f"메트릭 리포트 저장: {path}")
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 변환"""
+        lines = []
+        with self.lock:
+            typed = set()
+            for (name, labels), value in sorted(self.counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+
+                cumulative = 0
+                for bucket, bucket_count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', str(bucket)),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port: int, host: str = '0.0.0.0'):
+        """`/metrics` 경로로 Prometheus 텍스트를 제공하는 HTTP 서버를 백그라운드 스레드로 실행"""
+        if self.server: return self.server
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_error(404)
+                    return
+
+                body = registry.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        log.info(f"메트릭 서버 실행: http://{host}:{port}/metrics")
+        return self.server
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+def _format_labels(labels: tuple) -> str:
+    if not labels: return ""
+    escaped = (f'{key}="{_escape(value)}"' for key, value in labels)
+    return "{" + ",".join(escaped) + "}"
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+@lru_cache(maxsize=1)
+def get_metrics() -> MetricsRegistry:
+    """메트릭 레지스트리 인스턴스를 반환하는 함수 (프로세스 단위 싱글톤)"""
+    return MetricsRegistry()
@@ -1,33 +1,81 @@
 import requests
 
+from lib.egress_pool import get_egress_pool
+from lib.geo_search import BoundingBox, search_tiles
 from lib.logger import get_logger
+from lib.metrics import get_metrics
+from lib.spatial_index import DISTRICTS_PATH, SpatialIndex, coordinates, find_district
+from utils.http_client import HttpClient
 
 log = get_logger()
+metrics = get_metrics()
+client = HttpClient(stage='naver_search', egress_pool=get_egress_pool())
 
-def get_naver_place_list(location, keywords):
-    """네이버 지도 검색 API 스니핑 메인 함수"""
+ENDPOINT_URL = "https://svc-api.map.naver.com/v1/fusion-search/all"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Referer': 'https://m.map.naver.com/'
+}
+PARAMS = {
+    'siteSort': 'relativity',
+    'petrolType': 'all'
+}
+
+def get_naver_place_list(location, keywords, tiled: bool = False, bbox: BoundingBox = None):
+    """
+    네이버 지도 검색 API 스니핑 메인 함수
+
+    Args:
+        tiled: 지역을 격자로 나눠 검색 (한 번의 검색 결과 수 제한을 넘는 장소까지 수집)
+        bbox: 격자 검색 영역 (없으면 행정구역 경계, 경계 파일에 없으면 텍스트 검색 결과 좌표로 결정)
+    """
     # 1. 데이터 수집
     place_list = _fetch_naver_places(location, keywords)
+    if tiled:
+        place_list += _fetch_naver_places_tiled(location, keywords, bbox or _region_bbox(place_list, location))
     
     # 2. 데이터 필터링
     filtered_places = _filter_places(place_list, location)
     
-    # 3. 필요한 데이터만 추출 후 반환
-    return [_parse_data(place) for place in filtered_places]
+    # 3. 필요한 데이터만 추출
+    places = [_parse_data(place) for place in filtered_places]
+
+    # 4. 같은 업체가 여러 ID로 등록된 경우 표시 (제외하지 않음)
+    _flag_duplicates(places)
+    return places
 
 def _filter_places(place_list, location):
-    """장소 데이터 필터링 (중복 제거, 지역 일치)"""
+    """
+    장소 데이터 필터링 (중복 제거, 지역 일치)
+
+    행정구역 경계 파일에 지역이 있으면 좌표가 경계 안에 있는지로, 없으면 주소에 지역 이름이 포함되는지로 판단합니다.
+    """
+    if district := find_district(location, place_list):
+        lngs, lats = coordinates(place_list)
+        in_region = district.contains(lngs, lats).tolist()
+    else:
+        in_region = [location in item['address'] for item in place_list]
+
     filtered_data = []
     seen_ids = set()
-    
-    for item in place_list:
+
+    for item, inside in zip(place_list, in_region):
         # ID가 중복이거나, 지역 일치하지 않는 경우는 제외
-        if item['id'] not in seen_ids and location in item['address']:
+        if item['id'] not in seen_ids and inside:
             filtered_data.append(item)
             seen_ids.add(item['id'])
-    
+
     return filtered_data
 
+def _flag_duplicates(places):
+    """가까운 위치에 이름/전화번호가 같은 장소에 `duplicate_of` (대표 장소 ID) 설정"""
+    duplicates = SpatialIndex(places).find_duplicates()
+    for place in places:
+        place['duplicate_of'] = duplicates.get(place['id'])
+
+    if duplicates:
+        log.info(f"같은 업체로 보이는 장소 {len(duplicates)}개 표시")
+
 def _parse_data(data: dict):
     return {
         "id": data['id'],
@@ -43,29 +91,57 @@ def _parse_data(data: dict):
 def _fetch_naver_places(location, keywords):
     """네이버 지도 검색 API의 결과를 반환하는 함수"""
 
-    endpoint_url = f"https://svc-api.map.naver.com/v1/fusion-search/all"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        'Referer': 'https://m.map.naver.com/'
-    }
-    params = {
-        'siteSort': 'relativity',
-        'petrolType': 'all'
-    }
-    
     raw_results = []
 
     # 키워드에 대한 모든 검색 결과 가져오기
     for keyword in keywords:
-        params['query'] = f"{location}+{keyword}"
+        data_list = _search({**PARAMS, 'query': f"{location}+{keyword}"}, keyword)
+        if data_list is not None:
+            raw_results.extend(data_list)
 
-        try:
-            response = requests.get(endpoint_url, headers=headers, params=params)
-            response.raise_for_status()
+    return raw_results
 
-            data_list = response.json()["items"]
-            raw_results.extend(data_list)
-        except (requests.RequestException, KeyError, ValueError) as e:
-            log.error(f"네이버 지도 API 스니핑 실패 ({location} {keyword}): {e}")
+def _fetch_naver_places_tiled(location, keywords, bbox: BoundingBox):
+    """지역 영역을 격자로 나눠 키워드별로 검색 (결과가 잘린 영역은 다시 나눠 검색)"""
+    if bbox is None:
+        log.warning(f"검색 결과에 {location} 좌표가 없어 영역 분할 검색을 건너뜁니다.")
+        return []
+
+    def search_tile(keyword: str, tile: BoundingBox):
+        lng, lat = tile.center
+        params = {**PARAMS, 'query': keyword, 'searchCoord': f"{lng};{lat}", 'boundary': str(tile)}
+        return _search(params, keyword)
+
+    return search_tiles(search_tile, keywords, bbox)
+
+def _region_bbox(place_list, location):
+    """
+    격자 검색 영역
+
+    행정구역 경계 파일에 지역이 있으면 경계를 감싸는 영역, 없으면 텍스트 검색 결과 중 지역이 일치하는 장소들의 좌표를 감싸는 영역
+    (텍스트 검색 결과는 `geo_search.RESULT_CAP`개로 잘리므로 실제 지역보다 좁을 수 있음)
+    """
+    if district := find_district(location, place_list):
+        return BoundingBox(*district.bounds())
+
+    log.warning(f"{location} 행정구역 경계가 없어 텍스트 검색 결과 좌표로 격자 검색 영역을 정합니다. "
+                f"(결과 수 제한으로 영역이 좁을 수 있음, --bbox 또는 {DISTRICTS_PATH} 지정 권장)")
+    points = []
+    for item in place_list:
+        try:
+            if location in item['address']:
+                points.append((float(item['longitude']), float(item['latitude'])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return BoundingBox.from_points(points)
 
-    return raw_results
\ No newline at end of file
+def _search(params: dict, keyword: str):
+    """검색 API 요청 한 번의 결과 리스트 (실패 시 None)"""
+    try:
+        response = client.get(ENDPOINT_URL, key=keyword, headers=HEADERS, params=params)
+        response.raise_for_status()
+        return response.json()["items"]
+    except (requests.RequestException, KeyError, ValueError) as e:
+        metrics.record_error('naver_search', ENDPOINT_URL)
+        log.error(f"네이버 지도 API 스니핑 실패 ({params['query']}): {e}")
+        return None
\ No newline at end of file
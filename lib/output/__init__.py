@@ -0,0 +1,38 @@
+import sys
+
+from importlib import import_module
+
+from .base import OutputSink
+from .json_sink import JsonSink
+from .ndjson_sink import NdjsonSink
+
+# Parquet / Excel 싱크는 pyarrow, pandas를 사용하므로 처음 사용할 때 import
+LAZY_SINKS = {
+    'ParquetSink': '.parquet_sink',
+    'ExcelSink': '.excel_sink',
+}
+
+SINKS = {
+    'json': 'JsonSink',
+    'ndjson': 'NdjsonSink',
+    'parquet': 'ParquetSink',
+    'excel': 'ExcelSink',
+}
+
+def get_sink_class(output_format: str) -> type:
+    """출력 형식 이름으로 싱크 클래스 반환"""
+    return getattr(sys.modules[__name__], SINKS[output_format])
+
+def create_sinks(formats, name: str, output_dir: str = ".") -> list:
+    """출력 형식 이름 리스트로 싱크 인스턴스 생성 (예: ['json', 'ndjson'])"""
+    return [get_sink_class(output_format)(name, output_dir) for output_format in formats]
+
+def __getattr__(name: str):
+    if name not in LAZY_SINKS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    sink_class = getattr(import_module(LAZY_SINKS[name], __name__), name)
+    globals()[name] = sink_class
+    return sink_class
+
+__all__ = ['OutputSink', 'JsonSink', 'NdjsonSink', 'ParquetSink', 'ExcelSink', 'SINKS', 'create_sinks', 'get_sink_class']
@@ -0,0 +1,43 @@
+import os
+from typing import List
+
+
+class OutputSink:
+    """
+    결과 레코드를 파일로 저장하는 출력 싱크의 기본 클래스
+
+    Args:
+        name: 파일 이름 (확장자 제외)
+        output_dir: 파일이 저장 될 디렉토리
+    """
+    extension = ""
+
+    def __init__(self, name: str, output_dir: str = "."):
+        os.makedirs(output_dir, exist_ok=True)
+        self.path = os.path.join(output_dir, f"{name}.{self.extension}")
+        self.count = 0
+
+    def write(self, record: dict):
+        """레코드 한 건 저장"""
+        raise NotImplementedError
+
+    def write_many(self, records: List[dict]):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """남은 데이터를 기록하고 파일을 닫음"""
+        pass
+
+    def abort(self):
+        """실행이 실패했을 때 호출 (기본: 기록한 데이터까지 저장하고 닫음)"""
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,73 @@
+import json
+import pandas as pd
+
+from lib.output.base import OutputSink
+
+
+class ExcelSink(OutputSink):
+    """
+    결과를 청크 단위로 엑셀 파일에 저장
+
+    Args:
+        chunk_size: 한 번에 기록할 레코드 수
+        sheet_name: 시트 이름
+    """
+    extension = "xlsx"
+
+    def __init__(self, name: str, output_dir: str = ".", chunk_size: int = 1000, sheet_name: str = "데이터"):
+        super().__init__(name, output_dir)
+        self.chunk_size = chunk_size
+        self.sheet_name = sheet_name
+        self.buffer = []
+        self.columns = None
+        self.next_row = 0
+        self.writer = pd.ExcelWriter(self.path, engine='openpyxl')
+
+    def write(self, record: dict):
+        self.buffer.append(record)
+        self.count += 1
+
+        if len(self.buffer) >= self.chunk_size:
+            self._flush()
+
+    def close(self):
+        if self.writer is None: return
+
+        self._flush()
+        # 빈 결과여도 유효한 엑셀 파일이 되도록 빈 시트 생성
+        if self.columns is None:
+            pd.DataFrame().to_excel(self.writer, sheet_name=self.sheet_name, index=False)
+
+        self.writer.close()
+        self.writer = None
+
+    def _flush(self):
+        if not self.buffer: return
+
+        chunk_df = pd.DataFrame([_to_cells(record) for record in self.buffer])
+
+        # 첫 번째 청크의 컬럼을 기준으로 이후 청크의 컬럼 순서를 맞춤
+        is_first = self.columns is None
+        if is_first:
+            self.columns = list(chunk_df.columns)
+        chunk_df = chunk_df.reindex(columns=self.columns)
+
+        chunk_df.to_excel(
+            self.writer,
+            sheet_name=self.sheet_name,
+            index=False,
+            startrow=self.next_row,
+            header=is_first
+        )
+
+        # 헤더 1줄 + 기록한 행 수만큼 다음 시작 행 이동
+        self.next_row += len(chunk_df) + (1 if is_first else 0)
+        self.buffer = []
+
+
+def _to_cells(record: dict) -> dict:
+    """리스트/딕셔너리 값은 엑셀 셀에 쓸 수 있도록 JSON 문자열로 변환"""
+    return {
+        key: json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value
+        for key, value in record.items()
+    }
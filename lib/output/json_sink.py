@@ -0,0 +1,29 @@
+import os
+import json
+
+from lib.output.base import OutputSink
+
+
+class JsonSink(OutputSink):
+    """전체 결과를 하나의 JSON 배열로 저장 (close 시점에 기록, 실패한 실행은 기록하지 않음)"""
+    extension = "json"
+
+    def __init__(self, name: str, output_dir: str = ".", indent: int = 4):
+        super().__init__(name, output_dir)
+        self.indent = indent
+        self.records = []
+
+    def write(self, record: dict):
+        self.records.append(record)
+        self.count += 1
+
+    def close(self):
+        # 임시 파일에 기록 후 교체 (쓰는 중에 중단되어도 기존 파일 유지)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f, ensure_ascii=False, indent=self.indent)
+        os.replace(tmp_path, self.path)
+
+    def abort(self):
+        # 일부 결과로 기존 파일(델타 모드 스냅샷)을 덮어쓰지 않음
+        self.records = []
@@ -0,0 +1,21 @@
+import json
+
+from lib.output.base import OutputSink
+
+
+class NdjsonSink(OutputSink):
+    """레코드를 한 줄에 하나씩 즉시 기록 (다운스트림에서 점진적으로 읽을 수 있음)"""
+    extension = "ndjson"
+
+    def __init__(self, name: str, output_dir: str = "."):
+        super().__init__(name, output_dir)
+        self.file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, record: dict):
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
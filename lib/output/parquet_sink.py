@@ -0,0 +1,131 @@
+import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from lib.output.base import OutputSink
+
+BUSINESS_HOURS_TYPE = pa.list_(pa.struct([
+    ('name', pa.string()),
+    ('weekdays', pa.string()),
+    ('weekends', pa.string()),
+    ('offdays', pa.list_(pa.string())),
+]))
+
+BUSINESS_HOURS_MINUTES_TYPE = pa.list_(pa.struct([
+    ('name', pa.string()),
+    ('weekdays', pa.list_(pa.int32())),
+    ('weekends', pa.list_(pa.int32())),
+    ('offdays', pa.list_(pa.int8())),
+    ('intervals', pa.list_(pa.struct([
+        ('day', pa.string()),
+        ('open', pa.int32()),
+        ('close', pa.int32()),
+    ]))),
+]))
+
+MENUS_TYPE = pa.list_(pa.struct([
+    ('type', pa.string()),
+    ('name', pa.string()),
+    ('weight_range', pa.string()),
+    ('price', pa.int64()),
+    ('count', pa.int64()),
+    ('package', pa.string()),
+    ('note', pa.string()),
+]))
+
+PLACE_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('name', pa.string()),
+    ('tel', pa.string()),
+    ('address', pa.string()),
+    ('road_address', pa.string()),
+    ('lat', pa.float64()),
+    ('lng', pa.float64()),
+    ('thumbnail_s3_key', pa.string()),
+    ('menu_image_s3_keys', pa.list_(pa.string())),
+    ('business_hours', BUSINESS_HOURS_TYPE),
+    ('business_hours_minutes', BUSINESS_HOURS_MINUTES_TYPE),
+    ('menus', MENUS_TYPE),
+    ('review_counts', pa.struct([('방문자리뷰', pa.int64()), ('블로그리뷰', pa.int64())])),
+    ('links', pa.list_(pa.struct([('name', pa.string()), ('url', pa.string())]))),
+    ('categories', pa.list_(pa.string())),
+    # 서비스 항목은 키가 고정되어 있지 않아 JSON 문자열로 저장
+    ('services', pa.string()),
+    ('change_signature', pa.string()),
+    ('duplicate_of', pa.int64()),
+])
+
+
+class ParquetSink(OutputSink):
+    """
+    결과를 Parquet 파일로 저장 (menus, business_hours 등은 중첩 컬럼)
+
+    Args:
+        row_group_size: row group 하나에 담을 레코드 수
+    """
+    extension = "parquet"
+
+    def __init__(self, name: str, output_dir: str = ".", row_group_size: int = 1000, schema: pa.Schema = PLACE_SCHEMA):
+        super().__init__(name, output_dir)
+        self.row_group_size = row_group_size
+        self.schema = schema
+        self.buffer = []
+        self.writer = pq.ParquetWriter(self.path, self.schema)
+
+    def write(self, record: dict):
+        self.buffer.append(_to_row(record))
+        self.count += 1
+
+        if len(self.buffer) >= self.row_group_size:
+            self._flush()
+
+    def close(self):
+        if self.writer is None: return
+
+        self._flush()
+        self.writer.close()
+        self.writer = None
+
+    def _flush(self):
+        if not self.buffer: return
+
+        table = pa.Table.from_pylist(self.buffer, schema=self.schema)
+        self.writer.write_table(table)
+        self.buffer = []
+
+
+def _to_row(record: dict) -> dict:
+    """스키마 타입에 맞게 값 변환"""
+    row = {name: record.get(name) for name in PLACE_SCHEMA.names}
+
+    row['id'] = _to_int(row['id'])
+    row['duplicate_of'] = _to_int(row['duplicate_of'])
+    row['lat'] = _to_float(row['lat'])
+    row['lng'] = _to_float(row['lng'])
+    row['menus'] = [
+        {
+            **{key: _to_str(menu.get(key)) for key in ['type', 'name', 'weight_range', 'package', 'note']},
+            "price": _to_int(menu.get('price')),
+            "count": _to_int(menu.get('count')),
+        }
+        for menu in (row['menus'] or [])
+    ]
+    if row['services'] is not None:
+        row['services'] = json.dumps(row['services'], ensure_ascii=False)
+
+    return row
+
+def _to_int(value):
+    try:
+        return int(value) if value not in (None, '') else None
+    except (ValueError, TypeError):
+        return None
+
+def _to_float(value):
+    try:
+        return float(value) if value not in (None, '') else None
+    except (ValueError, TypeError):
+        return None
+
+def _to_str(value):
+    return None if value is None else str(value)
@@ -0,0 +1,226 @@
+import json
+import time
+import sqlite3
+
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_DB_PATH = "places.db"
+# 한 번에 기존 행을 조회할 ID 수 (SQLite 변수 개수 제한)
+LOOKUP_BATCH = 500
+REVIEW_FIELDS = {'visitor': '방문자리뷰', 'blog': '블로그리뷰'}
+
+
+class PlaceDB:
+    """
+    장소 결과를 누적 저장하는 SQLite 데이터베이스 (JSON1)
+
+    장소는 ID로 upsert하며, 전체 레코드는 JSON(`data`)으로, 필드별 마지막 변경 시각은 `field_updated`에 저장합니다.
+    지역, 카테고리, 리뷰 수로 조회할 수 있도록 색인합니다. (리뷰 수는 `data`에서 추출한 생성 컬럼)
+
+    Args:
+        path: 데이터베이스 파일 경로
+    """
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            # 여러 워커가 같은 DB를 공유해도 읽기가 쓰기를 기다리지 않도록 WAL 사용 (DB 파일에 유지됨)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS places (
+                    id INTEGER PRIMARY KEY,
+                    region TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    field_updated TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    visitor_reviews INTEGER GENERATED ALWAYS AS (json_extract(data, '$.review_counts.{REVIEW_FIELDS['visitor']}')) VIRTUAL,
+                    blog_reviews INTEGER GENERATED ALWAYS AS (json_extract(data, '$.review_counts.{REVIEW_FIELDS['blog']}')) VIRTUAL
+                );
+                CREATE TABLE IF NOT EXISTS place_categories (
+                    category TEXT NOT NULL,
+                    place_id INTEGER NOT NULL REFERENCES places (id) ON DELETE CASCADE,
+                    PRIMARY KEY (category, place_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_places_region ON places (region, updated_at);
+                CREATE INDEX IF NOT EXISTS idx_places_visitor_reviews ON places (visitor_reviews);
+                CREATE INDEX IF NOT EXISTS idx_places_blog_reviews ON places (blog_reviews);
+                CREATE INDEX IF NOT EXISTS idx_place_categories_place ON place_categories (place_id);
+            """)
+
+    @contextmanager
+    def _connect(self, write: bool = False):
+        """트랜잭션 연결 (쓰기는 시작 시 쓰기 잠금을 잡고, 읽기는 잠금 없이 스냅샷을 읽음)"""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def upsert(self, region: str, places: Iterable[dict]) -> dict:
+        """
+        장소를 ID로 삽입/갱신
+
+        기존 레코드에 새 값을 덮어쓰며(새 레코드에 없는 필드는 유지), 값이 바뀐 필드만 변경 시각을 갱신합니다.
+        바뀐 필드가 없는 장소는 쓰지 않습니다.
+
+        Returns:
+            {"inserted": 삽입 수, "updated": 갱신 수, "unchanged": 변경 없음 수}
+        """
+        places = [place for place in places if place.get('id') is not None]
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        now = time.time()
+
+        with self._connect(write=True) as conn:
+            existing = self._load(conn, [place['id'] for place in places])
+
+            for place in places:
+                place_id = int(place['id'])
+                # JSON으로 저장했다가 읽은 값과 비교 (튜플/리스트 등 표현 차이 제거)
+                new_data = json.loads(json.dumps(place, ensure_ascii=False))
+                new_data['id'] = place_id
+
+                if (previous := existing.get(place_id)) is None:
+                    field_updated = {key: now for key in new_data}
+                    data = new_data
+                    counts["inserted"] += 1
+                else:
+                    data, field_updated, previous_region = previous
+                    changed = [key for key, value in new_data.items() if key not in data or data[key] != value]
+                    if not changed and previous_region == region:
+                        counts["unchanged"] += 1
+                        continue
+
+                    data = {**data, **new_data}
+                    field_updated = {**field_updated, **{key: now for key in changed}}
+                    counts["updated"] += 1
+
+                conn.execute("""
+                    INSERT INTO places (id, region, data, field_updated, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET
+                        region = excluded.region,
+                        data = excluded.data,
+                        field_updated = excluded.field_updated,
+                        updated_at = excluded.updated_at
+                """, (place_id, region, json.dumps(data, ensure_ascii=False), json.dumps(field_updated), now, now))
+
+                conn.execute("DELETE FROM place_categories WHERE place_id = ?", (place_id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO place_categories (category, place_id) VALUES (?, ?)",
+                    [(category, place_id) for category in data.get('categories') or []]
+                )
+
+        log.info(f"장소 DB 저장 ({region}) - 추가 {counts['inserted']}, 갱신 {counts['updated']}, 변경 없음 {counts['unchanged']}")
+        return counts
+
+    def get(self, place_id) -> Optional[dict]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT data FROM places WHERE id = ?", (int(place_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def records(self, place_ids: Iterable[Any]) -> Dict[int, tuple]:
+        """ID별 (지역, 레코드) (없는 ID는 제외)"""
+        with self._connect() as conn:
+            return {place_id: (region, data) for place_id, (data, _, region) in self._load(conn, list(place_ids)).items()}
+
+    def field_updated(self, place_id) -> Dict[str, float]:
+        """필드별 마지막 변경 시각 (unix time)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT field_updated FROM places WHERE id = ?", (int(place_id),)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def query(
+            self,
+            region: str = None,
+            category: str = None,
+            min_reviews: int = None,
+            review_type: str = 'visitor',
+            updated_since: float = None,
+            field: str = None,
+            order_by_reviews: bool = False,
+            limit: int = None,
+            fields: List[str] = None
+        ) -> List[dict]:
+        """
+        조건에 맞는 장소 조회
+
+        Args:
+            region: 지역 이름
+            category: 카테고리 (LLM 분류 결과)
+            min_reviews: 최소 리뷰 수
+            review_type: 리뷰 종류 ('visitor' | 'blog')
+            updated_since: 이 시각(unix time) 이후 변경된 장소만 (field를 지정하면 해당 필드 기준)
+            order_by_reviews: 리뷰 수 많은 순으로 정렬
+            fields: 반환할 필드 (없으면 전체)
+        """
+        review_column = f"{review_type}_reviews"
+        if review_type not in REVIEW_FIELDS:
+            raise ValueError(f"알 수 없는 리뷰 종류: {review_type}")
+
+        conditions, params = [], []
+        if region is not None:
+            conditions.append("p.region = ?")
+            params.append(region)
+        if category is not None:
+            conditions.append("p.id IN (SELECT place_id FROM place_categories WHERE category = ?)")
+            params.append(category)
+        if min_reviews is not None:
+            conditions.append(f"p.{review_column} >= ?")
+            params.append(min_reviews)
+        if updated_since is not None:
+            if field is None:
+                conditions.append("p.updated_at >= ?")
+            else:
+                conditions.append("json_extract(p.field_updated, '$.' || ?) >= ?")
+                params.append(field)
+            params.append(updated_since)
+
+        sql = "SELECT p.data FROM places p"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY p.{review_column} DESC" if order_by_reviews else " ORDER BY p.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        places = [json.loads(data) for (data,) in rows]
+        if fields is not None:
+            places = [{key: place.get(key) for key in fields} for place in places]
+        return places
+
+    def snapshot(self, region: str) -> Dict[Any, dict]:
+        """지역의 이전 결과를 ID를 키로 하는 딕셔너리로 반환 (델타 모드의 `load_snapshot` 대신 사용)"""
+        return {place['id']: place for place in self.query(region=region)}
+
+    def count(self, region: str = None) -> int:
+        with self._connect() as conn:
+            if region is None:
+                return conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM places WHERE region = ?", (region,)).fetchone()[0]
+
+    def _load(self, conn: sqlite3.Connection, place_ids: List[Any]) -> Dict[int, tuple]:
+        """기존 행의 (data, field_updated, region)"""
+        rows = {}
+        place_ids = [int(place_id) for place_id in place_ids]
+        for i in range(0, len(place_ids), LOOKUP_BATCH):
+            batch = place_ids[i:i + LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for place_id, data, field_updated, region in conn.execute(
+                f"SELECT id, data, field_updated, region FROM places WHERE id IN ({placeholders})", batch
+            ):
+                rows[place_id] = (json.loads(data), json.loads(field_updated), region)
+        return rows
@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class PlaceRecord:
+    """
+    장소 하나의 단계별 수집 결과
+
+    단계 함수들이 딕셔너리처럼 읽을 수 있도록 `place['name']`, `place.get('links')`, `'name' in place`를 지원합니다.
+    아직 수집되지 않은 필드는 None입니다.
+    """
+    id: Any
+
+    # 1. 네이버 지도 검색
+    name: Optional[str] = None
+    tel: Optional[str] = None
+    address: Optional[str] = None
+    road_address: Optional[str] = None
+    lat: Optional[str] = None
+    lng: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    # 근처에 같은 업체로 보이는 장소가 있으면 그 장소의 ID
+    duplicate_of: Optional[Any] = None
+
+    # 2. 네이버 플레이스 상세
+    menu_image_urls: list = field(default_factory=list)
+    new_business_hours: Optional[list] = None
+    menus: Optional[list] = None
+    review_counts: Optional[dict] = None
+    links: list = field(default_factory=list)
+    description: Optional[str] = None
+    keywords: Optional[list] = None
+    conveniences: Optional[list] = None
+    parking: Optional[bool] = None
+    valet_parking: Optional[bool] = None
+
+    # 영업 시간 정규화 / 변경 감지
+    business_hours: Optional[list] = None
+    business_hours_minutes: Optional[list] = None
+    change_signature: Optional[str] = None
+
+    # 3. 홈페이지 콘텐츠
+    page_content: Optional[str] = None
+
+    # 4. 이미지 업로드
+    thumbnail_s3_key: Optional[str] = None
+    menu_image_s3_keys: Optional[list] = None
+
+    # 5. LLM 분류 결과
+    categories: Optional[list] = None
+    services: Optional[Any] = None
+
+    # 완료한 단계 이름
+    stages: set = field(default_factory=set)
+
+    def __getitem__(self, key: str):
+        if key not in FIELD_NAMES:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in FIELD_NAMES
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key) if key in FIELD_NAMES else None
+        return default if value is None else value
+
+    def to_dict(self, keys: Iterable[str] = None) -> dict:
+        """keys 순서대로 필드를 딕셔너리로 반환 (수집되지 않은 필드는 None)"""
+        keys = FIELD_ORDER if keys is None else keys
+        return {key: getattr(self, key) for key in keys if key in FIELD_NAMES}
+
+
+FIELD_ORDER = [f.name for f in fields(PlaceRecord) if f.name != 'stages']
+FIELD_NAMES = frozenset(FIELD_ORDER)
+
+# 결과 파일에 저장할 필드
+OUTPUT_FIELDS = ['id', 'name', 'tel', 'address', 'thumbnail_s3_key', 'menu_image_s3_keys', 'road_address', 'lat', 'lng', 'business_hours', 'business_hours_minutes', 'menus', 'review_counts', 'links', 'categories', 'services', 'change_signature', 'duplicate_of']
+# LLM 요청 이후 사용하지 않는 대용량 중간 필드
+INTERMEDIATE_FIELDS = ['page_content', 'new_business_hours', 'description', 'keywords', 'conveniences']
+
+
+class PlaceStore:
+    """
+    ID로 색인된 장소 저장소
+
+    각 단계는 `{"id": ..., 필드: 값}` 결과 리스트를 `update`로 기록하고, 저장소는 장소별로 완료한 단계를 추적합니다.
+    결과 리스트를 매번 병합해 새 리스트를 만들지 않으며, 다 쓴 대용량 필드(page_content 등)는 `drop`으로 해제합니다.
+    """
+    def __init__(self, place_list: Iterable[dict] = ()):
+        self.records: Dict[Any, PlaceRecord] = {}
+        self.update('search', place_list, create=True)
+
+    def update(self, stage: str, results: Iterable[dict], create: bool = False) -> int:
+        """
+        단계 결과 기록
+
+        Args:
+            stage: 단계 이름
+            results: `id`를 포함한 결과 딕셔너리 리스트 (모르는 필드는 무시)
+            create: 저장소에 없는 ID면 새로 추가할지 여부 (False면 무시)
+
+        Returns:
+            기록된 장소 수
+        """
+        updated = 0
+        unknown = 0
+        for result in results:
+            if not result or 'id' not in result:
+                continue
+
+            key = _normalize_id(result['id'])
+            record = self.records.get(key)
+            if record is None:
+                if not create:
+                    unknown += 1
+                    continue
+                record = self.records[key] = PlaceRecord(id=key)
+
+            for name, value in result.items():
+                if name != 'id' and name in FIELD_NAMES:
+                    setattr(record, name, value)
+            record.stages.add(stage)
+            updated += 1
+
+        missing = len(self.records) - updated
+        if missing > 0 or unknown:
+            log.warning(f"[{stage}] {updated}/{len(self.records)}개 장소 기록 (결과 없음 {missing}개, 알 수 없는 ID {unknown}개)")
+        return updated
+
+    def drop(self, *names: str):
+        """모든 장소에서 더 이상 필요 없는 필드 해제"""
+        for record in self.records.values():
+            for name in names:
+                setattr(record, name, None)
+
+    def keep(self, ids: Iterable[Any]):
+        """ids에 해당하는 장소만 남김"""
+        keys = {_normalize_id(place_id) for place_id in ids}
+        self.records = {key: record for key, record in self.records.items() if key in keys}
+
+    def missing(self, stage: str) -> List[PlaceRecord]:
+        """stage를 완료하지 못한 장소"""
+        return [record for record in self.records.values() if stage not in record.stages]
+
+    def ids(self) -> List[Any]:
+        return list(self.records)
+
+    def values(self) -> List[PlaceRecord]:
+        return list(self.records.values())
+
+    def to_dicts(self, keys: Iterable[str] = None) -> List[dict]:
+        keys = list(keys) if keys is not None else None
+        return [record.to_dict(keys) for record in self.records.values()]
+
+    def __getitem__(self, place_id) -> PlaceRecord:
+        return self.records[_normalize_id(place_id)]
+
+    def __iter__(self) -> Iterator[PlaceRecord]:
+        return iter(self.records.values())
+
+    def __len__(self):
+        return len(self.records)
+
+
+def _normalize_id(place_id):
+    """검색 결과(문자열)와 상세 스크래핑 결과(정수)의 ID를 같은 키로 사용"""
+    if isinstance(place_id, str) and place_id.isdigit():
+        return int(place_id)
+    return place_id
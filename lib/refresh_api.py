@@ -0,0 +1,197 @@
+import json
+import time
+import asyncio
+import argparse
+import threading
+
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, List, Optional
+
+from lib.delta_refresh import change_signature
+from lib.logger import get_logger
+from lib.metrics import get_metrics
+from lib.place_db import PlaceDB
+from lib.place_store import PlaceStore, OUTPUT_FIELDS, INTERMEDIATE_FIELDS
+
+log = get_logger(__name__)
+metrics = get_metrics()
+
+# 한 번에 갱신할 수 있는 최대 장소 수 (지역 전체는 main.py 배치 실행 사용)
+MAX_PLACES = 50
+
+
+class RefreshService:
+    """
+    지정한 장소만 즉시 갱신하는 API
+
+    상세 스크래핑 → 영업 시간 정규화 → 홈페이지 크롤링 → 가격표 이미지 업로드 → LLM 요청(Batch API 대신 동기 요청) 순서로 처리합니다.
+    썸네일 URL은 검색 결과에만 있으므로 썸네일은 다시 업로드하지 않고 DB에 저장된 thumbnail_s3_key를 유지합니다.
+    송신 경로 세션, 파싱 프로세스 풀, S3/OpenAI 클라이언트는 프로세스 단위 싱글턴이므로 같은 프로세스에서 반복 호출하면
+    연결과 캐시를 그대로 재사용합니다. (`warm`으로 미리 생성 가능)
+
+    Args:
+        db: 이전 결과(이름, 썸네일 S3 키 등 검색 단계 필드와 지역)를 읽고 갱신 결과를 저장할 장소 DB
+    """
+    def __init__(self, db: Optional[PlaceDB] = None):
+        self.db = db
+        self.lock = threading.Lock()
+
+    def warm(self):
+        """풀과 클라이언트를 미리 생성 (첫 요청 지연 제거)"""
+        from lib.egress_pool import get_egress_pool
+        from lib.scrapper.parse_pool import get_parse_pool
+        from lib.s3_uploader import get_s3_client
+        from lib.ai.gpt_batch_api import get_client
+        from utils.url_filter import get_url_filter
+
+        for create in (get_egress_pool, get_parse_pool, get_url_filter, get_s3_client, get_client):
+            try:
+                create()
+            except Exception as e:
+                log.warning(f"미리 생성 실패 ({create.__name__}): {e}")
+
+    def refresh(self, place_ids: Iterable[Any], region: str = None) -> List[dict]:
+        """장소들을 갱신해 결과 반환 (동기 호출용, 이벤트 루프 안에서는 `refresh_async` 사용)"""
+        return asyncio.run(self.refresh_async(place_ids, region))
+
+    async def refresh_async(self, place_ids: Iterable[Any], region: str = None) -> List[dict]:
+        """
+        장소들을 갱신해 결과 반환 (main.py 결과 파일과 같은 필드)
+
+        스크래핑, 영업 시간 정규화, LLM 요청, DB 읽기/쓰기 등 블로킹 단계는 `asyncio.to_thread`로 실행해 호출한 이벤트 루프를 막지 않습니다.
+
+        Args:
+            place_ids: 네이버 플레이스 ID 리스트
+            region: 지역 이름 (S3 경로, DB 지역), 없으면 DB에 저장된 지역 사용
+
+        Raises:
+            ValueError: 장소 수가 MAX_PLACES를 넘거나, 지역을 알 수 없는 장소가 있는 경우
+        """
+        place_ids = list(dict.fromkeys(int(place_id) for place_id in place_ids))
+        if len(place_ids) > MAX_PLACES:
+            raise ValueError(f"한 번에 최대 {MAX_PLACES}개 장소까지 갱신할 수 있습니다. ({len(place_ids)}개)")
+
+        records = await asyncio.to_thread(self.db.records, place_ids) if self.db else {}
+        unknown = [place_id for place_id in place_ids if region is None and place_id not in records]
+        if unknown:
+            raise ValueError(f"지역을 알 수 없는 장소: {unknown} (region을 지정하세요)")
+
+        # 지역별로 나눠 처리 (S3 경로와 DB 지역이 지역 단위)
+        regions = defaultdict(list)
+        for place_id in place_ids:
+            previous_region, data = records.get(place_id, (None, {"id": place_id}))
+            regions[region or previous_region].append(data)
+
+        start_time = time.time()
+        results = []
+        for place_region, place_list in regions.items():
+            place_results = await self._refresh(place_region, place_list)
+            if self.db:
+                await asyncio.to_thread(self.db.upsert, place_region, place_results)
+            results += place_results
+
+        elapsed_time = time.time() - start_time
+        metrics.observe('refresh_seconds', elapsed_time)
+        log.info(f"장소 갱신 완료 - {len(results)}/{len(place_ids)}개, 소요 시간: {elapsed_time:.2f}초")
+        return results
+
+    async def _refresh(self, region: str, place_list: List[dict]) -> List[dict]:
+        from lib.scrapper.scrape_naver_places import scrape_naver_places
+        from lib.scrapper.business_hours import normalize_business_hours
+        from lib.scrapper.scrape_page_content import scrape_page_content
+        from lib.request_batch_api import request_sync_api
+        from lib.s3_uploader import upload_place_images
+
+        store = PlaceStore(place_list)
+
+        # 상세 정보 (DB에 없는 장소는 이름, 주소 등 기본 정보도 상세 페이지에서 추출)
+        store.update('naver_place', await asyncio.to_thread(scrape_naver_places, store.ids(), include_base=True))
+        store.keep(place.id for place in store if 'naver_place' in place.stages)
+        if not len(store):
+            return []
+
+        store.update('business_hours', await asyncio.to_thread(normalize_business_hours, store.values()))
+        store.update('change_signature', [{"id": place.id, "change_signature": change_signature(place)} for place in store])
+
+        place_link_map = [{ place.id: [i['url'] for i in place.links] } for place in store]
+        store.update('page_content', await asyncio.to_thread(scrape_page_content, place_link_map))
+        store.update('upload_images', await upload_place_images(region, store.values(), thumbnails=False))
+        store.update('llm', await asyncio.to_thread(request_sync_api, store.values()))
+        store.drop(*INTERMEDIATE_FIELDS)
+
+        return store.to_dicts(OUTPUT_FIELDS)
+
+    def serve(self, port: int = 8090, host: str = '127.0.0.1'):
+        """
+        로컬 HTTP 서비스 실행 (블로킹)
+
+            POST /refresh {"ids": [장소 ID, ...], "region": "서초구"} -> 갱신 결과 리스트
+            GET /health
+        """
+        service = self
+
+        class RefreshHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/health':
+                    self.send_error(404)
+                    return
+                self._send_json(200, {"status": "ok"})
+
+            def do_POST(self):
+                if self.path.rstrip('/') != '/refresh':
+                    self.send_error(404)
+                    return
+
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+                    # 같은 장소를 동시에 갱신하지 않도록 요청 단위로 순서대로 처리
+                    with service.lock:
+                        results = service.refresh(body.get('ids') or [], body.get('region'))
+                except (ValueError, TypeError) as e:
+                    self._send_json(400, {"error": str(e)})
+                    return
+                except Exception as e:
+                    log.error(f"갱신 실패: {e}")
+                    self._send_json(500, {"error": str(e)})
+                    return
+
+                self._send_json(200, results)
+
+            def _send_json(self, status: int, payload):
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), RefreshHandler)
+        log.info(f"장소 갱신 서버 실행: http://{host}:{port}/refresh")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='지정한 장소 즉시 갱신')
+    parser.add_argument('ids', nargs='*', type=int, help='네이버 플레이스 ID')
+    parser.add_argument('--region', help='지역 이름 (없으면 DB에 저장된 지역)')
+    parser.add_argument('--db', help='장소 DB(SQLite) 경로')
+    parser.add_argument('--serve', action='store_true', help='로컬 HTTP 서비스로 실행')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    args = parser.parse_args()
+
+    service = RefreshService(PlaceDB(args.db) if args.db else None)
+    if args.serve:
+        service.warm()
+        service.serve(args.port, args.host)
+    elif args.ids:
+        print(json.dumps(service.refresh(args.ids, args.region), ensure_ascii=False, indent=4))
+    else:
+        parser.error('갱신할 장소 ID 또는 --serve를 지정하세요.')
@@ -0,0 +1,163 @@
+import io
+import os
+import json
+import glob
+import hashlib
+import requests
+
+from typing import Optional
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+# 'record': 실제 요청 후 응답을 코퍼스에 저장, 'replay': 네트워크 없이 코퍼스에서 응답 재생
+TRANSPORT_MODE = os.getenv("SCRAPER_TRANSPORT", "")
+CORPUS_DIR = os.getenv("SCRAPER_CORPUS_DIR", "benchmarks/corpus")
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 제외
+_SKIP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class ReplayMissError(requests.ConnectionError):
+    """코퍼스에 기록되지 않은 요청 (재시도해도 결과가 같음)"""
+
+
+class ResponseCorpus:
+    """
+    URL 단위로 응답(상태 코드, 헤더, 본문)을 저장하는 로컬 코퍼스
+
+    `{key}.json`에 메타데이터, `{key}.body`에 본문 바이트를 저장합니다.
+    """
+    def __init__(self, path: str = CORPUS_DIR):
+        self.path = path
+
+    def save(self, method: str, url: str, response: requests.Response):
+        os.makedirs(self.path, exist_ok=True)
+        key = _corpus_key(method, url)
+
+        with open(os.path.join(self.path, f"{key}.body"), 'wb') as f:
+            f.write(response.content)
+
+        meta = {
+            "method": method,
+            "url": url,
+            "status_code": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS},
+        }
+        with open(os.path.join(self.path, f"{key}.json"), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=4)
+
+    def load(self, method: str, url: str):
+        """(메타데이터, 본문) 튜플 반환, 없으면 None"""
+        key = _corpus_key(method, url)
+        meta_path = os.path.join(self.path, f"{key}.json")
+        if not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(os.path.join(self.path, f"{key}.body"), 'rb') as f:
+            body = f.read()
+
+        return meta, body
+
+    def entries(self):
+        """저장된 모든 응답의 (메타데이터, 본문) 제너레이터"""
+        for meta_path in sorted(glob.glob(os.path.join(self.path, "*.json"))):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(meta_path[:-len(".json")] + ".body", 'rb') as f:
+                yield meta, f.read()
+
+
+class SourceAddressAdapter(HTTPAdapter):
+    """지정한 로컬 IP로 연결하는 어댑터 (서버에 IP가 여러 개인 경우, 지정하지 않으면 HTTPAdapter와 동일)"""
+    def __init__(self, source_address: Optional[str] = None, **kwargs):
+        self.source_address = (source_address, 0) if source_address else None
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.source_address:
+            kwargs['source_address'] = self.source_address
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        if self.source_address:
+            kwargs['source_address'] = self.source_address
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+class RecordingAdapter(SourceAddressAdapter):
+    """실제로 요청을 보내고 응답을 코퍼스에 저장하는 어댑터"""
+    def __init__(self, corpus: ResponseCorpus, source_address: Optional[str] = None, **kwargs):
+        self.corpus = corpus
+        super().__init__(source_address, **kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        try:
+            self.corpus.save(request.method, request.url, response)
+        except OSError as e:
+            log.error(f"응답 저장 실패 ({request.url}): {e}")
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """코퍼스에 저장된 응답을 네트워크 없이 반환하는 어댑터"""
+    def __init__(self, corpus: ResponseCorpus):
+        super().__init__()
+        self.corpus = corpus
+
+    def send(self, request, **kwargs):
+        recorded = self.corpus.load(request.method, request.url)
+        if recorded is None:
+            raise ReplayMissError(f"재생할 응답 없음: {request.url}", request=request)
+
+        meta, body = recorded
+
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.reason = "REPLAY"
+        return response
+
+    def close(self):
+        pass
+
+
+def create_adapter(source_address: Optional[str] = None, **kwargs) -> BaseAdapter:
+    """
+    `SCRAPER_TRANSPORT` 설정에 따라 HTTP 어댑터를 생성합니다.
+
+    Args:
+        source_address: 연결에 사용할 로컬 IP (리플레이 모드에서는 네트워크를 사용하지 않으므로 무시)
+        **kwargs: HTTPAdapter 옵션 (pool_connections, pool_maxsize, max_retries 등)
+    """
+    if TRANSPORT_MODE == 'record':
+        return RecordingAdapter(ResponseCorpus(CORPUS_DIR), source_address, **kwargs)
+    if TRANSPORT_MODE == 'replay':
+        return ReplayAdapter(ResponseCorpus(CORPUS_DIR))
+    if source_address:
+        return SourceAddressAdapter(source_address, **kwargs)
+    return HTTPAdapter(**kwargs)
+
+def create_session(headers: dict = {}, **kwargs) -> requests.Session:
+    """`create_adapter` 어댑터를 마운트한 세션 생성"""
+    adapter = create_adapter(**kwargs)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(headers)
+    return session
+
+def _corpus_key(method: str, url: str) -> str:
+    return hashlib.sha1(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
@@ -1,11 +1,13 @@
 import os
 import json
 import time
+import tempfile
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 from utils.image_optimizer import ImageOptimizer
 from utils.file import read_text_file, encode_base64_image
-from lib.ai import get_service_prompt, get_batch_status, make_batch_option, batch_api, get_batch_result, cancel_batch
+from lib.ai import get_service_prompt, get_batch_status, make_batch_option, batch_api, get_batch_result, cancel_batch, chat_completion
 from lib.logger import get_logger
 
 
@@ -13,15 +15,17 @@ log = get_logger(__name__)
 
 def request_batch_api(place_datas: List[dict]):
     batch_options = _create_batch_options(place_datas)
-    file_name = f"batchinput.jsonl"
-    _create_jsonl(batch_options, file_name)
-    
-    response = batch_api(file_name)
-    batch_results = get_batch_api_response(response.id)
 
-    os.remove(file_name)
+    # 같은 작업 디렉터리를 쓰는 워커끼리 입력 파일이 겹치지 않도록 호출마다 임시 파일 사용
+    fd, file_name = tempfile.mkstemp(prefix='batchinput_', suffix='.jsonl')
+    os.close(fd)
+    try:
+        _create_jsonl(batch_options, file_name)
 
-    return batch_results
+        response = batch_api(file_name)
+        return get_batch_api_response(response.id)
+    finally:
+        os.remove(file_name)
 
 def request_batch_api_2(place_datas: List[dict], batch_count: int = 1):
     results = []
@@ -64,21 +68,36 @@ def request_batch_api_2(place_datas: List[dict], batch_count: int = 1):
     
     return results
 
+def request_sync_api(place_datas: List[dict], max_workers: int = 4) -> List[dict]:
+    """
+    Batch API 대신 장소마다 바로 요청 (소수 장소 즉시 갱신용, 결과 형식은 request_batch_api와 동일)
+    """
+    batch_options = _create_batch_options(place_datas)
+
+    def request(option: dict):
+        try:
+            return _to_result(chat_completion(option))
+        except Exception as e:
+            log.error(f"LLM 요청 실패 ({option['custom_id']}): {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [result for result in executor.map(request, batch_options) if result]
+
 def get_batch_api_response(batch_id: str) -> List[dict]:
     batch_api_status_loop(batch_id)
     
     response = get_batch_result(batch_id)
 
-    results = []
-    for res in response:
-        results.append({
-            "id": int(res['id']),
-            "categories": res['content']['categories'],
-            "services": res['content']['services'],
-            "menus": res['content']['menus']
-        })
+    return [_to_result(res) for res in response]
 
-    return results
+def _to_result(res: dict) -> dict:
+    return {
+        "id": int(res['id']),
+        "categories": res['content']['categories'],
+        "services": res['content']['services'],
+        "menus": res['content']['menus']
+    }
 
 def batch_api_status_loop(batch_id: str):
     while True:
@@ -94,33 +113,35 @@ def _create_batch_options(place_datas: List[dict]) -> List[dict]:
     system_messages = [get_service_prompt(), service_text]
 
     batch_options = []
-    for data in place_datas:
-        contents = [{
-            "type": "text",
-            "metadata": { "name": "content.json" },
-            "text": json.dumps(_parse_content(data), ensure_ascii=False, indent=4)
-        }]
-
-        output_path = f"temp/{data['id']}"
-        image_paths = _save_optimized_images(image_urls=data['menu_image_urls'], output_path=output_path)
-
-        for image_path in image_paths:
-            file_extension, base64_image = encode_base64_image(image_path)
-            contents.append({
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/{file_extension};base64,{base64_image}"
-                }
-            })
-
-        batch_option = make_batch_option(
-            request_id=data['id'],
-            system_messages=system_messages,
-            user_messages=contents,
-        )
-
-        batch_options.append(batch_option)
-    
+    # 이미지는 base64로 요청에 포함하므로 호출마다 임시 디렉터리에 저장하고 바로 삭제 (같은 장소를 처리하는 다른 워커와 겹치지 않음)
+    with tempfile.TemporaryDirectory(prefix='images_') as temp_dir:
+        for data in place_datas:
+            contents = [{
+                "type": "text",
+                "metadata": { "name": "content.json" },
+                "text": json.dumps(_parse_content(data), ensure_ascii=False, indent=4)
+            }]
+
+            output_path = os.path.join(temp_dir, str(data['id']))
+            image_paths = _save_optimized_images(image_urls=data['menu_image_urls'], output_path=output_path)
+
+            for image_path in image_paths:
+                file_extension, base64_image = encode_base64_image(image_path)
+                contents.append({
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:image/{file_extension};base64,{base64_image}"
+                    }
+                })
+
+            batch_option = make_batch_option(
+                request_id=data['id'],
+                system_messages=system_messages,
+                user_messages=contents,
+            )
+
+            batch_options.append(batch_option)
+
     return batch_options
 
 def _parse_content(content: dict) -> dict:
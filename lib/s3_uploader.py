@@ -1,22 +1,34 @@
 import os
+import time
 import requests
-import boto3
-import aiohttp
 import asyncio
 
+from functools import lru_cache
 from typing import List, Dict, Optional, Union
 from concurrent.futures import ThreadPoolExecutor
 from lib.logger import get_logger
+from lib.metrics import get_metrics
 
 log = get_logger(__name__)
+metrics = get_metrics()
+
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """S3 클라이언트 (처음 업로드할 때 생성, boto3 import 포함)"""
+    import boto3
+
+    return boto3.client(
+        "s3",
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
+    )
 
 class S3ImageUploader:
     def __init__(self):
-        access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
-        secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         bucket_name = os.getenv("AWS_BUCKET_NAME")
-        
-        self.s3 = boto3.client("s3", aws_access_key_id=access_key_id, aws_secret_access_key=secret_access_key)
+
+        self.s3 = get_s3_client()
         self.bucket = bucket_name
         
         MB = 1024 * 1024
@@ -66,23 +78,29 @@ class S3ImageUploader:
             )
             
         except Exception as e:
-            log.error(f"S3 업로드 실패 {key}: {e}")
+            log.error("S3 업로드 실패 %s: %s", key, e)
             return None
 
     async def upload_image(self, url: str, key: str):
         """단일 이미지 업로드"""
+        import aiohttp
+
         try:
             async with aiohttp.ClientSession() as session:
+                start = time.perf_counter()
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as r:
                     if r.status != 200:
                         raise Exception("유효하지 않은 URL입니다.")
                     
                     content = await r.read()
+                    metrics.record_response('s3_image', url, r.status, time.perf_counter() - start, len(content))
                     
                     loop = asyncio.get_event_loop()
-                    return await loop.run_in_executor(None, self._upload_content_to_s3, content, key)
+                    with metrics.timer('s3_upload_seconds'):
+                        return await loop.run_in_executor(None, self._upload_content_to_s3, content, key)
         except Exception as e:
-            log.error(f"이미지 업로드 실패 {url}: {e}")
+            metrics.record_error('s3_image', url)
+            log.error("이미지 업로드 실패 %s: %s", url, e, extra={'stage': 's3_image', 'url': url})
             return None
 
     async def upload_multiple_images(self, image_data: List[Dict[str, str]], max_concurrent: int = 5) -> List[Optional[Dict]]:
@@ -94,4 +112,48 @@ class S3ImageUploader:
                 return await self.upload_image(item["url"], item["key"])
         
         tasks = [upload_with_limit(item) for item in image_data]
-        return await asyncio.gather(*tasks)
\ No newline at end of file
+        return await asyncio.gather(*tasks)
+
+
+async def upload_place_images(location: str, place_list: List[dict], thumbnails: bool = True) -> List[dict]:
+    """
+    장소들의 썸네일과 가격표 이미지를 `{지역}/{장소 ID}/` 아래에 업로드하고 S3 키를 반환
+
+    Args:
+        thumbnails: 썸네일 업로드 여부 (썸네일 URL은 검색 결과에만 있으므로, 검색 없이 갱신하는 경우 False)
+    """
+    uploader = S3ImageUploader()
+
+    results = []
+    upload_image_map = []
+    for place in place_list:
+        base_key = f"{location}/{place['id']}"
+
+        result = {"id": place['id']}
+
+        # 썸네일
+        if thumbnails and place['thumbnail_url']:
+            thumbnail_extension = place['thumbnail_url'].split('.')[-1]
+            result['thumbnail_s3_key'] = f"{base_key}/thumbnail.{thumbnail_extension}"
+            upload_image_map.append({
+                "url": place['thumbnail_url'],
+                "key": result['thumbnail_s3_key']
+            })
+
+        # 가격표 이미지
+        menu_image_s3_keys = []
+        for i, menu_image_url in enumerate(place['menu_image_urls']):
+            menu_image_extension = menu_image_url.split('.')[-1]
+            menu_image_s3_key = f"{base_key}/menu_images/{i}.{menu_image_extension}"
+            menu_image_s3_keys.append(menu_image_s3_key)
+            upload_image_map.append({
+                "url": menu_image_url,
+                "key": menu_image_s3_key
+            })
+
+        result['menu_image_s3_keys'] = menu_image_s3_keys
+        results.append(result)
+
+    await uploader.upload_multiple_images(upload_image_map)
+
+    return results
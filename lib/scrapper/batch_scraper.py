@@ -1,82 +1,263 @@
 import time
-import requests
+import pickle
 
+from lib.egress_pool import EgressPool, get_egress_pool
 from lib.logger import get_logger
-from typing import List, Optional, Callable, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from lib.metrics import get_metrics
+from lib.replay import TRANSPORT_MODE, ReplayMissError
+from lib.scrapper.page_source import PageSource, detect_encoding
+from lib.scrapper.parse_pool import get_parse_pool, timed_parse
+from lib.scrapper.rate_limiter import get_host_limiter, parse_retry_after
+from typing import List, Dict, Optional, Callable, Any
+from urllib.parse import urlparse
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from utils.http_client import DEFAULT_TIMEOUT, DEFAULT_TOTAL_TIMEOUT, DEFAULT_MAX_BYTES, ResponseTooLargeError, read_body
 
 log = get_logger(__name__)
+metrics = get_metrics()
+
+# 기본 요청 헤더 (송신 경로별 헤더가 우선)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
+}
+# 페이지가 없음을 나타내는 상태 코드 (`fetch(missing_ok=True)`에서 에러로 취급하지 않음)
+MISSING_STATUS = {404, 410}
 
 class BatchScraper:
-    def __init__(self, max_retries: int = 3, retry_delay: int = 1, max_workers: int = 10, headers: dict = {}):
+    def __init__(
+            self,
+            max_retries: int = 3,
+            retry_delay: int = 1,
+            max_workers: int = 10,
+            headers: dict = {},
+            stage: str = 'scrape',
+            egress_pool: EgressPool = None,
+            max_bytes: int = DEFAULT_MAX_BYTES,
+            timeout: tuple = DEFAULT_TIMEOUT,
+            total_timeout: float = DEFAULT_TOTAL_TIMEOUT,
+            parse_pool: Optional[Executor] = None,
+            use_parse_pool: bool = True
+        ):
+        self.stage = stage
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.max_workers = max_workers
+        self.egress_pool = egress_pool or get_egress_pool()
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.total_timeout = total_timeout
+        self.parse_pool = parse_pool
+        self.use_parse_pool = use_parse_pool
+        # 리플레이 모드에서는 실제 호스트에 요청하지 않으므로 속도 제한/송신 경로 상태를 사용하지 않음
+        self.throttle = TRANSPORT_MODE != 'replay'
 
-        self.session = self._create_session(headers)
-
-    def _create_session(self, headers: dict = {}):
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=20,
-            pool_maxsize=20,
-            max_retries=self.max_retries
-        )
-
-        session = requests.Session()
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
+        # 요청 헤더 (연결 풀/재시도 설정은 송신 경로 세션(endpoint.session)에서 관리)
+        self.headers = {**DEFAULT_HEADERS, **headers}
 
-        default_headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
-            **headers
-        }
-
-        session.headers.update(default_headers)
-        return session
-
-    def scrape_batch(self, urls: List[str], scrape_fn: Callable[[str], Any]) -> List[Any]:
+    def scrape_batch(self, urls: List[str], scrape_fn: Callable[[PageSource], Any]) -> List[Any]:
         """
         urls를 받아 각각 스크래핑된 결과를 반환
         """
-        results = []
+        return list(self.scrape_map(urls, scrape_fn).values())
+
+    def scrape_map(self, urls: List[str], scrape_fn: Callable[[PageSource], Any]) -> Dict[str, Any]:
+        """
+        urls를 받아 {url: 스크래핑 결과} 딕셔너리로 반환 (실패한 url은 제외)
+
+        수집은 스레드 풀에서, 파싱(scrape_fn)은 프로세스 풀에서 수행합니다. 수집이 끝난 페이지부터 바로 파싱을 넘기므로
+        파싱이 수집 스레드를 막지 않습니다. 프로세스 풀이 없으면 수집 스레드에서 파싱합니다.
+        scrape_fn은 프로세스 간에 전달할 수 있는 모듈 수준 함수(또는 그 partial)여야 합니다.
+        """
+        results = {}
         start_time = time.time()
-        
+        parse_pool = self._get_parse_pool()
+        if parse_pool is not None and not self._picklable(scrape_fn):
+            parse_pool = None
+
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_url = {
-                executor.submit(self._scraper, url, scrape_fn): url 
-                for url in urls
-            }
-            
-            # 완료된 작업들 처리
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    parsed_data = future.result()
-                    if parsed_data: results.append(parsed_data)
-                except Exception as e:
-                    log.error(f"[{url}] 처리 중 에러: {e}")
-        
-        log.info(f"{len(results)}/{len(urls)} 스크래핑 완료 (소요 시간: {time.time() - start_time:.2f}초)")
+            if parse_pool is None:
+                futures = {executor.submit(self._scraper, url, scrape_fn): url for url in urls}
+                for future in as_completed(futures):
+                    if parsed_data := future.result():
+                        results[futures[future]] = parsed_data
+            else:
+                fetch_futures = {executor.submit(self._fetch, url): url for url in urls}
+                parse_futures = {}
+                for future in as_completed(fetch_futures):
+                    if (page_source := future.result()) is None:
+                        continue
+
+                    url = fetch_futures[future]
+                    if parse_pool is not None:
+                        try:
+                            parse_futures[parse_pool.submit(timed_parse, scrape_fn, page_source)] = (url, page_source, parse_pool)
+                            continue
+                        except BrokenProcessPool as e:
+                            # 파싱 프로세스가 죽으면(OOM, 파서 segfault 등) 풀을 버리고 남은 페이지는 직접 파싱
+                            log.warning("[%s] 파싱 프로세스 풀 손상, 직접 파싱: %s", url, e, extra={'stage': self.stage, 'url': url})
+                            self._drop_parse_pool(parse_pool)
+                            parse_pool = None
+
+                    if parsed_data := self._parse(url, scrape_fn, page_source):
+                        results[url] = parsed_data
+
+                for future in as_completed(parse_futures):
+                    url, page_source, pool = parse_futures[future]
+                    if parsed_data := self._parse_result(future, pool, url, scrape_fn, page_source):
+                        results[url] = parsed_data
+
+        elapsed_time = time.time() - start_time
+        metrics.observe('batch_seconds', elapsed_time, stage=self.stage)
+        log.info("%d/%d 스크래핑 완료 (소요 시간: %.2f초)", len(results), len(urls), elapsed_time,
+                 extra={'stage': self.stage, 'latency': round(elapsed_time, 3)})
         return results
 
-    def _scraper(self, url: str, scrape_fn: Callable[[str], Any]) -> Optional[Any]:
+    def fetch(self, url: str, missing_ok: bool = False) -> Optional[PageSource]:
+        """
+        단일 url을 파싱 없이 수집 (속도 제한, 송신 경로, 크기/시간 제한, 메트릭 적용, 실패 시 None)
+
+        Args:
+            missing_ok: 404/410 응답을 재시도/에러 로그 없이 None으로 반환 (robots.txt 등 없을 수 있는 파일)
+        """
+        return self._fetch(url, missing_ok)
+
+    def _scraper(self, url: str, scrape_fn: Callable[[PageSource], Any]) -> Optional[Any]:
         """
-        단일 url에 대해 스크래핑 및 파싱 수행
+        단일 url에 대해 스크래핑 및 파싱 수행 (프로세스 풀을 사용하지 않는 경우)
         """
+        if (page_source := self._fetch(url)) is None:
+            return None
+        return self._parse(url, scrape_fn, page_source)
+
+    def _parse(self, url: str, scrape_fn: Callable[[PageSource], Any], page_source: PageSource) -> Optional[Any]:
+        """현재 스레드에서 파싱"""
+        try:
+            parsed_data, parse_seconds = timed_parse(scrape_fn, page_source)
+        except Exception as e:
+            metrics.record_error(self.stage, url)
+            log.error("[%s] 파싱 실패: %s", url, e, extra={'stage': self.stage, 'url': url})
+            return None
+
+        metrics.observe('parse_seconds', parse_seconds, stage=self.stage)
+        return parsed_data
+
+    def _parse_result(self, future, parse_pool: Executor, url: str, scrape_fn: Callable[[PageSource], Any], page_source: PageSource) -> Optional[Any]:
+        """프로세스 풀의 파싱 결과 (풀을 사용할 수 없으면 현재 스레드에서 파싱)"""
+        try:
+            parsed_data, parse_seconds = future.result()
+        except BrokenProcessPool as e:
+            log.warning("[%s] 파싱 프로세스 풀 손상, 직접 파싱: %s", url, e, extra={'stage': self.stage, 'url': url})
+            self._drop_parse_pool(parse_pool)
+            return self._parse(url, scrape_fn, page_source)
+        except pickle.PicklingError as e:
+            log.warning("[%s] 파싱 프로세스 사용 불가, 직접 파싱: %s", url, e, extra={'stage': self.stage, 'url': url})
+            return self._parse(url, scrape_fn, page_source)
+        except Exception as e:
+            metrics.record_error(self.stage, url)
+            log.error("[%s] 파싱 실패: %s", url, e, extra={'stage': self.stage, 'url': url})
+            return None
+
+        metrics.observe('parse_seconds', parse_seconds, stage=self.stage)
+        return parsed_data
+
+    def _get_parse_pool(self) -> Optional[Executor]:
+        """파싱 프로세스 풀 (지정하지 않으면 공유 풀, 손상된 공유 풀은 다시 생성)"""
+        if self.parse_pool is not None:
+            return self.parse_pool
+        return get_parse_pool() if self.use_parse_pool else None
+
+    def _drop_parse_pool(self, parse_pool: Executor):
+        """손상된 파싱 프로세스 풀 종료 (공유 풀이면 다음 배치에서 새로 생성, 지정한 풀이면 이후 직접 파싱)"""
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+        if parse_pool is self.parse_pool:
+            self.parse_pool = None
+            self.use_parse_pool = False
+        elif get_parse_pool.cache_info().currsize and get_parse_pool() is parse_pool:
+            get_parse_pool.cache_clear()
+
+    def _picklable(self, scrape_fn: Callable[[PageSource], Any]) -> bool:
+        """scrape_fn을 프로세스 풀에 넘길 수 있는지 확인 (람다, 지역 함수 등은 수집 스레드에서 파싱)"""
+        try:
+            pickle.dumps(scrape_fn)
+            return True
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            log.warning("[%s] 파싱 함수를 프로세스 풀에 넘길 수 없어 수집 스레드에서 파싱: %s", self.stage, e, extra={'stage': self.stage})
+            return False
+
+    def _record(self, limiter, endpoint, status: Optional[int], latency: float, retry_after: Optional[float] = None):
+        """응답 결과를 호스트 속도 제한과 송신 경로 상태에 반영 (리플레이 모드에서는 생략)"""
+        if limiter is None:
+            return
+        limiter.record(status, latency, retry_after)
+        endpoint.record(status)
+
+    def _fetch(self, url: str, missing_ok: bool = False) -> Optional[PageSource]:
+        """
+        단일 url 수집 (실패 시 None)
+
+        본문은 스트리밍으로 읽어 max_bytes를 넘으면 중단하고, 디코딩하지 않은 바이트와
+        감지한 인코딩을 PageSource로 반환합니다.
+        """
+        host = urlparse(url).netloc
+
         # 실패 시, max_retries 횟수만큼 반복
         for attempt in range(self.max_retries + 1):
             try:
-                response = self.session.get(url)
+                # 송신 경로 배정 (경로가 제외되면 재시도 시 다른 경로 사용)
+                endpoint = self.egress_pool.acquire(host, url)
+                limiter = get_host_limiter(host if len(self.egress_pool) == 1 else f"{host}@{endpoint.name}") if self.throttle else None
+
+                # 호스트(송신 경로) 단위 요청 속도 제한 (서킷이 열려 있으면 대기)
+                if limiter is not None:
+                    limiter.acquire()
+
+                start = time.perf_counter()
+                try:
+                    response = endpoint.session.get(
+                        url,
+                        headers={**self.headers, **endpoint.headers},
+                        timeout=self.timeout,
+                        stream=True
+                    )
+                except ReplayMissError:
+                    # 코퍼스에 없는 요청은 호스트 상태와 무관하므로 속도 제한/송신 경로에 반영하지 않음
+                    raise
+                except Exception:
+                    self._record(limiter, endpoint, None, time.perf_counter() - start)
+                    raise
+
+                # 속도 제한/송신 경로 상태는 헤더 수신 기준으로 기록
+                self._record(limiter, endpoint, response.status_code, time.perf_counter() - start,
+                             parse_retry_after(response.headers.get('Retry-After')))
+
+                try:
+                    # 에러 응답은 본문을 읽지 않음
+                    content = read_body(response, self.max_bytes, start, self.total_timeout) if response.ok else b''
+                finally:
+                    response.close()
+
+                metrics.record_response(self.stage, url, response.status_code, time.perf_counter() - start, len(content))
+                if missing_ok and response.status_code in MISSING_STATUS:
+                    return None
                 response.raise_for_status()
-                response.encoding = 'utf-8'
 
-                return scrape_fn(response)
+                return PageSource(
+                    url=response.url,
+                    content=content,
+                    encoding=detect_encoding(content, response.headers),
+                    status_code=response.status_code,
+                    headers=dict(response.headers)
+                )
             except Exception as e:
-                if attempt < self.max_retries:
-                    log.warning(f"[{url}] 재시도 {attempt + 1}/{self.max_retries}: 에러메시지[{e}]")
+                retry = attempt < self.max_retries and not isinstance(e, (ReplayMissError, ResponseTooLargeError))
+                metrics.record_error(self.stage, url, retry=retry)
+                if retry:
+                    log.warning("[%s] 재시도 %d/%d: 에러메시지[%s]", url, attempt + 1, self.max_retries, e,
+                                extra={'stage': self.stage, 'host': host, 'url': url, 'attempt': attempt + 1})
                     time.sleep(self.retry_delay * (2 ** attempt))
                 else:
-                    log.error(f"[{url}] 스크랩핑 실패: {e}")
+                    log.error("[%s] 스크랩핑 실패: %s", url, e, extra={'stage': self.stage, 'host': host, 'url': url})
                     return None
-        
-        return None
\ No newline at end of file
+
+        return None
@@ -0,0 +1,136 @@
+import time
+import queue
+import atexit
+import threading
+
+from functools import lru_cache
+from typing import Optional
+
+from lib.logger import get_logger
+from lib.metrics import get_metrics
+from lib.replay import TRANSPORT_MODE
+
+log = get_logger(__name__)
+metrics = get_metrics()
+
+# 정적 추출 텍스트가 이 길이(문자 수)보다 짧으면 브라우저 렌더링 대상
+MIN_TEXT_LENGTH = 100
+
+
+def needs_rendering(texts: list[str]) -> bool:
+    """정적 HTML에서 추출한 문장이 너무 적은 경우 (SPA 홈페이지 등)"""
+    return sum(len(text) for text in texts) < MIN_TEXT_LENGTH
+
+
+class BrowserPool:
+    """
+    헤드리스 Chrome 풀 (JS로 렌더링되는 홈페이지용)
+
+    브라우저는 처음 필요할 때 생성해 여러 페이지에서 재사용하며, 동시에 size개까지만 사용합니다.
+    selenium / Chrome을 사용할 수 없으면 비활성화되고 render는 None을 반환합니다.
+
+    Args:
+        size: 최대 브라우저 수 (동시 렌더링 수)
+        page_load_timeout: 페이지 로드 제한 시간(초)
+        render_wait: 로드 완료 후 스크립트 렌더링 대기 시간(초)
+    """
+    def __init__(self, size: int = 2, page_load_timeout: int = 15, render_wait: float = 1.5):
+        self.size = size
+        self.page_load_timeout = page_load_timeout
+        self.render_wait = render_wait
+
+        self.idle = queue.LifoQueue()
+        self.semaphore = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        self.created = 0
+        # 리플레이 모드에서는 네트워크를 사용하지 않으므로 비활성화
+        self.enabled = TRANSPORT_MODE != 'replay'
+
+    def render(self, url: str) -> Optional[bytes]:
+        """url을 브라우저로 열어 렌더링된 HTML 반환 (실패 시 None)"""
+        if not self.enabled:
+            return None
+
+        with self.semaphore:
+            if (driver := self._acquire()) is None:
+                return None
+
+            try:
+                with metrics.timer('render_seconds', stage='browser'):
+                    driver.get(url)
+                    self._wait_for_render(driver)
+                    html = driver.page_source
+                self.idle.put(driver)
+                return html.encode('utf-8')
+            except Exception as e:
+                # 상태를 알 수 없는 브라우저는 재사용하지 않음
+                log.warning("[%s] 브라우저 렌더링 실패: %s", url, e, extra={'stage': 'browser', 'url': url})
+                metrics.record_error('browser', url)
+                self._discard(driver)
+                return None
+
+    def close(self):
+        while True:
+            try:
+                self._discard(self.idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def _acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            if not self.enabled:
+                return None
+            try:
+                driver = self._create_driver()
+            except Exception as e:
+                log.warning(f"헤드리스 브라우저를 사용할 수 없어 렌더링을 비활성화합니다: {e}")
+                self.enabled = False
+                return None
+            self.created += 1
+            log.info(f"헤드리스 브라우저 생성 ({self.created}개째)")
+            return driver
+
+    def _create_driver(self):
+        # selenium은 렌더링이 필요한 경우에만 로드
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        options = webdriver.ChromeOptions()
+        for argument in ('--headless=new', '--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu',
+                         '--blink-settings=imagesEnabled=false', '--window-size=1280,2000'):
+            options.add_argument(argument)
+        options.page_load_strategy = 'eager'
+
+        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        driver.set_script_timeout(self.page_load_timeout)
+        return driver
+
+    def _wait_for_render(self, driver):
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        WebDriverWait(driver, self.page_load_timeout).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete'
+        )
+        if self.render_wait:
+            # 클라이언트 렌더링이 끝날 때까지 잠시 대기
+            time.sleep(self.render_wait)
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            log.debug(f"브라우저 종료 실패: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_browser_pool() -> BrowserPool:
+    pool = BrowserPool()
+    atexit.register(pool.close)
+    return pool
@@ -0,0 +1,176 @@
+import pandas as pd
+
+from typing import List
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+WEEKDAYS = ['월', '화', '수', '목', '금']
+WEEKENDS = ['토', '일']
+EVERYDAY = '매일'
+
+# 요일 → 숫자 (월요일 0 ~ 일요일 6)
+DAY_INDEX = {day: i for i, day in enumerate(WEEKDAYS + WEEKENDS)}
+
+# "HH:MM - HH:MM" 형식의 영업 시간 패턴
+TIME_RANGE_PATTERN = r'^(\d{1,2}):(\d{2}) - (\d{1,2}):(\d{2})$'
+
+ROW_COLUMNS = ['id', 'group', 'name', 'day', 'start', 'end', 'description', 'has_hours']
+FRAME_COLUMNS = ['id', 'group', 'name', 'weekdays', 'weekends', 'offdays',
+                 'weekdays_open', 'weekdays_close', 'weekends_open', 'weekends_close']
+
+
+def normalize_business_hours(place_list: List[dict]) -> List[dict]:
+    """
+    모든 장소의 영업 시간(newBusinessHours)을 한 번에 정규화합니다.
+
+    Args:
+        place_list: `new_business_hours` 필드를 가진 장소 리스트
+
+    Returns:
+        `id`, `business_hours` (기존 문자열 형식), `business_hours_minutes` (자정 기준 분 단위) 리스트
+    """
+    frame = business_hours_frame(place_list)
+    intervals = _interval_map(_flatten(place_list))
+
+    grouped = {}
+    for row in frame.itertuples(index=False):
+        grouped.setdefault(row.id, []).append(row)
+
+    results = []
+    for place in place_list:
+        business_hours = []
+        business_hours_minutes = []
+
+        for row in grouped.get(place['id'], []):
+            business_hours.append({
+                "name": row.name,
+                "weekdays": row.weekdays,
+                "weekends": row.weekends,
+                "offdays": row.offdays,
+            })
+            business_hours_minutes.append({
+                "name": row.name,
+                "weekdays": _minutes_range(row.weekdays_open, row.weekdays_close),
+                "weekends": _minutes_range(row.weekends_open, row.weekends_close),
+                "offdays": [DAY_INDEX[day] for day in row.offdays if day in DAY_INDEX],
+                "intervals": intervals.get((row.id, row.group), []),
+            })
+
+        results.append({
+            "id": place['id'],
+            "business_hours": business_hours,
+            "business_hours_minutes": business_hours_minutes,
+        })
+
+    return results
+
+def business_hours_frame(place_list: List[dict]) -> pd.DataFrame:
+    """
+    영업 시간 그룹(장소 ID, 매장 순서)당 한 행을 가지는 데이터프레임을 반환합니다.
+
+    평일/주말 영업 시간은 요일별 시간 중 최빈값을 사용하며, 숫자 컬럼은 자정 기준 분 단위입니다.
+    """
+    rows = _flatten(place_list)
+    if rows.empty:
+        return pd.DataFrame(columns=FRAME_COLUMNS)
+
+    groups = rows.drop_duplicates(['id', 'group'])[['id', 'group', 'name']]
+    key = ['id', 'group']
+
+    # 시작/종료 시간이 모두 있는 경우만 영업 시간으로 취급
+    timed = rows['has_hours'] & rows['start'].ne('') & rows['end'].ne('')
+    everyday = rows['day'].eq(EVERYDAY)
+    rows = rows.assign(time_str=rows['start'] + ' - ' + rows['end'])
+
+    # '매일'은 평일/주말 양쪽에 포함
+    weekday_rows = rows[timed & (rows['day'].isin(WEEKDAYS) | everyday)].assign(kind='weekdays')
+    weekend_rows = rows[timed & (rows['day'].isin(WEEKENDS) | everyday)].assign(kind='weekends')
+    timed_rows = pd.concat([weekday_rows, weekend_rows], ignore_index=True)
+
+    # 그룹별 최빈값 (동률이면 먼저 등장한 값)
+    counts = timed_rows.groupby(key + ['kind', 'time_str'], sort=False).size()
+    if counts.empty:
+        modes = pd.DataFrame(columns=key + ['weekdays', 'weekends'])
+    else:
+        modes = (
+            counts.loc[counts.groupby(level=[0, 1, 2], sort=False).idxmax()]
+            .reset_index()
+            .pivot(index=key, columns='kind', values='time_str')
+            .reindex(columns=['weekdays', 'weekends'])
+            .reset_index()
+        )
+
+    # 정기휴무 (영업 시간이 없는 요일 중 설명에 '정기휴무'가 포함된 경우)
+    offday_mask = ~rows['has_hours'] & rows['description'].str.contains('정기휴무', regex=False)
+    offdays = rows[offday_mask].groupby(key, sort=False)['day'].agg(list).rename('offdays').reset_index()
+
+    frame = groups.merge(modes, on=key, how='left').merge(offdays, on=key, how='left')
+    frame['offdays'] = frame['offdays'].apply(lambda days: days if isinstance(days, list) else [])
+
+    for kind in ['weekdays', 'weekends']:
+        frame[kind] = frame[kind].astype(object).where(frame[kind].notna(), None)
+        open_minutes, close_minutes = _to_minutes(frame[kind])
+        frame[f'{kind}_open'] = open_minutes
+        frame[f'{kind}_close'] = close_minutes
+
+    return frame[FRAME_COLUMNS]
+
+def _flatten(place_list: List[dict]) -> pd.DataFrame:
+    """장소별 newBusinessHours를 요일 단위 행으로 펼침"""
+    rows = []
+    for place in place_list:
+        for group, business_hour in enumerate(place.get('new_business_hours') or []):
+            name = business_hour.get('name', 'default') or 'default'
+            hours = business_hour.get('businessHours') or []
+
+            # 요일 정보가 없는 매장도 결과에 포함되도록 빈 행 추가
+            if not hours:
+                rows.append((place['id'], group, name, '', '', '', '', False))
+
+            for hour in hours:
+                bh = hour.get('businessHours') or {}
+                rows.append((
+                    place['id'],
+                    group,
+                    name,
+                    hour.get('day', '') or '',
+                    bh.get('start', '') or '',
+                    bh.get('end', '') or '',
+                    hour.get('description', '') or '',
+                    bool(bh),
+                ))
+
+    return pd.DataFrame(rows, columns=ROW_COLUMNS)
+
+def _to_minutes(time_ranges: pd.Series):
+    """'HH:MM - HH:MM' 시리즈를 자정 기준 (시작 분, 종료 분) 시리즈로 변환 (자정을 넘기면 종료 분에 1440 추가)"""
+    parts = time_ranges.astype('string').str.extract(TIME_RANGE_PATTERN).astype(float)
+    open_minutes = parts[0] * 60 + parts[1]
+    close_minutes = parts[2] * 60 + parts[3]
+    close_minutes = close_minutes.mask(close_minutes <= open_minutes, close_minutes + 24 * 60)
+    return open_minutes, close_minutes
+
+def _interval_map(rows: pd.DataFrame) -> dict:
+    """(장소 ID, 매장 순서)별 요일 단위 영업 구간"""
+    if rows.empty:
+        return {}
+
+    timed = rows[rows['has_hours'] & rows['start'].ne('') & rows['end'].ne('')]
+    open_minutes, close_minutes = _to_minutes(timed['start'] + ' - ' + timed['end'])
+    timed = timed.assign(open=open_minutes, close=close_minutes).dropna(subset=['open', 'close'])
+
+    intervals = {}
+    for row in timed.itertuples(index=False):
+        intervals.setdefault((row.id, row.group), []).append({
+            "day": row.day,
+            "open": int(row.open),
+            "close": int(row.close),
+        })
+    return intervals
+
+def _minutes_range(open_minutes, close_minutes):
+    if pd.isna(open_minutes) or pd.isna(close_minutes):
+        return None
+    return [int(open_minutes), int(close_minutes)]
@@ -0,0 +1,104 @@
+import heapq
+
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 우선 수집할 페이지 키워드 (소개, 가격, 서비스 등)
+HIGH_PRIORITY_KEYWORDS = ['about', 'intro', 'company', 'price', 'pricing', 'fee', 'cost', 'service', 'program',
+                          'menu', 'info', 'guide', 'hotel', 'kinder', 'daycare', 'care', 'facility', 'reservation']
+# 나중에 수집할 페이지 키워드 (갤러리, 공지 등)
+LOW_PRIORITY_KEYWORDS = ['gallery', 'photo', 'album', 'notice', 'news', 'event', 'faq', 'qna', 'search', 'tag']
+
+# 정규화 시 제거할 추적용 쿼리 파라미터 (utm_* 포함)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref'}
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    방문 여부 판단용 URL 정규화
+
+    - scheme, host 소문자 / 기본 포트 제거
+    - fragment 제거, 추적용 쿼리 파라미터 제거 후 정렬
+    - 마지막 '/' 제거
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or '').lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (key.lower().startswith('utm_') or key.lower() in TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip('/')
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+def url_priority(url: str) -> int:
+    """URL 우선순위 (작을수록 먼저 수집)"""
+    path = urlsplit(url).path.lower()
+    if any(keyword in path for keyword in HIGH_PRIORITY_KEYWORDS):
+        return 0
+    if any(keyword in path for keyword in LOW_PRIORITY_KEYWORDS):
+        return 2
+    return 1
+
+
+class CrawlFrontier:
+    """
+    장소(사이트) 단위 크롤링 대기열
+
+    깊이가 얕은 페이지부터(BFS), 같은 깊이에서는 우선순위가 높은 페이지부터 꺼내며
+    정규화된 URL 기준으로 한 번만 방문합니다.
+
+    Args:
+        max_depth: 시작 페이지로부터 따라갈 최대 링크 깊이 (1이면 시작 페이지의 링크까지)
+        max_pages: 수집할 최대 페이지 수
+        allow: URL 허용 여부 판단 함수 (robots.txt 등)
+    """
+    def __init__(self, max_depth: int = 1, max_pages: int = 30, allow=None):
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.allow = allow
+        self.heap = []
+        self.seen = set()
+        self.popped = 0
+        self.sequence = 0
+
+    def add(self, url: str, depth: int, priority: int = None, force: bool = False) -> bool:
+        """URL 추가 (이미 본 URL, 최대 깊이 초과, 허용되지 않은 URL은 무시 / force면 허용 여부 확인 생략)"""
+        if depth > self.max_depth:
+            return False
+
+        canonical_url = canonicalize_url(url)
+        if canonical_url in self.seen:
+            return False
+        if not force and self.allow and not self.allow(url):
+            return False
+
+        self.seen.add(canonical_url)
+        priority = url_priority(url) if priority is None else priority
+        heapq.heappush(self.heap, (depth, priority, self.sequence, url))
+        self.sequence += 1
+        return True
+
+    def pop_batch(self, size: int) -> list:
+        """남은 페이지 예산 안에서 최대 size개의 (URL, 깊이) 반환"""
+        batch = []
+        while self.heap and len(batch) < size and self.popped < self.max_pages:
+            depth, _, _, url = heapq.heappop(self.heap)
+            batch.append((url, depth))
+            self.popped += 1
+        return batch
+
+    def is_done(self) -> bool:
+        return not self.heap or self.popped >= self.max_pages
+
+    def __len__(self):
+        return len(self.heap)
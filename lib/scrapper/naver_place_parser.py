@@ -18,8 +18,8 @@ class NaverPlaceParser:
 
             # 가격표 이미지
             "menu_image_urls": self._parse_menu_images(),
-            # 영업 시간
-            "business_hours": self._parse_business_hours(), 
+            # 영업 시간 (원본, lib/scrapper/business_hours.py 에서 일괄 정규화)
+            "new_business_hours": self._parse_new_business_hours(),
             # 메뉴 (가격표)
             "menus": self._parse_menus(),
             # 리뷰 수
@@ -37,6 +37,28 @@ class NaverPlaceParser:
             **self._parse_parking_and_valet(),
         }
 
+    def parse_base(self, apollo_data: dict):
+        """
+        검색 결과에서 얻는 기본 정보(이름, 주소, 좌표 등)를 상세 페이지에서 추출 (검색 없이 장소를 갱신하는 경우)
+
+        값이 없는 필드는 포함하지 않습니다.
+        """
+        self.apollo_data = apollo_data
+        self.detail_data = self._get_detail()
+
+        base = self._get_detail_base()
+        coordinate = base.get('coordinate') or {}
+        fields = {
+            "id": int(base.get('id', '')),
+            "name": base.get('name'),
+            "tel": base.get('phone') or base.get('virtualPhone'),
+            "address": base.get('address'),
+            "road_address": base.get('roadAddress'),
+            "lat": coordinate.get('y'),
+            "lng": coordinate.get('x'),
+        }
+        return {key: value for key, value in fields.items() if value not in (None, '')}
+
     # --- Get Data ---
 
     def _get_detail(self):
@@ -48,6 +70,13 @@ class NaverPlaceParser:
         detail_base_key = self.detail_data.get('base', {}).get('__ref', '')
         return self.apollo_data.get(detail_base_key, {})
 
+    def _place_id(self):
+        """로그용 플레이스 ID (추출할 수 없으면 None)"""
+        try:
+            return self._get_detail_base().get('id')
+        except Exception:
+            return None
+
     # --- Parsing ---
 
     def _parse_menu_images(self):
@@ -81,6 +110,11 @@ class NaverPlaceParser:
             })
         return business_hours
     
+    def _parse_new_business_hours(self):
+        """[홈] 영업 시간 (원본)"""
+        return self.detail_data.get('newBusinessHours') or []
+
+    # 장소별 영업 시간 파싱 함수 (사용 X, normalize_business_hours 로 일괄 처리)
     def _parse_business_hours(self):
         try:
             business_hours = []
@@ -125,7 +159,7 @@ class NaverPlaceParser:
             return business_hours
 
         except Exception as e:
-            log.error(f"영업 시간 파싱 오류: {e}")
+            log.error("영업 시간 파싱 오류: %s", e, extra={'stage': 'naver_place', 'place_id': self._place_id()})
             raise e
 
     def _parse_menus(self):
@@ -152,7 +186,7 @@ class NaverPlaceParser:
             
             return result
         except Exception as e:
-            log.error(f"메뉴 파싱 오류: {e}")
+            log.error("메뉴 파싱 오류: %s", e, extra={'stage': 'naver_place', 'place_id': self._place_id()})
             raise e
 
     def _parse_review_counts(self):
@@ -163,7 +197,7 @@ class NaverPlaceParser:
                 "블로그리뷰": self.detail_data.get('fsasReviews', {}).get('total', 0),
             }
         except Exception as e:
-            log.error(f"리뷰 수 파싱 오류: {e}")
+            log.error("리뷰 수 파싱 오류: %s", e, extra={'stage': 'naver_place', 'place_id': self._place_id()})
             raise e
 
     def _parse_links(self):
@@ -178,7 +212,7 @@ class NaverPlaceParser:
                 for p in links
             ]
         except Exception as e:
-            log.error(f"링크 파싱 오류: {e}")
+            log.error("링크 파싱 오류: %s", e, extra={'stage': 'naver_place', 'place_id': self._place_id()})
             raise e
 
     def _parse_description(self):
@@ -0,0 +1,86 @@
+import re
+import codecs
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional
+
+# 문서 앞부분에서 meta charset 선언을 찾을 범위 (바이트)
+META_SCAN_BYTES = 4096
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+HEADER_CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# 국내 사이트에서 흔한 선언 → 실제 사용할 코덱 (EUC-KR 페이지도 대부분 CP949 확장 문자를 포함)
+CHARSET_ALIASES = {
+    'euc-kr': 'cp949',
+    'euckr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'ksc5601': 'cp949',
+    'x-windows-949': 'cp949',
+    'windows-949': 'cp949',
+}
+
+# 선언이 없고 UTF-8도 아닌 경우
+FALLBACK_ENCODING = 'cp949'
+
+
+@dataclass
+class PageSource:
+    """
+    스크래핑한 페이지 원본
+
+    파서에는 디코딩하지 않은 바이트(`content`)와 감지한 인코딩을 넘기고, 문자열이 필요한 경우에만 `text`로 디코딩합니다.
+    """
+    url: str
+    content: bytes
+    encoding: Optional[str] = None
+    status_code: int = 200
+    headers: dict = field(default_factory=dict)
+
+    @cached_property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or detect_encoding(self.content, self.headers), errors='replace')
+
+
+def detect_encoding(content: bytes, headers: dict = None) -> str:
+    """
+    HTML 바이트의 인코딩을 감지합니다.
+
+    BOM → UTF-8로 디코딩 가능 여부 → Content-Type 헤더 → meta 태그 → CP949 순서로 확인합니다.
+    (UTF-8로 디코딩되는 페이지는 선언이 틀린 경우가 많아 선언보다 우선합니다)
+    """
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    if content.isascii():
+        return 'utf-8'
+    try:
+        content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    content_type = (headers or {}).get('Content-Type') or (headers or {}).get('content-type') or ''
+    if (match := HEADER_CHARSET_PATTERN.search(content_type)) and (encoding := normalize_encoding(match.group(1))):
+        return encoding
+
+    if (match := META_CHARSET_PATTERN.search(content, 0, META_SCAN_BYTES)) and (encoding := normalize_encoding(match.group(1).decode('ascii'))):
+        return encoding
+
+    return FALLBACK_ENCODING
+
+def normalize_encoding(name: str) -> Optional[str]:
+    """인코딩 이름을 파이썬 코덱 이름으로 변환 (알 수 없는 이름은 None)"""
+    name = name.strip().lower()
+    name = CHARSET_ALIASES.get(name, name)
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
@@ -0,0 +1,38 @@
+import os
+import time
+import atexit
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+# 파싱 프로세스 수 (0이면 프로세스 풀을 사용하지 않고 수집 스레드에서 파싱)
+PARSE_WORKERS = int(os.getenv("SCRAPER_PARSE_WORKERS", os.cpu_count() or 1))
+
+
+def timed_parse(parse_fn: Callable[[Any], Any], page_source) -> Tuple[Any, float]:
+    """파싱 결과와 소요 시간(초) (메트릭은 부모 프로세스에서 기록)"""
+    start = time.perf_counter()
+    result = parse_fn(page_source)
+    return result, time.perf_counter() - start
+
+@lru_cache(maxsize=None)
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    HTML/JSON 파싱용 프로세스 풀 (프로세스 전체에서 공유)
+
+    수집 스레드(keep-alive 연결, 락)를 복제하지 않도록 spawn으로 시작합니다.
+    풀에 넘기는 파싱 함수는 모듈 수준 함수(또는 그 partial)여야 합니다.
+    """
+    if PARSE_WORKERS <= 0:
+        return None
+
+    pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+    atexit.register(pool.shutdown, cancel_futures=True)
+    log.info(f"파싱 프로세스 풀 생성 ({PARSE_WORKERS}개)")
+    return pool
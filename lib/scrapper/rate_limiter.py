@@ -0,0 +1,175 @@
+import time
+import threading
+
+from collections import deque
+from typing import Optional
+
+from lib.logger import get_logger
+from lib.metrics import get_metrics
+
+log = get_logger(__name__)
+metrics = get_metrics()
+
+# 호스트가 요청을 제한하고 있다고 판단하는 상태 코드
+THROTTLE_STATUS = {429, 503}
+
+
+class HostRateLimiter:
+    """
+    호스트 단위 토큰 버킷 + AIMD 속도 조절 + 서킷 브레이커
+
+    성공 응답이 오면 초당 요청 수를 조금씩 늘리고(Additive Increase),
+    429/5xx/지연 초과가 발생하면 절반으로 줄입니다(Multiplicative Decrease).
+    최근 요청의 에러 비율이 임계치를 넘으면 서킷을 열어 cooldown 동안 해당 호스트 요청을 멈춥니다.
+
+    Args:
+        host: 호스트 이름
+        rate: 초기 초당 요청 수
+        min_rate: 최소 초당 요청 수
+        max_rate: 최대 초당 요청 수
+        burst: 버킷에 쌓일 수 있는 최대 토큰 수
+        increase: 성공 시 증가량 (초당 요청 수)
+        decrease: 실패 시 감소 비율
+        latency_threshold: 이 시간(초)을 넘는 응답은 과부하 신호로 취급
+        error_threshold: 서킷을 여는 에러 비율
+        window: 에러 비율을 계산할 최근 요청 수
+        cooldown: 서킷이 열린 뒤 대기 시간(초)
+    """
+    def __init__(
+            self,
+            host: str,
+            rate: float = 5.0,
+            min_rate: float = 0.5,
+            max_rate: float = 20.0,
+            burst: int = 5,
+            increase: float = 0.5,
+            decrease: float = 0.5,
+            latency_threshold: float = 5.0,
+            error_threshold: float = 0.5,
+            window: int = 20,
+            cooldown: float = 60.0
+        ):
+        self.host = host
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_threshold = latency_threshold
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+
+        self.lock = threading.Lock()
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.outcomes = deque(maxlen=window)
+        self.paused_until = 0.0
+        self.half_open = False
+        # 반개방 상태의 시험 요청 결과를 기다리는 기한 (결과가 기록되면 대기 중인 스레드를 깨움)
+        self.probe_deadline = 0.0
+        self.probe_done = threading.Condition(self.lock)
+
+    def acquire(self):
+        """
+        토큰을 얻을 때까지 대기 (서킷이 열려 있으면 cooldown이 끝날 때까지 대기)
+
+        반개방 상태에서는 시험 요청 하나만 통과시키고, 나머지는 그 결과가 기록될 때까지 대기합니다.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.half_open:
+                    # 시험 요청 결과가 기록되지 않은 채 cooldown이 지나면 다른 요청으로 다시 시험
+                    if now >= self.probe_deadline:
+                        self.probe_deadline = now + self.cooldown
+                        return
+                    self.probe_done.wait(self.probe_deadline - now)
+                    continue
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+    def record(self, status: Optional[int], latency: float, retry_after: Optional[float] = None):
+        """
+        요청 결과를 반영해 속도와 서킷 상태를 갱신합니다.
+
+        Args:
+            status: 응답 상태 코드 (연결 실패 등 응답이 없으면 None)
+            latency: 응답 시간(초)
+            retry_after: 서버가 알려준 재시도 대기 시간(초)
+        """
+        failed = status is None or status in THROTTLE_STATUS or status >= 500
+        slow = latency > self.latency_threshold
+
+        with self.lock:
+            now = time.monotonic()
+            self.outcomes.append(failed)
+
+            if failed or slow:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+            if self.half_open:
+                # 서킷 반개방 상태에서 첫 요청 결과로 닫거나 다시 열기
+                self.half_open = False
+                self.probe_deadline = 0.0
+                if failed: self._open(now)
+                else: self.outcomes.clear()
+                self.probe_done.notify_all()
+            elif now >= self.paused_until and self._error_rate() >= self.error_threshold:
+                self._open(now)
+
+        if failed:
+            metrics.inc('throttled_total', host=self.host, status=str(status))
+
+    def _refill(self, now: float):
+        if self.paused_until and now >= self.paused_until and not self.half_open and self._error_rate() >= self.error_threshold:
+            self.half_open = True
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def _open(self, now: float):
+        self.paused_until = now + self.cooldown
+        self.rate = self.min_rate
+        self.tokens = 0.0
+        metrics.inc('circuit_open_total', host=self.host)
+        log.warning("[%s] 에러 비율 초과, %.0f초 동안 요청 중단", self.host, self.cooldown, extra={'host': self.host})
+
+    def _error_rate(self) -> float:
+        # 판단에 필요한 최소 요청 수 (window의 절반)
+        if len(self.outcomes) < max(1, self.outcomes.maxlen // 2):
+            return 0.0
+        return sum(self.outcomes) / len(self.outcomes)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_host_limiter(host: str, **kwargs) -> HostRateLimiter:
+    """호스트별 HostRateLimiter 인스턴스를 반환하는 함수 (프로세스 내 모든 스크래퍼가 공유)"""
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = HostRateLimiter(host, **kwargs)
+        return _limiters[host]
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값(초)을 float로 변환 (날짜 형식은 무시)"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
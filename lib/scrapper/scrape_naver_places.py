@@ -2,28 +2,45 @@ import re
 import json
 
 from typing import List
+from functools import lru_cache
 from lib.scrapper.naver_place_parser import NaverPlaceParser
 from lib.scrapper.batch_scraper import BatchScraper
 
 
-APOLLO_PATTERN = r'window\.__APOLLO_STATE__\s*=\s*({.*?});'
+# 디코딩 없이 응답 바이트에서 바로 검색 (네이버 플레이스는 UTF-8)
+APOLLO_PATTERN = re.compile(rb'window\.__APOLLO_STATE__\s*=\s*({.*?});', re.DOTALL)
 
-def scrape_naver_places(place_ids: List[int]) -> List[dict]:
-    """네이버 플레이스 배치 스크래핑"""
-    naver_place_parser = NaverPlaceParser()
-    
-    def parse_place(page_source) -> dict:
-        match = re.search(APOLLO_PATTERN, page_source.text, re.DOTALL)
-        if match:
-            apollo_state = json.loads(match.group(1))
-            return naver_place_parser.parse(apollo_state)
-    
+def scrape_naver_places(place_ids: List[int], include_base: bool = False) -> List[dict]:
+    """
+    네이버 플레이스 배치 스크래핑
+
+    Args:
+        include_base: 이름, 주소, 좌표 등 기본 정보도 함께 추출 (검색 결과 없이 갱신하는 경우)
+    """
     headers = {
         'Accept': 'text/html,application/xhtml+xml...',
         'Accept-Language': 'ko-KR,ko;q=0.9...',
     }
     
-    scraper = BatchScraper(headers=headers)
+    scraper = BatchScraper(headers=headers, stage='naver_place')
     urls = [f"https://m.place.naver.com/place/{id}/home" for id in place_ids]
     
-    return scraper.scrape_batch(urls, parse_place)
\ No newline at end of file
+    return scraper.scrape_batch(urls, parse_place_with_base if include_base else parse_place)
+
+def parse_place(page_source) -> dict:
+    """페이지의 APOLLO_STATE를 파싱 (파싱 프로세스에서 실행되므로 모듈 수준 함수)"""
+    match = APOLLO_PATTERN.search(page_source.content)
+    if match:
+        apollo_state = json.loads(match.group(1))
+        return _get_parser().parse(apollo_state)
+
+def parse_place_with_base(page_source) -> dict:
+    """기본 정보를 포함해 APOLLO_STATE를 파싱"""
+    match = APOLLO_PATTERN.search(page_source.content)
+    if match:
+        apollo_state = json.loads(match.group(1))
+        return {**_get_parser().parse_base(apollo_state), **_get_parser().parse(apollo_state)}
+
+@lru_cache(maxsize=1)
+def _get_parser() -> NaverPlaceParser:
+    return NaverPlaceParser()
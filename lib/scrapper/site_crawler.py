@@ -0,0 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+from lib.logger import get_logger
+from lib.scrapper.batch_scraper import BatchScraper
+from lib.scrapper.browser_pool import get_browser_pool, needs_rendering
+from lib.scrapper.crawl_frontier import CrawlFrontier, canonicalize_url
+from lib.scrapper.page_source import PageSource
+from lib.scrapper.site_policy import SitePolicy, fetch_site_policy
+from lib.scrapper.text_extractor import parse_html, extract_sentences
+from utils.extract_links import extract_links_from_tree, client_redirect
+from utils.url_filter import get_url_filter
+
+log = get_logger(__name__)
+
+# 시작 페이지(및 리다이렉트 대상)의 우선순위
+START_PRIORITY = -1
+# 시작 페이지에서 따라갈 최대 메타 태그 리다이렉트 횟수 (HTTP 리다이렉트는 requests에서 처리)
+MAX_REDIRECTS = 3
+# robots.txt / sitemap.xml 최대 크기 (바이트)
+POLICY_MAX_BYTES = 2 * 1024 * 1024
+
+
+class SiteCrawler:
+    """
+    홈페이지 크롤러
+
+    장소마다 크롤링 대기열(CrawlFrontier)을 두고 깊이/페이지 예산 안에서 BFS로 수집합니다.
+    각 페이지는 한 번만 다운로드/파싱하며, 같은 트리에서 링크와 텍스트를 함께 추출합니다.
+    여러 장소가 같은 페이지를 가지고 있어도 한 번만 수집합니다.
+
+    Args:
+        scraper: 페이지 수집에 사용할 BatchScraper
+        max_depth: 시작 페이지로부터 따라갈 최대 링크 깊이
+        max_pages: 장소당 최대 수집 페이지 수
+        use_sitemap: sitemap.xml의 URL을 대기열에 추가할지 여부
+        respect_robots: robots.txt에서 막힌 URL을 제외할지 여부 (시작 페이지는 제외)
+        batch_size: 한 라운드에 장소당 수집할 페이지 수
+        render_fallback: 정적 텍스트가 너무 적은 페이지를 헤드리스 브라우저로 다시 렌더링할지 여부
+    """
+    def __init__(
+            self,
+            scraper: BatchScraper = None,
+            max_depth: int = 1,
+            max_pages: int = 30,
+            use_sitemap: bool = True,
+            respect_robots: bool = True,
+            batch_size: int = 10,
+            render_fallback: bool = True
+        ):
+        self.scraper = scraper or BatchScraper(stage='page_content')
+        # robots.txt / sitemap.xml 요청용 (없는 경우가 많아 재시도하지 않음, 같은 송신 경로 풀과 호스트 속도 제한 공유)
+        self.policy_scraper = BatchScraper(
+            max_retries=0,
+            max_workers=self.scraper.max_workers,
+            headers=self.scraper.headers,
+            stage='site_policy',
+            egress_pool=self.scraper.egress_pool,
+            max_bytes=POLICY_MAX_BYTES,
+            timeout=self.scraper.timeout,
+            use_parse_pool=False
+        )
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.use_sitemap = use_sitemap
+        self.respect_robots = respect_robots
+        self.batch_size = batch_size
+        self.render_fallback = render_fallback
+
+    def crawl(self, business_urls: List[dict]) -> Dict[Any, List[str]]:
+        """
+        Args:
+            business_urls: [{장소 ID: [홈페이지 URL, ...]}, ...]
+
+        Returns:
+            {장소 ID: 문장 리스트 (수집 순서)}
+        """
+        place_urls = {place_id: urls for business_url in business_urls for place_id, urls in business_url.items()}
+        policies = self._fetch_policies([url for urls in place_urls.values() for url in urls])
+
+        frontiers = {place_id: self._create_frontier(urls, policies) for place_id, urls in place_urls.items()}
+        texts = {place_id: [] for place_id in place_urls}
+        # 장소별 정규화 URL → 시작 페이지로부터 거친 리다이렉트 횟수
+        redirect_hops = {place_id: {} for place_id in place_urls}
+
+        # 정규화 URL → 파싱 결과 (실패한 페이지는 None)
+        pages = {}
+
+        while batches := {place_id: batch for place_id, frontier in frontiers.items() if (batch := frontier.pop_batch(self.batch_size))}:
+            # 같은 URL이 여러 장소에서 다른 깊이로 나오면 가장 깊은 깊이 기준 (깊이 1 이상이면 텍스트 사용)
+            depths = {}
+            for batch in batches.values():
+                for url, depth in batch:
+                    if canonicalize_url(url) not in pages:
+                        depths[url] = max(depth, depths.get(url, 0))
+
+            urls = set(depths)
+            fetched = self.scraper.scrape_map(sorted(urls), _parse_page) if urls else {}
+            if self.render_fallback:
+                self._render(fetched, depths)
+            for url in urls:
+                pages[canonicalize_url(url)] = fetched.get(url)
+
+            for place_id, batch in batches.items():
+                frontier = frontiers[place_id]
+
+                for url, depth in batch:
+                    if not (page := pages.get(canonicalize_url(url))):
+                        continue
+
+                    # 메타 태그 리다이렉트는 같은 깊이로 대기열에 추가 (방문 기록으로 루프 방지, 횟수 제한)
+                    if page['redirect']:
+                        hops = redirect_hops[place_id].get(canonicalize_url(url), 0) + 1
+                        if hops > MAX_REDIRECTS:
+                            log.warning("%s: 리다이렉트 제한 초과 -> %s", url, page['redirect'])
+                        elif frontier.add(page['redirect'], depth, priority=START_PRIORITY, force=depth == 0):
+                            redirect_hops[place_id][canonicalize_url(page['redirect'])] = hops
+                        continue
+
+                    # 시작 페이지는 유효한 URL인 경우에만 텍스트 사용
+                    if depth > 0 or page['valid']:
+                        texts[place_id].extend(page['texts'])
+
+                    for link in page['links']:
+                        frontier.add(link, depth + 1)
+
+        log.info(f"{len(place_urls)}개 장소, {sum(1 for page in pages.values() if page)}/{len(pages)}개 페이지 수집 완료")
+        return texts
+
+    def _render(self, fetched: Dict[str, dict], depths: Dict[str, int]):
+        """
+        정적 HTML의 텍스트가 너무 적은 페이지(JS 렌더링 페이지)를 브라우저로 렌더링한 결과로 교체
+
+        파싱은 프로세스 풀에서 수행하므로, 브라우저 렌더링은 수집 결과를 받은 뒤 현재 프로세스에서 수행합니다.
+        텍스트를 사용하지 않는 페이지(리다이렉트, 유효하지 않은 시작 페이지)는 렌더링하지 않습니다.
+
+        Args:
+            depths: {URL: 깊이}
+        """
+        targets = [
+            url for url, page in fetched.items()
+            if not page['redirect'] and (depths.get(url, 0) > 0 or page['valid']) and needs_rendering(page['texts'])
+        ]
+        if not targets:
+            return
+
+        browser_pool = get_browser_pool()
+        if not browser_pool.enabled:
+            return
+
+        def render(url: str):
+            if rendered := browser_pool.render(fetched[url]['url']):
+                fetched[url] = _parse_page(PageSource(url=fetched[url]['url'], content=rendered))
+
+        with ThreadPoolExecutor(max_workers=browser_pool.size) as executor:
+            list(executor.map(render, targets))
+
+    def _create_frontier(self, urls: List[str], policies: Dict[str, SitePolicy]) -> CrawlFrontier:
+        def allow(url: str) -> bool:
+            policy = policies.get(_origin(url))
+            return policy is None or not self.respect_robots or policy.can_fetch(url)
+
+        frontier = CrawlFrontier(self.max_depth, self.max_pages, allow=allow)
+        for url in urls:
+            frontier.add(url, 0, priority=START_PRIORITY, force=True)
+
+        # 사이트맵 URL은 시작 페이지의 링크와 같은 깊이로 추가
+        for url in urls:
+            if not (policy := policies.get(_origin(url))): continue
+
+            base_domain = urlsplit(url).netloc
+            for sitemap_url in policy.sitemap_urls:
+                if get_url_filter().is_valid_url(sitemap_url, base_domain):
+                    frontier.add(sitemap_url, 1)
+
+        return frontier
+
+    def _fetch_policies(self, urls: List[str]) -> Dict[str, SitePolicy]:
+        """유효한 시작 URL의 사이트별 robots.txt / sitemap.xml 조회"""
+        if not (self.use_sitemap or self.respect_robots):
+            return {}
+
+        origins = {_origin(url): url for url in urls if get_url_filter().is_valid_url(url, urlsplit(url).netloc)}
+        if not origins:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.scraper.max_workers) as executor:
+            futures = {
+                origin: executor.submit(fetch_site_policy, self.policy_scraper, url, self.use_sitemap)
+                for origin, url in origins.items()
+            }
+            return {origin: future.result() for origin, future in futures.items()}
+
+
+def _parse_page(page_source) -> dict:
+    """페이지를 한 번 파싱해 링크, 텍스트, 리다이렉트 URL을 함께 반환 (파싱 프로세스에서 실행)"""
+    base_url = page_source.url
+    root = parse_html(page_source.content, page_source.encoding)
+
+    if redirect_url := client_redirect(root, base_url):
+        return {"url": base_url, "redirect": redirect_url, "valid": False, "texts": [], "links": []}
+
+    texts = extract_sentences(root)
+    links = extract_links_from_tree(root, base_url)
+
+    return {
+        "url": base_url,
+        "redirect": None,
+        "valid": base_url in links,
+        "texts": texts,
+        "links": [link for link in links if link != base_url],
+    }
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
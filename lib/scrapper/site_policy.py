@@ -0,0 +1,62 @@
+import re
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urlsplit, urljoin
+from urllib.robotparser import RobotFileParser
+
+from lib.scrapper.batch_scraper import BatchScraper
+
+LOC_PATTERN = re.compile(rb'<loc>\s*([^<\s]+)\s*</loc>', re.IGNORECASE)
+
+# 사이트맵에서 가져올 최대 URL 수 (대형 사이트맵 방지)
+MAX_SITEMAP_URLS = 200
+
+
+@dataclass
+class SitePolicy:
+    """사이트 단위 robots.txt 규칙과 사이트맵 URL"""
+    robots: Optional[RobotFileParser] = None
+    sitemap_urls: List[str] = field(default_factory=list)
+
+    def can_fetch(self, url: str, user_agent: str = '*') -> bool:
+        return self.robots is None or self.robots.can_fetch(user_agent, url)
+
+
+def fetch_site_policy(scraper: BatchScraper, url: str, use_sitemap: bool = True) -> SitePolicy:
+    """
+    robots.txt와 sitemap.xml을 읽어 사이트 정책을 반환합니다. (실패해도 빈 정책 반환)
+
+    robots.txt에 Sitemap 항목이 없으면 `/sitemap.xml`을 시도하며, 사이트맵 인덱스는 한 단계까지 따라갑니다.
+    요청은 scraper로 보내므로 페이지 수집과 같은 호스트 속도 제한, 송신 경로, 크기/시간 제한이 적용됩니다.
+    """
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    policy = SitePolicy()
+
+    robots_text = scraper.fetch(f"{origin}/robots.txt", missing_ok=True)
+    if robots_text is not None:
+        policy.robots = RobotFileParser()
+        policy.robots.parse(robots_text.text.splitlines())
+
+    if not use_sitemap:
+        return policy
+
+    sitemaps = (policy.robots.site_maps() if policy.robots else None) or [f"{origin}/sitemap.xml"]
+    for sitemap in sitemaps[:3]:
+        for loc in _read_sitemap(scraper, urljoin(origin, sitemap)):
+            # 사이트맵 인덱스인 경우 하위 사이트맵 한 단계까지 확인
+            if loc.lower().endswith('.xml'):
+                policy.sitemap_urls.extend(_read_sitemap(scraper, loc))
+            else:
+                policy.sitemap_urls.append(loc)
+
+            if len(policy.sitemap_urls) >= MAX_SITEMAP_URLS: break
+
+    policy.sitemap_urls = policy.sitemap_urls[:MAX_SITEMAP_URLS]
+    return policy
+
+def _read_sitemap(scraper: BatchScraper, url: str) -> List[str]:
+    if not (page_source := scraper.fetch(url, missing_ok=True)) or not page_source.content:
+        return []
+    return [loc.decode('utf-8', errors='replace') for loc in LOC_PATTERN.findall(page_source.content)]
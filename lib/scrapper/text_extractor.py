@@ -0,0 +1,162 @@
+import re
+
+from lxml import etree
+
+from utils.cleaner import clean_text
+from utils.text import text_to_sentence
+
+PRIMARY_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li')
+SEMANTIC_TAGS = ('article', 'section', 'aside')
+SECONDARY_TAGS = ('a', 'span', 'strong', 'em', 'b', 'i', 'td', 'th')
+
+# 결과 순서 (태그 이름 순서 → 문서 순서)
+BUCKET_ORDER = PRIMARY_TAGS + SEMANTIC_TAGS + ('div',) + SECONDARY_TAGS
+
+# 하위 트리를 통째로 무시하는 태그 (clean_html 제거 대상과 동일)
+REMOVED_TAGS = frozenset(['script', 'style', 'head', 'meta', 'noscript', 'iframe'])
+# 내부 텍스트가 상위 태그 텍스트에 포함되지 않는 태그 (BeautifulSoup 전용 문자열 타입)
+OPAQUE_TAGS = frozenset(['template', 'rt', 'rp'])
+
+_PRIMARY = frozenset(PRIMARY_TAGS)
+_SEMANTIC = frozenset(SEMANTIC_TAGS)
+_INLINE = frozenset(PRIMARY_TAGS + SECONDARY_TAGS)
+_BUCKETS = frozenset(BUCKET_ORDER)
+
+# 부모 체인에서 primary 태그를 확인할 깊이
+PARENT_DEPTH = 5
+
+# 문서 맨 앞의 XML 선언 (lxml은 인코딩 선언이 있는 유니코드 문자열을 파싱하지 않음)
+XML_DECLARATION_PATTERN = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def parse_html(content: bytes, encoding: str = None):
+    """
+    HTML 바이트를 lxml 트리로 파싱합니다.
+
+    encoding이 없으면 UTF-8로 디코딩 가능한 경우 UTF-8, 아니면 문서의 meta 선언을 따릅니다.
+    UTF-8이 아닌 인코딩(CP949 등)은 libxml2가 지원하지 않을 수 있어 파이썬에서 디코딩한 뒤 파싱합니다.
+    (디코딩한 문자열의 XML 선언은 제거, 예: 구형 EUC-KR XHTML 페이지의 `<?xml ... encoding="euc-kr"?>`)
+    """
+    if not content:
+        return None
+
+    if encoding is None:
+        try:
+            content.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            pass
+    elif encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+        text = XML_DECLARATION_PATTERN.sub('', content.decode(encoding, errors='replace'), count=1)
+        return etree.fromstring(text, etree.HTMLParser())
+
+    parser = etree.HTMLParser(encoding=encoding)
+    return etree.fromstring(content, parser)
+
+def extract_sentences(root) -> list[str]:
+    """트리에서 텍스트 블록을 추출해 정규화 후 문장 리스트로 반환"""
+    return to_sentences(extract_text_blocks(root))
+
+def to_sentences(text_blocks: list[str]) -> list[str]:
+    """텍스트 블록 정규화(NFKC, 폭 없는 문자 제거 포함) 후 문장 리스트로 변환 (한국어 종결 어미 기준 분리 포함)"""
+    all_text = []
+    for text in text_blocks:
+        # 전각 문자/호환 문자 정규화와 폭 없는 문자 제거 (같은 문장이 다른 문자로 중복되거나 문장 분리가 어긋나지 않도록)
+        cleaned_text = clean_text(text, nfkc=True, zero_width=True)
+
+        if cleaned_text and len(cleaned_text) < 2: continue
+
+        sentences = text_to_sentence(cleaned_text, korean=True)
+        all_text.extend(sentences)
+
+    return all_text
+
+def extract_text_blocks(root) -> list[str]:
+    """
+    한 번의 트리 순회로 유효한 텍스트 블록을 추출합니다.
+
+    BeautifulSoup 기반 `benchmarks.legacy.extract_text_from_soup` + `get_text(strip=True)`와 같은 블록을 같은 순서로 반환합니다.
+    - primary 태그 (p, h1~h6, li): 모두
+    - semantic 태그 (article, section, aside): 직계 primary 자식이 없고 직접 텍스트가 있는 경우
+    - div: 직계 primary/secondary 자식이 없고 직접 텍스트가 있는 경우
+    - secondary 태그 (a, span 등): 5단계 부모 중 primary 태그가 없고 텍스트가 있는 경우
+    """
+    if root is None:
+        return []
+
+    # 문서 순서대로 strip 된 텍스트 조각 (태그의 텍스트는 [시작, 끝) 구간의 join)
+    pieces = []
+    buckets = {name: [] for name in BUCKET_ORDER}
+
+    # 프레임: [태그, 텍스트 시작 위치, 직접 텍스트 여부, 직계 primary 자식 여부, 직계 primary/secondary 자식 여부, 결과 슬롯]
+    stack = []
+    opaque_depth = 0
+
+    walker = etree.iterwalk(root, events=('start', 'end', 'comment', 'pi'))
+    for event, el in walker:
+        if event == 'start':
+            tag = el.tag
+            parent = stack[-1] if stack else None
+
+            if tag in REMOVED_TAGS:
+                walker.skip_subtree()
+                stack.append(None)
+                continue
+
+            if parent is not None:
+                if tag in _PRIMARY: parent[3] = True
+                if tag in _INLINE: parent[4] = True
+
+            if tag in OPAQUE_TAGS: opaque_depth += 1
+
+            text = el.text.strip() if el.text else ''
+            slot = None
+            if tag in _BUCKETS:
+                slot = [tag, None]
+                buckets[tag].append(slot)
+
+            stack.append([tag, len(pieces), bool(text), False, False, slot])
+            if text and not opaque_depth:
+                pieces.append(text)
+
+        elif event == 'end':
+            frame = stack.pop()
+
+            if frame is not None:
+                tag, start, direct, has_primary, has_inline, slot = frame
+
+                if slot is not None:
+                    text = ''.join(pieces[start:])
+                    if tag in _PRIMARY:
+                        slot[1] = text
+                    elif tag in _SEMANTIC:
+                        if not has_primary and direct: slot[1] = text
+                    elif tag == 'div':
+                        if not has_inline and direct: slot[1] = text
+                    elif text and not any(f[0] in _PRIMARY for f in stack[-PARENT_DEPTH:] if f is not None):
+                        slot[1] = text
+
+                if tag in OPAQUE_TAGS: opaque_depth -= 1
+
+            _append_tail(el, stack, pieces, opaque_depth)
+
+        elif event == 'comment':
+            _append_tail(el, stack, pieces, opaque_depth)
+
+        else:
+            # 처리 명령(<?...?>)은 텍스트에는 포함되지 않지만 직접 텍스트로 취급
+            if stack and stack[-1] is not None:
+                stack[-1][2] = True
+            _append_tail(el, stack, pieces, opaque_depth)
+
+    return [slot[1] for name in BUCKET_ORDER for slot in buckets[name] if slot[1] is not None]
+
+def _append_tail(el, stack, pieces, opaque_depth):
+    """노드 뒤에 오는 텍스트는 부모 태그의 직접 텍스트"""
+    tail = el.tail.strip() if el.tail else ''
+    if not tail or not stack: return
+
+    if stack[-1] is not None:
+        stack[-1][2] = True
+    if not opaque_depth:
+        pieces.append(tail)
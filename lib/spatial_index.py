@@ -0,0 +1,239 @@
+import os
+import json
+import math
+import numpy as np
+
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+# 행정구역 경계 GeoJSON (FeatureCollection, Polygon/MultiPolygon)
+DISTRICTS_PATH = os.getenv("SCRAPER_DISTRICTS_PATH", "data/districts.geojson")
+# 구역 이름으로 사용할 properties 키 (앞에서부터 먼저 있는 값 사용)
+DISTRICT_NAME_KEYS = ('name', 'SIG_KOR_NM', 'adm_nm', 'EMD_KOR_NM')
+
+# 같은 장소로 볼 최대 거리(m)
+DUPLICATE_RADIUS_M = 30
+# geohash 정밀도 7 → 약 153m x 153m 셀
+GEOHASH_PRECISION = 7
+
+EARTH_RADIUS_M = 6371000
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+
+    while len(chars) < precision:
+        interval, coord = (lng_range, lng) if even else (lat_range, lat)
+        mid = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            interval[0] = mid
+        else:
+            interval[1] = mid
+
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits, value = 0, 0
+
+    return ''.join(chars)
+
+def _cell_size(precision: int) -> Tuple[float, float]:
+    """geohash 셀 크기 (위도, 경도) 도 단위"""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+    return 180 / 2 ** lat_bits, 360 / 2 ** lng_bits
+
+def haversine_m(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """한 점에서 여러 점까지의 거리(m)"""
+    lat1, lng1 = np.radians(lat), np.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+class SpatialIndex:
+    """
+    장소 좌표(lat/lng)에 대한 geohash 버킷 색인
+
+    근접 검색은 주변 셀(3x3)의 후보만 거리 계산하므로, 반경이 셀 크기(정밀도 7 기준 약 150m)보다 작아야 합니다.
+    좌표가 없거나 잘못된 장소는 색인하지 않습니다.
+    """
+    def __init__(self, places: Sequence[dict], precision: int = GEOHASH_PRECISION):
+        self.precision = precision
+        self.cell_lat, self.cell_lng = _cell_size(precision)
+
+        self.places = []
+        coords = []
+        for place in places:
+            if (coord := _coord(place)) is not None:
+                self.places.append(place)
+                coords.append(coord)
+
+        coords = np.array(coords, dtype=float).reshape(-1, 2)
+        self.lats, self.lngs = coords[:, 0], coords[:, 1]
+
+        self.buckets: Dict[str, List[int]] = defaultdict(list)
+        for i, (lat, lng) in enumerate(coords):
+            self.buckets[geohash_encode(lat, lng, precision)].append(i)
+
+    def nearby(self, lat: float, lng: float, radius_m: float = DUPLICATE_RADIUS_M) -> List[Tuple[dict, float]]:
+        """반경 안의 장소와 거리(m), 가까운 순"""
+        return [(self.places[i], distance) for i, distance in self._nearby(lat, lng, radius_m)]
+
+    def _nearby(self, lat: float, lng: float, radius_m: float) -> List[Tuple[int, float]]:
+        candidates = [
+            i
+            for d_lat in (-self.cell_lat, 0, self.cell_lat)
+            for d_lng in (-self.cell_lng, 0, self.cell_lng)
+            for i in self.buckets.get(geohash_encode(lat + d_lat, lng + d_lng, self.precision), ())
+        ]
+        if not candidates:
+            return []
+
+        candidates = np.unique(candidates)
+        distances = haversine_m(lat, lng, self.lats[candidates], self.lngs[candidates])
+        order = np.argsort(distances)
+        return [(int(candidates[i]), float(distances[i])) for i in order if distances[i] <= radius_m]
+
+    def find_duplicates(self, radius_m: float = DUPLICATE_RADIUS_M) -> Dict[object, object]:
+        """
+        같은 업체가 여러 ID로 등록된 경우를 찾습니다.
+
+        반경 안에 있으면서 이름(공백 제외)이 같거나 한쪽이 다른 쪽을 포함하거나, 전화번호가 같은 장소를 같은 업체로 봅니다.
+
+        Returns:
+            {중복 장소 ID: 대표 장소 ID} (먼저 색인된 장소가 대표)
+        """
+        duplicates = {}
+        for i, place in enumerate(self.places):
+            if place['id'] in duplicates:
+                continue
+
+            for j, _ in self._nearby(self.lats[i], self.lngs[i], radius_m):
+                other = self.places[j]
+                if j > i and other['id'] != place['id'] and other['id'] not in duplicates and _same_business(place, other):
+                    duplicates[other['id']] = place['id']
+
+        return duplicates
+
+    def __len__(self):
+        return len(self.places)
+
+
+@dataclass
+class District:
+    """행정구역 경계 (외곽선과 구멍을 포함한 폴리곤 리스트)"""
+    name: str
+    polygons: List[List[np.ndarray]]
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """외곽선을 감싸는 (최소 경도, 최소 위도, 최대 경도, 최대 위도)"""
+        outer = np.concatenate([rings[0] for rings in self.polygons])
+        (min_lng, min_lat), (max_lng, max_lat) = outer.min(axis=0), outer.max(axis=0)
+        return float(min_lng), float(min_lat), float(max_lng), float(max_lat)
+
+    def contains(self, lngs: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """각 점이 구역 안에 있는지 (bool 배열)"""
+        inside = np.zeros(len(lngs), dtype=bool)
+        for rings in self.polygons:
+            in_polygon = points_in_ring(lngs, lats, rings[0])
+            for hole in rings[1:]:
+                in_polygon &= ~points_in_ring(lngs, lats, hole)
+            inside |= in_polygon
+        return inside
+
+
+def points_in_ring(lngs: np.ndarray, lats: np.ndarray, ring: np.ndarray) -> np.ndarray:
+    """여러 점에 대한 ray casting (변 단위로 순회하며 모든 점을 한 번에 계산)"""
+    inside = np.zeros(len(lngs), dtype=bool)
+    x1, y1 = ring[-1]
+    for x2, y2 in ring:
+        crosses = (y1 > lats) != (y2 > lats)
+        if crosses.any():
+            x_cross = x1 + (lats - y1) * (x2 - x1) / ((y2 - y1) or 1e-12)
+            inside ^= crosses & (lngs < x_cross)
+        x1, y1 = x2, y2
+    return inside
+
+def load_districts(path: str = DISTRICTS_PATH) -> List[District]:
+    with open(path, encoding='utf-8') as f:
+        collection = json.load(f)
+
+    districts = []
+    for feature in collection.get('features', []):
+        properties = feature.get('properties') or {}
+        geometry = feature.get('geometry') or {}
+        name = next((properties[key] for key in DISTRICT_NAME_KEYS if properties.get(key)), None)
+        if not name:
+            continue
+
+        if geometry.get('type') == 'Polygon':
+            polygons = [geometry['coordinates']]
+        elif geometry.get('type') == 'MultiPolygon':
+            polygons = geometry['coordinates']
+        else:
+            continue
+
+        districts.append(District(name, [[np.asarray(ring, dtype=float)[:, :2] for ring in rings] for rings in polygons]))
+
+    return districts
+
+@lru_cache(maxsize=1)
+def get_districts() -> List[District]:
+    """기본 경계 파일의 행정구역 (파일이 없으면 빈 리스트)"""
+    if not os.path.exists(DISTRICTS_PATH):
+        return []
+
+    districts = load_districts(DISTRICTS_PATH)
+    log.info(f"행정구역 경계 {len(districts)}개 로드 ({DISTRICTS_PATH})")
+    return districts
+
+def find_district(location: str, places: Sequence[dict] = ()) -> Optional[District]:
+    """
+    지역 이름에 해당하는 구역
+
+    이름이 같은 구역이 여러 개면(예: 여러 시의 "중구") places 좌표를 가장 많이 포함하는 구역을 선택합니다.
+    """
+    candidates = [
+        district for district in get_districts()
+        if district.name == location or district.name.endswith(f" {location}")
+    ]
+    if len(candidates) <= 1:
+        return candidates[0] if candidates else None
+
+    lngs, lats = coordinates(places)
+    return max(candidates, key=lambda district: int(district.contains(lngs, lats).sum()))
+
+def coordinates(places: Sequence[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """장소들의 (경도, 위도) 배열 (좌표가 없으면 NaN)"""
+    coords = np.array([_coord(place) or (np.nan, np.nan) for place in places], dtype=float).reshape(-1, 2)
+    return coords[:, 1], coords[:, 0]
+
+
+def _coord(place: dict) -> Optional[Tuple[float, float]]:
+    """(위도, 경도), 검색 API 원본(latitude/longitude)과 파싱 결과(lat/lng) 모두 지원"""
+    try:
+        lat = float(place.get('lat') or place['latitude'])
+        lng = float(place.get('lng') or place['longitude'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (lat, lng) if math.isfinite(lat) and math.isfinite(lng) else None
+
+def _same_business(a: dict, b: dict) -> bool:
+    if a.get('tel') and a.get('tel') == b.get('tel'):
+        return True
+
+    name_a = ''.join((a.get('name') or '').split())
+    name_b = ''.join((b.get('name') or '').split())
+    return bool(name_a and name_b) and (name_a in name_b or name_b in name_a)
@@ -0,0 +1,198 @@
+import json
+import time
+import uuid
+import sqlite3
+
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from lib.logger import get_logger
+
+log = get_logger(__name__)
+
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+
+@dataclass
+class Lease:
+    """워커가 임대한 작업 조각"""
+    job_id: str
+    chunk_id: int
+    worker_id: str
+    payload: dict
+    items: list
+
+
+class WorkQueue:
+    """
+    작업 조각(장소 ID 묶음) 임대 큐 인터페이스
+
+    코디네이터가 작업을 조각으로 나눠 등록하면 워커가 조각을 임대(lease)해 처리하고 결과를 제출합니다.
+    임대 기간 안에 제출/연장하지 않은 조각은 다른 워커에게 다시 배정됩니다.
+    (Redis 등 다른 저장소도 같은 메서드를 구현하면 사용할 수 있습니다.)
+    """
+    def create_job(self, payload: dict, items: list, chunk_size: int) -> str: ...
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[Lease]: ...
+
+    def extend(self, lease: Lease, lease_seconds: float) -> bool: ...
+
+    def complete(self, lease: Lease, results: list) -> bool: ...
+
+    def release(self, lease: Lease, error: str) -> None: ...
+
+    def progress(self, job_id: str) -> dict: ...
+
+    def results(self, job_id: str) -> list: ...
+
+    def completed_chunks(self, job_id: str, exclude: Iterable[int] = ()) -> List[Tuple[int, list]]: ...
+
+    def has_active_jobs(self) -> bool: ...
+
+
+class SqliteWorkQueue(WorkQueue):
+    """
+    SQLite 기반 작업 큐 (로컬 / 공유 디스크용)
+
+    Args:
+        path: 데이터베이스 파일 경로
+        max_attempts: 조각당 최대 처리 시도 횟수 (초과하면 실패 처리)
+    """
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS chunks (
+                    job_id TEXT NOT NULL,
+                    chunk_id INTEGER NOT NULL,
+                    items TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    worker_id TEXT,
+                    lease_until REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    results TEXT,
+                    PRIMARY KEY (job_id, chunk_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_chunks_status ON chunks (status, lease_until);
+            """)
+
+    @contextmanager
+    def _connect(self):
+        # 스레드(임대 연장)마다 사용할 수 있도록 작업마다 연결
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def create_job(self, payload: dict, items: list, chunk_size: int) -> str:
+        job_id = uuid.uuid4().hex
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        with self._connect() as conn:
+            conn.execute("INSERT INTO jobs VALUES (?, ?, ?)", (job_id, json.dumps(payload, ensure_ascii=False), time.time()))
+            conn.executemany(
+                "INSERT INTO chunks (job_id, chunk_id, items, status) VALUES (?, ?, ?, ?)",
+                [(job_id, i, json.dumps(chunk, ensure_ascii=False), PENDING) for i, chunk in enumerate(chunks)]
+            )
+
+        log.info(f"작업 등록 [{job_id}]: {len(items)}개 항목, {len(chunks)}개 조각")
+        return job_id
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[Lease]:
+        """대기 중이거나 임대 기간이 지난 조각 하나를 임대 (오래된 작업부터)"""
+        now = time.time()
+        with self._connect() as conn:
+            self._expire(conn, now)
+            row = conn.execute("""
+                SELECT c.job_id, c.chunk_id, c.items, j.payload, c.status, c.worker_id
+                FROM chunks c JOIN jobs j ON c.job_id = j.job_id
+                WHERE c.status = ? OR (c.status = ? AND c.lease_until < ?)
+                ORDER BY j.created_at, c.chunk_id
+                LIMIT 1
+            """, (PENDING, LEASED, now)).fetchone()
+            if row is None:
+                return None
+
+            job_id, chunk_id, items, payload, status, previous_worker = row
+            if status == LEASED:
+                log.warning(f"임대 만료 조각 재배정 [{job_id}:{chunk_id}]: {previous_worker} -> {worker_id}")
+
+            conn.execute(
+                "UPDATE chunks SET status = ?, worker_id = ?, lease_until = ?, attempts = attempts + 1 WHERE job_id = ? AND chunk_id = ?",
+                (LEASED, worker_id, now + lease_seconds, job_id, chunk_id)
+            )
+
+        return Lease(job_id, chunk_id, worker_id, json.loads(payload), json.loads(items))
+
+    def extend(self, lease: Lease, lease_seconds: float) -> bool:
+        """임대 연장 (다른 워커에게 재배정된 경우 False)"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE chunks SET lease_until = ? WHERE job_id = ? AND chunk_id = ? AND status = ? AND worker_id = ?",
+                (time.time() + lease_seconds, lease.job_id, lease.chunk_id, LEASED, lease.worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, lease: Lease, results: list) -> bool:
+        """결과 제출 (이미 다른 워커가 완료한 조각이면 무시하고 False)"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE chunks SET status = ?, worker_id = ?, results = ?, error = NULL WHERE job_id = ? AND chunk_id = ? AND status != ?",
+                (DONE, lease.worker_id, json.dumps(results, ensure_ascii=False), lease.job_id, lease.chunk_id, DONE)
+            )
+            return cursor.rowcount == 1
+
+    def release(self, lease: Lease, error: str) -> None:
+        """처리 실패한 조각 반납 (최대 시도 횟수를 넘으면 실패 처리)"""
+        with self._connect() as conn:
+            conn.execute("""
+                UPDATE chunks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, worker_id = NULL, lease_until = NULL, error = ?
+                WHERE job_id = ? AND chunk_id = ? AND status = ? AND worker_id = ?
+            """, (self.max_attempts, FAILED, PENDING, error, lease.job_id, lease.chunk_id, LEASED, lease.worker_id))
+
+    def progress(self, job_id: str) -> dict:
+        with self._connect() as conn:
+            self._expire(conn, time.time())
+            rows = conn.execute("SELECT status, COUNT(*) FROM chunks WHERE job_id = ? GROUP BY status", (job_id,)).fetchall()
+        return {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def results(self, job_id: str) -> list:
+        """완료된 조각의 결과를 조각 순서대로 병합"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT results FROM chunks WHERE job_id = ? AND status = ? ORDER BY chunk_id", (job_id, DONE)).fetchall()
+        return [result for (results,) in rows for result in json.loads(results)]
+
+    def completed_chunks(self, job_id: str, exclude: Iterable[int] = ()) -> List[Tuple[int, list]]:
+        """완료된 조각의 (조각 ID, 결과) 리스트 (exclude에 있는 조각 제외)"""
+        exclude = set(exclude)
+        with self._connect() as conn:
+            rows = conn.execute("SELECT chunk_id, results FROM chunks WHERE job_id = ? AND status = ? ORDER BY chunk_id", (job_id, DONE)).fetchall()
+        return [(chunk_id, json.loads(results)) for chunk_id, results in rows if chunk_id not in exclude]
+
+    def has_active_jobs(self) -> bool:
+        with self._connect() as conn:
+            self._expire(conn, time.time())
+            row = conn.execute("SELECT 1 FROM chunks WHERE status IN (?, ?) LIMIT 1", (PENDING, LEASED)).fetchone()
+        return row is not None
+
+    def _expire(self, conn: sqlite3.Connection, now: float):
+        """최대 시도 횟수만큼 임대됐다가 만료된 조각은 실패 처리 (워커를 계속 죽이는 조각 방지)"""
+        conn.execute(
+            "UPDATE chunks SET status = ?, error = ? WHERE status = ? AND lease_until < ? AND attempts >= ?",
+            (FAILED, 'lease expired', LEASED, now, self.max_attempts)
+        )
@@ -1,96 +1,160 @@
+import os
 import asyncio
-import json
+import argparse
 import time
-from typing import List
+from typing import AsyncIterator, List
 
-from lib.s3_uploader import S3ImageUploader
-from lib.naver_map_api_sniffing import get_naver_place_list
-from lib.scrapper.scrape_page_content import scrape_page_content
-from lib.logger import get_logger
+from lib.geo_search import BoundingBox
+from lib.logger import get_logger, setup_logging
+from lib.metrics import get_metrics
 from lib.scrapper.scrape_naver_places import scrape_naver_places
-from utils.dict_utils import merge_dict_lists
-from lib.request_batch_api import request_batch_api
-from utils.dict_utils import pick_fields
+from lib.delta_refresh import change_signature, load_snapshot, split_changed_places
+from lib.distributed import run_worker, iter_job_results
+from lib.work_queue import WorkQueue, SqliteWorkQueue
+from lib.output import SINKS, create_sinks
+from lib.place_store import PlaceStore, OUTPUT_FIELDS, INTERMEDIATE_FIELDS
+from lib.place_db import PlaceDB
 
 log = get_logger()
+metrics = get_metrics()
 
 class Main:
-    def __init__(self):
-        self.location = self._input_location()
+    def __init__(
+            self,
+            delta: bool = False,
+            output_formats: List[str] = ['json'],
+            metrics_report: str = None,
+            location: str = None,
+            tiled_search: bool = False,
+            bbox: BoundingBox = None,
+            db: PlaceDB = None,
+            snapshot_path: str = None
+        ):
+        self.delta = delta
+        self.db = db
+        self.snapshot_path = snapshot_path
+        self.snapshot = None
+        self.tiled_search = tiled_search
+        self.bbox = bbox
+        self.output_formats = output_formats
+        self.metrics_report = metrics_report
+        self.location = location or self._input_location()
         self.keywords = ["강아지 유치원", "반려견 유치원", "강아지 호텔", "반려견 호텔", "애견 유치원", "애견 호텔"]
 
-    async def run(self):
+    async def run(self, queue: WorkQueue = None, chunk_size: int = 50):
+        from lib.naver_map_api_sniffing import get_naver_place_list
+
         start_time = time.time()
 
         # 1. 네이버 지도 검색 결과 가져오기 (API 스니핑)
-        place_list = get_naver_place_list(self.location, self.keywords)
+        with metrics.timer('stage_seconds', stage='search'):
+            place_list = get_naver_place_list(self.location, self.keywords, tiled=self.tiled_search, bbox=self.bbox)
         log.info(f"총 {len(place_list)}개 장소 검색 됨")
 
+        # 결과는 조각이 끝날 때마다 바로 저장 (중간에 실패해도 완료된 조각은 NDJSON/DB에 남음)
+        # JSON은 끝까지 성공한 경우에만 기록 (델타 모드 스냅샷이 일부 결과로 덮어써지지 않도록)
+        sinks = create_sinks(self.output_formats, self.location)
+        count = 0
+        try:
+            async for results in self._process_chunks(place_list, queue, chunk_size):
+                with metrics.timer('stage_seconds', stage='output'):
+                    self._write_output(sinks, results)
+                    if self.db:
+                        self.db.upsert(self.location, results)
+                count += len(results)
+        except BaseException:
+            for sink in sinks:
+                sink.abort()
+            raise
+
+        for sink in sinks:
+            sink.close()
+            log.info(f"결과 저장 완료: {sink.path} ({sink.count}개)")
+
+        elapsed_time = time.time() - start_time
+        log.info(f"작업 완료 - 총 {count}개 항목, 소요 시간: {elapsed_time:.2f}초")
+
+        if self.metrics_report:
+            metrics.dump_report(self.metrics_report)
+
+    async def _process_chunks(self, place_list: List[dict], queue: WorkQueue, chunk_size: int) -> AsyncIterator[List[dict]]:
+        """장소를 chunk_size개씩 처리해 끝나는 대로 결과 반환 (분산 모드에서는 워커가 완료한 조각 순서)"""
+        if queue is None:
+            for i in range(0, len(place_list), chunk_size):
+                yield await self.process_places(place_list[i:i + chunk_size])
+        else:
+            # 분산 모드: 장소를 조각으로 나눠 큐에 등록하고, 워커들이 처리한 결과를 받음
+            job_id = queue.create_job(self._job_payload(), place_list, chunk_size)
+            async for results in iter_job_results(queue, job_id):
+                yield results
+
+    async def process_places(self, place_list: List[dict]) -> List[dict]:
+        """검색된 장소 리스트의 상세 정보 수집 ~ 필드 추출 (분산 모드에서는 워커가 조각 단위로 실행)"""
+        # 영업 시간 정규화는 pandas를 사용하므로 필요한 시점에 import
+        from lib.scrapper.business_hours import normalize_business_hours
+
+        store = PlaceStore(place_list)
+
         # 2. 상세 정보 스크랩핑 데이터 추가
-        place_ids = [item['id'] for item in place_list]
-        place_list = merge_dict_lists('id', place_list, scrape_naver_places(place_ids))
+        with metrics.timer('stage_seconds', stage='naver_place'):
+            store.update('naver_place', scrape_naver_places(store.ids()))
+        with metrics.timer('stage_seconds', stage='business_hours'):
+            store.update('business_hours', normalize_business_hours(store.values()))
+        store.update('change_signature', [{"id": place.id, "change_signature": change_signature(place)} for place in store])
+
+        # 델타 모드: 변경되지 않은 장소는 이전 결과를 그대로 사용
+        unchanged_list = []
+        if self.delta:
+            changed_list, unchanged_list = split_changed_places(store.values(), self._load_snapshot())
+            store.keep(place.id for place in changed_list)
+
+        if len(store):
+            await self._enrich(store)
+
+        # 7. 필요한 데이터만 추출
+        return store.to_dicts(OUTPUT_FIELDS) + unchanged_list
+
+    async def _enrich(self, store: PlaceStore):
+        # 홈페이지 크롤링(lxml/bs4), LLM 요청(openai/PIL) 모듈은 필요한 단계에서 import
+        from lib.scrapper.scrape_page_content import scrape_page_content
+        from lib.request_batch_api import request_batch_api
+        from lib.s3_uploader import upload_place_images
 
         # 3. 홈페이지 콘텐츠 추가
-        place_link_map = [{ data["id"]: [i['url'] for i in data['links']] } for data in place_list]
-        place_list = merge_dict_lists('id', place_list, scrape_page_content(place_link_map))
+        place_link_map = [{ place.id: [i['url'] for i in place.links] } for place in store]
+        with metrics.timer('stage_seconds', stage='page_content'):
+            store.update('page_content', scrape_page_content(place_link_map))
 
         # 4. 이미지 S3 버킷 업로드
-        upload_results = await self._upload_images(place_list)
-        place_list = merge_dict_lists('id', place_list, upload_results)
+        with metrics.timer('stage_seconds', stage='upload_images'):
+            store.update('upload_images', await upload_place_images(self.location, store.values()))
 
         # 5. 배치 API 요청
-        batch_api_response = request_batch_api(place_list)
-        place_list = merge_dict_lists('id', place_list, batch_api_response)
+        with metrics.timer('stage_seconds', stage='batch_api'):
+            store.update('batch_api', request_batch_api(store.values()))
 
-        # 7. 필요한 데이터만 추출
-        place_list = self._filter_place_list(place_list)
+        # 6. LLM 요청에 사용한 대용량 필드 해제
+        store.drop(*INTERMEDIATE_FIELDS)
 
-        with open(f'{self.location}.json', 'w', encoding='utf-8') as f:
-            json.dump(place_list, f, ensure_ascii=False, indent=4)
-
-        elapsed_time = time.time() - start_time
-        log.info(f"작업 완료 - 총 {len(place_list)}개 항목, 소요 시간: {elapsed_time:.2f}초")
-
-    def _filter_place_list(self, place_list: List[dict]):
-        keys = ['id', 'name', 'tel', 'address', 'thumbnail_s3_key', 'menu_image_s3_keys', 'road_address', 'lat', 'lng', 'business_hours', 'menus', 'review_counts', 'links', 'categories', 'services']
-        return [pick_fields(place, keys) for place in place_list]
-    
-    async def _upload_images(self, place_list: List[dict]):
-        uploader = S3ImageUploader()
+    def _load_snapshot(self) -> dict:
+        """델타 모드의 이전 결과 (조각마다 다시 읽지 않도록 처음 한 번만 읽음)"""
+        if self.snapshot is None:
+            self.snapshot = self.db.snapshot(self.location) if self.db else load_snapshot(self.snapshot_path or f'{self.location}.json')
+        return self.snapshot
 
-        results = []
-        upload_image_map = []
+    def _write_output(self, sinks: list, place_list: List[dict]):
         for place in place_list:
-            base_key = f"{self.location}/{place['id']}"
-
-            # 썸네일
-            thumbnail_extension = place['thumbnail_url'].split('.')[-1]
-            thumbnail_s3_key = f"{base_key}/thumbnail.{thumbnail_extension}"
-            upload_image_map.append({
-                "url": place['thumbnail_url'],
-                "key": thumbnail_s3_key
-            })
-
-            # 가격표 이미지
-            menu_image_s3_keys = []
-            for i, menu_image_url in enumerate(place['menu_image_urls']):
-                menu_image_extension = menu_image_url.split('.')[-1]
-                menu_image_s3_key = f"{base_key}/menu_images/{i}.{menu_image_extension}"
-                menu_image_s3_keys.append(menu_image_s3_key)
-                upload_image_map.append({
-                    "url": menu_image_url,
-                    "key": menu_image_s3_key
-                })
-
-            results.append({
-                "id": place['id'],
-                "thumbnail_s3_key": thumbnail_s3_key,
-                "menu_image_s3_keys": menu_image_s3_keys
-            })
-
-        await uploader.upload_multiple_images(upload_image_map)
-
-        return results
+            for sink in sinks:
+                sink.write(place)
+
+    def _job_payload(self) -> dict:
+        """워커에 넘길 작업 설정 (델타 모드의 이전 결과는 코디네이터의 DB/스냅샷 경로를 절대 경로로 전달)"""
+        return {
+            "location": self.location,
+            "delta": self.delta,
+            "db": os.path.abspath(self.db.path) if self.db else None,
+            "snapshot": os.path.abspath(self.snapshot_path or f'{self.location}.json'),
+        }
 
     def _input_location(self):
         while True:
@@ -102,5 +166,55 @@ class Main:
     
 
 if __name__ == "__main__":
-    main = Main()
-    asyncio.run(main.run())
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--delta', action='store_true', help='이전 결과와 비교해 변경된 장소만 갱신')
+    parser.add_argument('--output', nargs='+', choices=list(SINKS), default=['json'], help='출력 형식 (기본: json)')
+    parser.add_argument('--metrics-report', help='실행 종료 후 메트릭 리포트(JSON)를 저장할 경로')
+    parser.add_argument('--metrics-port', type=int, help='Prometheus 메트릭 서버 포트 (/metrics)')
+    parser.add_argument('--tiled-search', action='store_true', help='지역을 격자로 나눠 검색 (검색 결과 수 제한 이상 수집)')
+    parser.add_argument('--bbox', type=BoundingBox.parse, help='격자 검색 영역 "최소경도,최소위도,최대경도,최대위도" (기본: 행정구역 경계, 없으면 검색 결과 좌표로 결정)')
+    parser.add_argument('--db', help='결과를 누적 저장할 장소 DB(SQLite) 경로, 델타 모드의 이전 결과도 DB에서 읽음')
+    parser.add_argument('--queue', help='분산 모드 작업 큐(SQLite) 경로, 지정하면 코디네이터로 실행')
+    parser.add_argument('--worker', action='store_true', help='--queue의 작업을 처리하는 워커로 실행')
+    parser.add_argument('--worker-id', help='워커 ID (기본: 호스트명-PID)')
+    parser.add_argument('--chunk-size', type=int, default=50, help='장소 묶음 크기 (분산 모드에서는 워커에 배정하는 단위, 결과는 묶음이 끝날 때마다 저장)')
+    parser.add_argument('--lease-timeout', type=float, default=600, help='조각 임대 기간(초), 지나면 다른 워커에 재배정')
+    parser.add_argument('--idle-timeout', type=float, default=600, help='워커가 등록된 작업 없이 대기할 시간(초), 음수면 계속 대기')
+    parser.add_argument('--log-format', choices=['console', 'json'], help='로그 형식 (기본: SCRAPER_LOG_FORMAT 또는 console)')
+    parser.add_argument('--log-async', action='store_true', help='로그 출력을 별도 스레드에서 수행 (고동시성 실행용)')
+    args = parser.parse_args()
+
+    if args.log_format or args.log_async:
+        setup_logging(log_format=args.log_format, async_mode=args.log_async or None, force=True)
+
+    if args.worker and not args.queue:
+        parser.error('--worker는 --queue와 함께 사용해야 합니다.')
+
+    if args.metrics_port:
+        metrics.start_http_server(args.metrics_port)
+
+    queue = SqliteWorkQueue(args.queue) if args.queue else None
+
+    if args.worker:
+        async def process_chunk(payload: dict, place_list: List[dict]) -> List[dict]:
+            return await Main(
+                delta=payload['delta'],
+                location=payload['location'],
+                db=PlaceDB(payload['db']) if payload.get('db') else None,
+                snapshot_path=payload.get('snapshot')
+            ).process_places(place_list)
+
+        idle_timeout = args.idle_timeout if args.idle_timeout >= 0 else None
+        asyncio.run(run_worker(queue, process_chunk, worker_id=args.worker_id, lease_seconds=args.lease_timeout, idle_timeout=idle_timeout))
+        if args.metrics_report:
+            metrics.dump_report(args.metrics_report)
+    else:
+        main = Main(
+            delta=args.delta,
+            output_formats=args.output,
+            metrics_report=args.metrics_report,
+            tiled_search=args.tiled_search or args.bbox is not None,
+            bbox=args.bbox,
+            db=PlaceDB(args.db) if args.db else None
+        )
+        asyncio.run(main.run(queue=queue, chunk_size=args.chunk_size))
\ No newline at end of file
@@ -0,0 +1,50 @@
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ProxyStub:
+    """
+    테스트용 로컬 프록시 대역
+
+    HTTP 프록시로 들어온 요청을 실제로 전달하지 않고 지정한 상태 코드로 바로 응답하며, 받은 요청 URL을 기록합니다.
+
+        with ProxyStub(status=403) as proxy:
+            EgressEndpoint(proxy=proxy.url)
+    """
+    def __init__(self, status: int = 200, body: bytes = b'ok'):
+        self.status = status
+        self.body = body
+        self.requests = []
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests.append(self.path)
+                self.send_response(stub.status)
+                self.send_header('Content-Type', 'text/plain')
+                self.send_header('Content-Length', str(len(stub.body)))
+                self.end_headers()
+                self.wfile.write(stub.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
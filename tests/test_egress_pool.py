@@ -0,0 +1,112 @@
+import unittest
+
+from contextlib import ExitStack
+from unittest import mock
+
+from lib import replay
+from lib.egress_pool import EgressEndpoint, EgressPool
+from tests.proxy_stub import ProxyStub
+from utils.http_client import HttpClient, ResponseTooLargeError
+
+
+class EgressPoolTest(unittest.TestCase):
+    def setUp(self):
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        self.proxies = [stack.enter_context(ProxyStub()) for _ in range(3)]
+        self.pool = EgressPool([
+            EgressEndpoint(name=f"proxy-{i}", proxy=proxy.url, block_threshold=3, eviction_time=60)
+            for i, proxy in enumerate(self.proxies)
+        ])
+
+    def get(self, url: str) -> EgressEndpoint:
+        """풀에서 배정받은 경로로 요청하고 응답을 반영"""
+        endpoint = self.pool.acquire('example.test', url)
+        response = endpoint.session.get(url, timeout=5)
+        endpoint.record(response.status_code)
+        return endpoint
+
+    def proxy_of(self, endpoint: EgressEndpoint) -> ProxyStub:
+        return self.proxies[self.pool.endpoints.index(endpoint)]
+
+    def test_sticky_assignment(self):
+        urls = [f"http://example.test/place/{i}" for i in range(30)]
+        assigned = {url: self.get(url) for url in urls}
+
+        # 같은 키는 항상 같은 경로(프록시)로 전송
+        for url, endpoint in assigned.items():
+            self.assertIs(self.get(url), endpoint)
+            self.assertEqual(self.proxy_of(endpoint).requests.count(url), 2)
+
+        # 키가 다르면 여러 경로로 분산
+        self.assertEqual(len({endpoint.name for endpoint in assigned.values()}), 3)
+
+    def test_health_scoring(self):
+        endpoint = self.pool.endpoints[0]
+        for _ in range(5):
+            endpoint.record(500)
+        self.assertAlmostEqual(endpoint.health, 0.9 ** 5)
+        self.assertEqual(endpoint.consecutive_blocks, 0)
+
+        endpoint.record(200)
+        self.assertAlmostEqual(endpoint.health, 0.9 ** 6 + 0.1)
+        self.assertTrue(endpoint.available)
+
+    def test_eviction_moves_only_assigned_keys(self):
+        urls = [f"http://example.test/place/{i}" for i in range(30)]
+        assigned = {url: self.pool.acquire('example.test', url) for url in urls}
+
+        blocked = self.pool.endpoints[0]
+        self.proxy_of(blocked).status = 403
+        blocked_urls = [url for url, endpoint in assigned.items() if endpoint is blocked]
+        self.assertTrue(blocked_urls)
+
+        # 연속 차단 응답이 block_threshold에 도달하면 제외
+        for url in blocked_urls[:3]:
+            self.assertIs(self.get(url), blocked)
+        self.assertFalse(blocked.available)
+        self.assertEqual(blocked.health, 0.5)
+
+        # 제외된 경로의 키만 다른 경로로 이동
+        for url, endpoint in assigned.items():
+            moved = self.pool.acquire('example.test', url)
+            if endpoint is blocked:
+                self.assertIsNot(moved, blocked)
+            else:
+                self.assertIs(moved, endpoint)
+
+    def test_oversized_body_counts_as_failure(self):
+        client = HttpClient(max_bytes=1, egress_pool=self.pool)
+        url = "http://example.test/large"
+        endpoint = self.pool.acquire('example.test', url)
+
+        with self.assertRaises(ResponseTooLargeError):
+            client.get(url, key=url)
+        self.assertAlmostEqual(endpoint.health, 0.9)
+
+    def test_all_evicted_returns_first_to_recover(self):
+        for i, endpoint in enumerate(self.pool.endpoints):
+            endpoint.evicted_until = 1e12 + i
+        self.assertIs(self.pool.acquire('example.test', 'key'), self.pool.endpoints[0])
+
+
+class SourceAddressTransportTest(unittest.TestCase):
+    def test_record_mode_keeps_source_address(self):
+        with mock.patch.object(replay, 'TRANSPORT_MODE', 'record'):
+            adapter = EgressEndpoint(source_address='127.0.0.1').session.get_adapter('http://example.test')
+        self.assertIsInstance(adapter, replay.RecordingAdapter)
+        self.assertEqual(adapter.source_address, ('127.0.0.1', 0))
+
+    def test_replay_mode_ignores_source_address(self):
+        with mock.patch.object(replay, 'TRANSPORT_MODE', 'replay'):
+            adapter = EgressEndpoint(source_address='127.0.0.1').session.get_adapter('http://example.test')
+        self.assertIsInstance(adapter, replay.ReplayAdapter)
+
+    def test_source_address_connects_from_local_ip(self):
+        with ProxyStub() as server:
+            session = EgressEndpoint(source_address='127.0.0.1').session
+            self.assertEqual(session.get(f"{server.url}/health", timeout=5).status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+
+from benchmarks.startup_benchmark import DEFAULT_BUDGET_MS, DEFERRED_MODULES, ENTRY_POINTS, best_import_time, import_time
+
+
+class StartupBudgetTest(unittest.TestCase):
+    def test_entry_points_within_budget(self):
+        for module, budget_ratio in ENTRY_POINTS.items():
+            with self.subTest(module=module):
+                import_ms = best_import_time(module).get(module, 0) / 1000
+                self.assertLessEqual(import_ms, DEFAULT_BUDGET_MS * budget_ratio)
+
+    def test_main_defers_stage_modules(self):
+        times = import_time('main')
+        self.assertEqual([name for name in DEFERRED_MODULES if name in times], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,19 +1,33 @@
 import re
 import bs4
+import unicodedata
 
-def clean_text(text: str) -> str:
-    """텍스트의 공백 및 특수 문자를 정규화합니다."""
+# 기타 이스케이프 문자 (\x -> x, \n / \" 제외)
+ESCAPE_PATTERN = re.compile(r'\\([^n"])')
+# 제거할 폭 없는 문자 (zero width space / non-joiner / joiner, word joiner, BOM)
+ZERO_WIDTH_TABLE = str.maketrans('', '', '\u200b\u200c\u200d\u2060\ufeff')
+
+def clean_text(text: str, nfkc: bool = False, zero_width: bool = False) -> str:
+    """
+    텍스트의 공백 및 특수 문자를 정규화합니다.
+
+    Args:
+        nfkc: 유니코드 NFKC 정규화 여부 (전각 문자 → 반각 등)
+        zero_width: 폭 없는 문자(zero width space 등) 제거 여부
+    """
     if not text: return ""
 
-    text = text.replace('\\n', ' ')  # 줄바꿈 문자를 공백으로
-    text = text.replace('\\"', '"')   # 이스케이프된 따옴표
-    text = text.replace('\xa0', ' ')  # Non-breaking space를 일반 공백으로
+    if zero_width: text = text.translate(ZERO_WIDTH_TABLE)
+    if nfkc: text = unicodedata.normalize('NFKC', text)
 
-    text = re.sub(r'\\([^n"])', r'\1', text)  # 기타 이스케이프 문자 제거
-    text = re.sub(r'\s+', ' ', text)    # 여러 개의 공백을 하나의 공백으로 줄임
+    # 이스케이프 문자는 치환 순서에 따라 결과가 달라지므로 기존 순서대로 처리 (대부분의 텍스트는 해당 없음)
+    if '\\' in text:
+        text = text.replace('\\n', ' ')  # 줄바꿈 문자를 공백으로
+        text = text.replace('\\"', '"')   # 이스케이프된 따옴표
+        text = ESCAPE_PATTERN.sub(r'\1', text)
 
-    text = text.strip()
-    return text
+    # 여러 개의 공백(Non-breaking space 포함)을 하나의 공백으로 줄이고 앞뒤 공백 제거 (re.sub(r'\s+', ' ') + strip과 동일)
+    return ' '.join(text.split())
 
 def clean_html(soup: bs4.BeautifulSoup):
     # 스크립트, 스타일 등 불필요한 태그 제거
@@ -18,19 +18,19 @@ def dict_list_to_excel(dict_list: List[Dict[str, Any]], name: str, output_dir='.
         
         # 결과가 많을 경우 메모리 효율을 위해 청크 단위로 처리
         if len(dict_list) > chunk_size:
-            writer = pd.ExcelWriter(file_path, engine='xlsxwriter')
+            writer = pd.ExcelWriter(file_path, engine='openpyxl')
             
             # 청크 단위로 나누어 데이터프레임 생성 및 저장
             for i in range(0, len(dict_list), chunk_size):
                 chunk = dict_list[i:i+chunk_size]
                 chunk_df = pd.DataFrame(chunk)
                 
-                # 첫 번째 청크면 헤더 포함, 아니면 헤더 제외
+                # 첫 번째 청크면 헤더 포함, 아니면 헤더 제외 (헤더 1줄 + 앞선 i개 행 다음부터 기록)
                 chunk_df.to_excel(
                     writer, 
                     sheet_name='데이터', 
                     index=False,
-                    startrow=(0 if i == 0 else writer.sheets['데이터'].max_row),
+                    startrow=(0 if i == 0 else i + 1),
                     header=(i == 0)
                 )
             
@@ -0,0 +1,156 @@
+import time
+import threading
+import requests
+
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+from lib.egress_pool import EgressPool
+from lib.metrics import get_metrics
+from lib.replay import create_session
+
+metrics = get_metrics()
+
+# (연결, 읽기) 제한 시간(초)
+DEFAULT_TIMEOUT = (5, 15)
+# 본문 수신까지 포함한 전체 제한 시간(초)
+DEFAULT_TOTAL_TIMEOUT = 30
+# 최대 응답 크기 (바이트)
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """응답 본문이 최대 크기를 초과"""
+
+
+class TotalTimeoutError(requests.Timeout):
+    """본문 수신까지의 전체 제한 시간 초과"""
+
+
+class HttpClient:
+    """
+    공용 HTTP 클라이언트
+
+    호스트별로 keep-alive 세션(커넥션 풀)을 재사용하며, 모든 요청에 연결/읽기/전체 제한 시간과
+    응답 크기 제한을 적용합니다. 본문은 스트리밍으로 읽어 제한을 넘으면 바로 중단합니다.
+
+    Args:
+        headers: 기본 요청 헤더
+        timeout: (연결, 읽기) 제한 시간(초)
+        total_timeout: 전체 제한 시간(초)
+        max_bytes: 최대 응답 크기 (바이트)
+        pool_maxsize: 호스트당 최대 연결 수
+        stage: 메트릭 단계 이름 (None이면 기록하지 않음)
+        egress_pool: 송신 경로 풀 (지정하면 호스트별 세션 대신 풀에서 배정된 경로의 세션 사용)
+    """
+    def __init__(
+            self,
+            headers: dict = {},
+            timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+            total_timeout: float = DEFAULT_TOTAL_TIMEOUT,
+            max_bytes: int = DEFAULT_MAX_BYTES,
+            pool_maxsize: int = 10,
+            stage: Optional[str] = None,
+            egress_pool: Optional[EgressPool] = None
+        ):
+        self.headers = headers
+        self.timeout = timeout
+        self.total_timeout = total_timeout
+        self.max_bytes = max_bytes
+        self.pool_maxsize = pool_maxsize
+        self.stage = stage
+        self.egress_pool = egress_pool
+
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def get(self, url: str, max_bytes: int = None, key: str = '', **kwargs) -> requests.Response:
+        """
+        GET 요청 후 본문까지 모두 읽은 응답 반환
+
+        Args:
+            key: 송신 경로 배정 키 (같은 키는 같은 경로 사용)
+
+        Raises:
+            requests.RequestException: 연결 실패, 제한 시간 초과, 크기 초과 등
+        """
+        max_bytes = max_bytes or self.max_bytes
+        kwargs.setdefault('timeout', self.timeout)
+
+        if self.egress_pool is None:
+            return self._get(self.session(url), url, max_bytes, **kwargs)
+
+        endpoint = self.egress_pool.acquire(urlparse(url).netloc, key)
+        kwargs['headers'] = {**self.headers, **(kwargs.get('headers') or {}), **endpoint.headers}
+        try:
+            response = self._get(endpoint.session, url, max_bytes, **kwargs)
+        except requests.RequestException:
+            # 연결 실패와 본문 수신 실패(크기/전체 시간 초과, 헤더는 200일 수 있음)는 모두 실패로 기록
+            endpoint.record(None)
+            raise
+
+        endpoint.record(response.status_code)
+        return response
+
+    def _get(self, session: requests.Session, url: str, max_bytes: int, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        response = session.get(url, stream=True, **kwargs)
+        try:
+            read_body(response, max_bytes, start, self.total_timeout)
+        finally:
+            response.close()
+
+        if self.stage:
+            metrics.record_response(self.stage, url, response.status_code, time.perf_counter() - start, len(response.content))
+        return response
+
+    def session(self, url: str) -> requests.Session:
+        """호스트별 세션 (처음 요청 시 생성)"""
+        host = urlparse(url).netloc
+        if (session := self.sessions.get(host)) is not None:
+            return session
+
+        with self.lock:
+            if host not in self.sessions:
+                self.sessions[host] = create_session(self.headers, pool_connections=1, pool_maxsize=self.pool_maxsize)
+            return self.sessions[host]
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+def read_body(response: requests.Response, max_bytes: int = DEFAULT_MAX_BYTES, start: float = None, total_timeout: float = DEFAULT_TOTAL_TIMEOUT) -> bytes:
+    """
+    스트리밍 응답(`stream=True`)의 본문을 크기/전체 시간 제한을 적용해 읽습니다.
+
+    읽은 본문은 `response.content`로도 사용할 수 있습니다.
+
+    Args:
+        start: 요청 시작 시각 (`time.perf_counter()`, None이면 지금부터)
+
+    Raises:
+        ResponseTooLargeError: 본문이 max_bytes를 초과
+        TotalTimeoutError: 요청 시작부터 total_timeout 초과
+    """
+    start = time.perf_counter() if start is None else start
+
+    content_length = response.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise ResponseTooLargeError(f"응답 크기 초과 ({content_length} > {max_bytes} bytes)", response=response)
+
+    body = bytearray()
+    for chunk in response.iter_content(CHUNK_SIZE):
+        body += chunk
+
+        if len(body) > max_bytes:
+            raise ResponseTooLargeError(f"응답 크기 초과 (> {max_bytes} bytes)", response=response)
+        if time.perf_counter() - start > total_timeout:
+            raise TotalTimeoutError(f"전체 제한 시간 초과 ({total_timeout}초)", response=response)
+
+    response._content = bytes(body)
+    return response._content
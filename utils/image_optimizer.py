@@ -3,13 +3,16 @@ import os
 import requests
 
 from PIL import Image
-from contextlib import closing
 from typing import Optional, List, Tuple
 
 from lib.logger import get_logger
+from lib.metrics import get_metrics
+from utils.http_client import HttpClient
 
 
 logger = get_logger()
+metrics = get_metrics()
+client = HttpClient(timeout=(5, 10), max_bytes=20 * 1024 * 1024, stage='image')
 
 class ImageOptimizer:
     """
@@ -62,9 +65,9 @@ class ImageOptimizer:
     def _download_image(self, image_url: str) -> Optional[bytes]:
         """이미지 URL에서 바이너리 데이터를 다운로드합니다."""
         try:
-            with closing(requests.get(image_url, stream=True, timeout=10)) as response:
-                response.raise_for_status()
-                return response.content
+            response = client.get(image_url)
+            response.raise_for_status()
+            return response.content
         except requests.RequestException as e:
             logger.error(f"이미지 다운로드 실패: {image_url}, 오류: {str(e)}")
             return None
@@ -88,14 +91,15 @@ class ImageOptimizer:
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            img.save(
-                output_path,
-                format="WEBP",
-                quality=self.quality,
-                optimize=self.optimize,
-                lossless=self.lossless,
-                method=6
-            )
+            with metrics.timer('image_encode_seconds', format='webp'):
+                img.save(
+                    output_path,
+                    format="WEBP",
+                    quality=self.quality,
+                    optimize=self.optimize,
+                    lossless=self.lossless,
+                    method=6
+                )
             return True
         except Exception as e:
             logger.error(f"이미지 저장 실패 ({output_path}): {str(e)}")
@@ -117,7 +121,10 @@ class ImageOptimizer:
         #     return None
 
         try:
-            image_byte = requests.get(image_url).content
+            response = client.get(image_url)
+            response.raise_for_status()
+            image_byte = response.content
+
             with Image.open(io.BytesIO(image_byte)) as img:
                 # 이미지 리사이징
                 processed_img = self._resize_image(img)
@@ -1,47 +1,81 @@
 import re
 
 
-def text_to_sentence(text: str) -> list[str]:
+# 문장 끝 구두점
+SENTENCE_PUNCTUATION = '.!?'
+# 전각 구두점 / 말줄임표 (korean=True)
+FULL_WIDTH_PUNCTUATION = '。．！？…'
+# 구두점 없이 문장이 끝나는 한국어 종결 어미 (korean=True, 뒤에 공백이 있는 경우만)
+# '니까'는 연결 어미('그러니까', '있으니까')와 구분되지 않아 제외 (의문문은 '?'로 분리)
+KOREAN_ENDINGS = ['습니다', '니다', '세요', '어요', '아요', '해요', '예요', '에요', '네요', '군요', '죠']
+
+def _sentence_patterns(punctuation: str, endings: list[str] = ()) -> tuple[re.Pattern, re.Pattern]:
+    """(문장 끝 패턴, 문장 패턴 확인용 단어+문장 끝 패턴)"""
+    end = '|'.join([f"[{re.escape(punctuation)}]"] + [re.escape(ending) for ending in endings])
+    # 문장 끝 후보(구두점/어미) 뒤에 공백이 있거나 텍스트 끝인 경우
+    return re.compile(rf"(?:{end})(?=\s|\Z)"), re.compile(rf"\S(?:{end})")
+
+SENTENCE_END_PATTERNS = _sentence_patterns(SENTENCE_PUNCTUATION)
+KOREAN_SENTENCE_END_PATTERNS = _sentence_patterns(SENTENCE_PUNCTUATION + FULL_WIDTH_PUNCTUATION, KOREAN_ENDINGS)
+WHITESPACE_PATTERN = re.compile(r'\s')
+
+
+def text_to_sentence(text: str, korean: bool = False) -> list[str]:
     """
     텍스트의 구두점을 기준하여 문장으로 분리합니다. 공백+단어+구두점 패턴이 있는 경우만 분리합니다.
 
+    미리 컴파일한 패턴을 한 번 순회하며 인덱스 계산으로 분리합니다.
+    `korean=True`이면 전각 구두점과 구두점 없는 한국어 종결 어미(`~니다`, `~요` 등 + 공백)에서도 분리하고,
+    한글로 끝나는 한 단어 문장(`안녕하세요.`, `안녕하세요 반갑습니다`)도 분리합니다.
+
     Example:
         `text` - "안녕하세요. 장성남입니다."\n
-        `result` - ["안녕하세요.", "장성남입니다."]
+        `result` - ["안녕하세요.", "장성남입니다."] (korean=True)
     """
-
     # 공백이 없으면 문장이 아니므로 그대로 반환
     if ' ' not in text: return [text]
-    
-    # 문장 패턴(단어+공백+단어+구두점)이 있는지 확인
-    has_sentence_pattern = bool(re.search(r'\S+\s+\S+[.!?]', text))
-    if not has_sentence_pattern: return [text]
-    
+
+    end_pattern, word_end_pattern = KOREAN_SENTENCE_END_PATTERNS if korean else SENTENCE_END_PATTERNS
+
+    # 문장 패턴(단어+공백+단어+구두점)이 있는지 확인: 첫 단어 뒤 공백 이후에 '단어+구두점'이 있는 경우
+    first_word = len(text) - len(text.lstrip())
+    first_space = WHITESPACE_PATTERN.search(text, first_word)
+    if first_space is None or not word_end_pattern.search(text, first_space.end()):
+        return [text]
+
     # 문장 분리
     sentences = []
     current_position = 0
-    
-    pattern = r'([.!?])(?:\s+|\Z)'
-    
-    for match in re.finditer(pattern, text):
-        end_pos = match.end(1)  # 구두점 위치
-        
-        # 구두점 전까지의 텍스트 + 구두점
-        sentence = text[current_position:end_pos].strip()
-        
+    # 현재 문장의 시작 위치 (앞쪽 공백 제외), 공백(' ')이 없다고 확인된 위치
+    sentence_start = scanned = first_word
+
+    for match in end_pattern.finditer(text):
+        end_pos = match.end()
+
         # '가.나.다.라'와 같은 패턴 확인 (공백 없이 구두점으로만 연결된 단어인 경우)
-        if ' ' in sentence:  # 공백이 있으면 일반 문장으로 간주
-            sentences.append(sentence)
-            current_position = end_pos
-    
+        # 한국어 모드에서는 한글 뒤의 구두점/종결 어미면 한 단어도 문장으로 분리 (숫자 목록 '1. ' 등은 제외)
+        if text.find(' ', scanned, end_pos) == -1 and not (korean and match.start() > 0 and _is_hangul(text[match.start() - 1])):
+            scanned = end_pos
+            continue
+
+        sentences.append(text[sentence_start:end_pos])
+        current_position = end_pos
+
+        while end_pos < len(text) and text[end_pos].isspace():
+            end_pos += 1
+        sentence_start = scanned = end_pos
+
     # 남은 부분 처리
     if current_position < len(text):
         remaining = text[current_position:].strip()
         if remaining:
             sentences.append(remaining)
-    
+
     return sentences
 
+def _is_hangul(char: str) -> bool:
+    return '가' <= char <= '힣'
+
 def remove_duplicate_texts(texts: list[str]) -> list[str]:
     """텍스트 리스트에서 중복된 내용을 제거합니다."""
     results = []
@@ -0,0 +1,91 @@
+import re
+import json
+
+from functools import lru_cache
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+DEFAULT_RULES_PATH = 'data/url_filter_rules.json'
+
+# 숫자로만 된 path segment
+NUMERIC_SEGMENT_PATTERN = r'(?:^|/)[0-9]+(?=/|$)'
+KOREAN_PATTERN = r'[가-힣]'
+
+
+class UrlFilter:
+    """
+    홈페이지 링크 필터
+
+    제외할 부분 문자열 패턴을 하나의 정규식으로 미리 컴파일하고, urlparse 결과를 캐시합니다.
+
+    Args:
+        excluded_url_patterns: URL(소문자)에 포함되면 제외할 문자열
+        excluded_text_patterns: a 태그 텍스트에 포함되면 제외할 문자열
+        excluded_prefixes: 제외할 URL 접두사 (javascript:, mailto: 등)
+        exclude_numeric_segments: 숫자로만 된 path segment가 있으면 제외
+        exclude_korean_path: path에 한글이 있으면 제외
+    """
+    def __init__(
+            self,
+            excluded_url_patterns: Iterable[str] = (),
+            excluded_text_patterns: Iterable[str] = (),
+            excluded_prefixes: Iterable[str] = (),
+            exclude_numeric_segments: bool = True,
+            exclude_korean_path: bool = True
+        ):
+        self.url_pattern = _compile_substrings(excluded_url_patterns)
+        self.text_pattern = _compile_substrings(excluded_text_patterns)
+        self.excluded_prefixes = tuple(excluded_prefixes)
+
+        path_patterns = []
+        if exclude_numeric_segments: path_patterns.append(NUMERIC_SEGMENT_PATTERN)
+        if exclude_korean_path: path_patterns.append(KOREAN_PATTERN)
+        self.path_pattern = re.compile('|'.join(path_patterns)) if path_patterns else None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'UrlFilter':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(**json.load(f))
+
+    def is_valid_url(self, url: str, base_domain: str) -> bool:
+        netloc, path = _split_url(url)
+
+        # 링크가 목표 도메인과 다른 경우 스킵
+        if not netloc or netloc != base_domain:
+            return False
+
+        # 링크가 자바스크립트, 메일, 앵커 링크인 경우 스킵
+        if self.excluded_prefixes and url.startswith(self.excluded_prefixes):
+            return False
+
+        # path에 숫자만 있는 segment가 있거나 한글이 포함된 경우 제외
+        if self.path_pattern and self.path_pattern.search(path):
+            return False
+
+        # 링크에 제외 패턴이 포함되어 있으면 스킵
+        if self.url_pattern and self.url_pattern.search(url.lower()):
+            return False
+
+        return True
+
+    def is_excluded_text(self, text: str) -> bool:
+        """a 태그 텍스트에 제외 텍스트가 포함되어 있는지 여부"""
+        return bool(self.text_pattern and self.text_pattern.search(text))
+
+
+@lru_cache(maxsize=None)
+def get_url_filter(path: str = DEFAULT_RULES_PATH) -> UrlFilter:
+    return UrlFilter.from_file(path)
+
+@lru_cache(maxsize=65536)
+def _split_url(url: str) -> tuple:
+    """(netloc, path) - 같은 URL이 여러 페이지에 반복해서 나오므로 캐시"""
+    parsed_url = urlparse(url)
+    return parsed_url.netloc, parsed_url.path
+
+def _compile_substrings(patterns: Iterable[str]) -> Optional[re.Pattern]:
+    """부분 문자열 목록을 하나의 정규식으로 컴파일 (긴 패턴 우선)"""
+    patterns = sorted({pattern for pattern in patterns if pattern}, key=len, reverse=True)
+    if not patterns:
+        return None
+    return re.compile('|'.join(re.escape(pattern) for pattern in patterns))